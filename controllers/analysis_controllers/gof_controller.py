@@ -2,6 +2,7 @@ import pandas as pd
 from typing import Optional, Dict, List
 from models.stat_distributions.stat_distribution import StatisticalDistribution
 from models.gofs import BaseGOFTest
+from models.column_views import drop_nan
 
 
 class GOFController:
@@ -23,7 +24,7 @@ class GOFController:
         Run specific test by name and return result.
         Args:
             test_name: Name of the test to run ('ks', 'chi2', etc.)
-            data: Sample data
+            data: Sample data (NaN-free data, e.g. DataModel.sorted_values, is not copied)
             dist: Fitted distribution
             alpha: Significance level
         Returns:
@@ -33,11 +34,11 @@ class GOFController:
             if test_name not in self._tests:
                 return None
             
-            data_clean = data.dropna()
-            if data_clean.empty:
+            data_clean = drop_nan(data)
+            if len(data_clean) == 0:
                 return None
                 
-            return self._tests[test_name].run(data_clean.values, dist, alpha=alpha)
+            return self._tests[test_name].run(data_clean, dist, alpha=alpha)
         except Exception as e:
             print(f"Some troubles in GOFController: {e}")
             return None
\ No newline at end of file
@@ -1,6 +1,8 @@
 from typing import Optional, List, Dict
 from models.homogens import BaseHomogenTest
+from models.column_views import drop_nan
 import pandas as pd
+import numpy as np
 
 
 class HomogenController:
@@ -17,27 +19,32 @@ class HomogenController:
             test_instance = homogen_test()
             self._tests[test_instance.name()] = test_instance
 
-    def run_test(self, test_name: str, samples: List[pd.Series|pd.DataFrame], alpha: float = 0.05, is_independent: bool = False) -> Optional[Dict]:
+    def run_test(self, test_name: str, samples: List[pd.Series|pd.DataFrame], alpha: float = 0.05, is_independent: bool = False,
+                 sorted_samples: Optional[List[np.ndarray]] = None) -> Optional[Dict]:
         """
         Run a homogeneity test for samples.
         Args:
             test_name: The name of the homogeneity test to run (must be registered in `_tests`).
-            samples: Ssamples to test. Can be pandas Series, pandas DataFrame, or numpy arrays.
+            samples: Ssamples to test. Can be pandas Series, pandas DataFrame, or numpy arrays
+                (NaN-free samples, e.g. over DataModel.valid_values, are not copied).
             alpha: Significance level for the statistical test.
             is_independent: True if the two samples are independent, False if paired/dependent.
+            sorted_samples: Non-NaN values of every sample in ascending order, if available.
+                Tests that do not depend on the order of values run on them and skip sorting.
         Returns:
             Dictionary with test results (statistic, p-value, decision), 
             or None if inputs are invalid or an error occurred.
         """
         if test_name not in self._tests: raise ValueError(f"Unknown test '{test_name}'. Available: {list(self._tests)}")
+        test = self._tests[test_name]
         try:
-            clean_samples = []
-            for data in samples:
-                data = data.dropna().to_numpy()
-                if len(data) == 0:
-                    return None
-                clean_samples.append(data)
+            if sorted_samples is not None and test.order_invariant:
+                clean_samples = list(sorted_samples)
+            else:
+                clean_samples = [drop_nan(data) for data in samples]
+            if any(len(data) == 0 for data in clean_samples):
+                return None
 
-            return self._tests[test_name].run(clean_samples, alpha, is_independent)
+            return test.run(clean_samples, alpha, is_independent)
         except Exception as e:
            raise ValueError(f"Error occurred while running Homogeneity test '{test_name}': {e}")
\ No newline at end of file
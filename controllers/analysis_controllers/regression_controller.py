@@ -51,6 +51,20 @@ class RegressionController:
             return np.array([])
         return self._current_model.y_pred_
 
+    def export_state(self) -> Dict[str, Any]:
+        """Returns fitted state of every fitted model and the name of the current one (see restore_state)."""
+        return {
+            'current': self._current_model.name if self._current_model else None,
+            'models': {name: model.get_state() for name, model in self._models.items() if model.coef_ is not None}
+        }
+
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        """Restores state returned by export_state (e.g. from a saved workspace), without refitting."""
+        for name, model_state in state.get('models', {}).items():
+            if name in self._models:
+                self._models[name].set_state(model_state)
+        self._current_model = self._models.get(state.get('current'))
+
     def fit(self, model_name: str, X_df: pd.DataFrame, y_series: pd.Series) -> None:
         """Train selected model on DataFrame."""
         if model_name not in self._models:
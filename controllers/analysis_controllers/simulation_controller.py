@@ -1,20 +1,24 @@
+import numpy as np
 from services import DataSaver, DataExporter, DataVersionManager, UIMessager
 from models import SimulationEngine
+from models.column_store import storage_dtype
 from models.stat_distributions.stat_distribution import StatisticalDistribution
 from utils import AppContext, EventType, EventBus
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, Callable
 
 
 class SimulationController:
     """
     Main controller class for statistical simulation operations.
     """
-    def __init__(self, context: AppContext, simulation_engine: SimulationEngine, data_saver: DataSaver, data_exporter: DataExporter):
+    def __init__(self, context: AppContext, simulation_engine: SimulationEngine, data_saver: DataSaver, data_exporter: DataExporter,
+                 storage_dtype_callback: Optional[Callable[[], str]] = None):
         """
         Args:
             simulation_engine: Class for performing statistical simulations
             data_saver: Service for saving simulated data to storage
             data_exporter: Service for exporting simulated data as csv
+            storage_dtype_callback: Function returning storage dtype name for generated datasets (float64 if None)
         """
         self.simulation_engine: SimulationEngine = simulation_engine
         self.data_saver: DataSaver = data_saver
@@ -23,6 +27,7 @@ class SimulationController:
         self.version_manager: DataVersionManager = context.version_manager
         self.event_bus: EventBus = context.event_bus
         self.messanger: UIMessager = context.messanger
+        self.storage_dtype_callback = storage_dtype_callback
     
     def run_experiment(self, dist: StatisticalDistribution, sizes: List[int], repeats: int, true_mean: float, alpha: float):
         """
@@ -59,12 +64,13 @@ class SimulationController:
         """
         try:
             simulated_data = None
+            dtype = np.float64 if self.storage_dtype_callback is None else storage_dtype(self.storage_dtype_callback())
             if sample_size and sample_size > 0:
                 simulated_data = self.simulation_engine.generate_data(
-                    distribution, n_features, params_list, coor_coeffs, sample_size
+                    distribution, n_features, params_list, coor_coeffs, sample_size, dtype
                 )
             if simulated_data is not None and len(simulated_data) > 0:
-                data_model = self.data_saver.save_data(distribution.name, simulated_data)
+                data_model = self.data_saver.save_data(distribution.name, simulated_data, dtype=dtype)
                 self.version_manager.add_dataset(data_model.label, data_model)
                 self.context.data_model = data_model
                 self.event_bus.emit_type(EventType.DATA_LOADED)
@@ -18,7 +18,8 @@ class StatisticController:
         multi_renderer: Optional[TableRenderer] = None,
         get_bins_value: Optional[Callable[[], int]] = None, 
         get_precision_value: Optional[Callable[[], int]] = None,
-        get_confidence_value: Optional[Callable[[], float]] = None
+        get_confidence_value: Optional[Callable[[], float]] = None,
+        get_quantile_error_value: Optional[Callable[[], Optional[float]]] = None
     ):
         """
         Args:
@@ -30,6 +31,8 @@ class StatisticController:
             get_bins_value: Function for getting bin count configuration
             get_precision_value: Function for getting precision configuration
             get_confidence_value: Function for getting confidence level selection
+            get_quantile_error_value: Function for getting the rank error allowed for sketched
+                quantiles of large columns (None for exact quantiles)
         """
         self.context: AppContext = context
         self.event_bus: EventBus = context.event_bus
@@ -40,6 +43,7 @@ class StatisticController:
         self.get_bins_value = get_bins_value             
         self.get_precision_value = get_precision_value        
         self.get_confidence_value = get_confidence_value
+        self.get_quantile_error_value = get_quantile_error_value
         
         self._subscribe_to_events()
 
@@ -53,6 +57,7 @@ class StatisticController:
         self.event_bus.subscribe(EventType.BINS_CHANGED, self._on_changed)
         self.event_bus.subscribe(EventType.CONFIDENCE_CHANGED, self._on_changed)
         self.event_bus.subscribe(EventType.PRECISION_CHANGED, self._on_changed)
+        self.event_bus.subscribe(EventType.QUANTILE_ERROR_CHANGED, self._on_changed)
 
     def _on_changed(self, event: Event):
         model = self.context.data_model
@@ -72,6 +77,8 @@ class StatisticController:
         
         bins = self.get_bins_value()
         model.update_bins(bins)
+        if self.get_quantile_error_value:
+            model.update_quantile_error(self.get_quantile_error_value())
         
         self._update_statistic_table(model)
         self._update_var_series_table(model)
@@ -83,12 +90,37 @@ class StatisticController:
         Args:
             model: DataModel
         """
-        stats_data = self.stat_calculator.get_characteristics(model.hist)
-        ci_data = self.stat_calculator.compute_intervals(
-            model.series,
-            confidence_level=self.get_confidence_value(),
-            precision=self.get_precision_value()
-        )
+        if model.is_out_of_core:
+            # summarized chunk by chunk: the column is never copied or sorted in RAM
+            median, mad = model.median_mad
+            stats_data = self.stat_calculator.get_accumulated_characteristics(
+                model.accumulator, median, mad, model.quantile_sketch.rank_error if model.uses_sketch else None
+            )
+            ci_data = self.stat_calculator.compute_accumulated_intervals(
+                model.accumulator,
+                confidence_level=self.get_confidence_value(),
+                precision=self.get_precision_value(),
+                median=median
+            )
+        elif model.uses_sketch:
+            # large column: median and MAD from the quantile sketch instead of a sorted copy
+            sketch = model.quantile_sketch
+            stats_data = self.stat_calculator.get_characteristics(model.hist, sketch=sketch)
+            ci_data = self.stat_calculator.compute_intervals(
+                model.series,
+                confidence_level=self.get_confidence_value(),
+                precision=self.get_precision_value(),
+                sketch=sketch
+            )
+        else:
+            sorted_data = model.sorted_values
+            stats_data = self.stat_calculator.get_characteristics(model.hist, sorted_data)
+            ci_data = self.stat_calculator.compute_intervals(
+                model.series,
+                confidence_level=self.get_confidence_value(),
+                precision=self.get_precision_value(),
+                sorted_data=sorted_data
+            )
         self.stats_renderer.render(
             stats_data.to_dict(),
             ci_data.to_dict(),
@@ -101,7 +133,10 @@ class StatisticController:
         Args:
             model: DataModel
         """
-        data = self.stat_calculator.get_var_series(model.hist)
+        if model.is_out_of_core:
+            data = self.stat_calculator.get_accumulated_var_series(model.accumulator)
+        else:
+            data = self.stat_calculator.get_var_series(model.hist)
         self.var_renderer.render(data.to_dict())
 
     def _update_multi_var_table(self, model: DataModel) -> None:
@@ -130,7 +165,8 @@ class StatisticController:
         multi_renderer: TableRenderer,
         get_bins_value: Callable[[], int], 
         get_precision_value: Callable[[], int],
-        get_confidence_value: Callable[[], float]
+        get_confidence_value: Callable[[], float],
+        get_quantile_error_value: Optional[Callable[[], Optional[float]]] = None
     ) -> None:
         self.stats_renderer = stats_renderer
         self.var_renderer = var_renderer
@@ -138,6 +174,7 @@ class StatisticController:
         self.get_bins_value = get_bins_value             
         self.get_precision_value = get_precision_value        
         self.get_confidence_value = get_confidence_value
+        self.get_quantile_error_value = get_quantile_error_value
 
     def _check_ui_connected(self) -> bool:
         return bool(
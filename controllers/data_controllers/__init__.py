@@ -1,2 +1,3 @@
 from .data_loader import DataLoadController
-from .dataset_controller import DatasetController
\ No newline at end of file
+from .dataset_controller import DatasetController
+from .workspace_controller import WorkspaceController
\ No newline at end of file
@@ -1,11 +1,16 @@
 import os
 from typing import Callable
+import numpy as np
 from utils.helpers import get_default_bin_count
 
 from utils import AppContext, EventType, EventBus
-from services import DataLoaderService, UIMessager, DataVersionManager
+from services import DataLoaderService, UIMessager, DataVersionManager, DataLoadWorker, DirectoryLoadWorker
+from services.data_services.data_loader.numeric_coercion import COERCED_ATTR
 from models.data_model import DataModel
+from models.column_store import storage_dtype
 
+# files wider than this offer a column selection before loading
+COLUMN_SELECTION_THRESHOLD = 10
 
 class DataLoadController:
     """
@@ -16,12 +21,20 @@ class DataLoadController:
         context: AppContext,
         loader_service: DataLoaderService,
         select_file_callback: Callable[[], str | None],
+        select_directory_callback: Callable[[], str | None] = None,
+        select_sheet_callback: Callable[[list[str]], str | None] = None,
+        select_columns_callback: Callable[[list[str]], list[int] | None] = None,
+        storage_dtype_callback: Callable[[], str] | None = None,
     ):
         """
         Args:
             context: Shared application state and dependencies
             loader_service: Service for selecting and loading data
             select_file_callback: Function to show file dialog and return file path
+            select_directory_callback: Function to show directory dialog and return directory path
+            select_sheet_callback: Function to let user pick one of the workbook sheets
+            select_columns_callback: Function to let user pick columns of a wide file, returns their positions
+            storage_dtype_callback: Function returning storage dtype name for new datasets (float64 if None)
         """
         self.context: AppContext = context
         self.event_bus: EventBus = context.event_bus
@@ -29,32 +42,146 @@ class DataLoadController:
         self.version_manager: DataVersionManager = context.version_manager
         self.loader_service: DataLoaderService = loader_service
         self.select_file_callback = select_file_callback
+        self.select_directory_callback = select_directory_callback
+        self.select_sheet_callback = select_sheet_callback
+        self.select_columns_callback = select_columns_callback
+        self.storage_dtype_callback = storage_dtype_callback
         self.data_model_class = DataModel
+        self._tasks = []    # (worker, thread, progress dialog) of loads in progress
 
     def load_data_file(self) -> None:
         """
         Load a data file selected by the user and initialize the DataModel.
+        Reading, parsing and building the model run on a worker thread with a cancellable
+        progress dialog; the dataset is registered on the GUI thread once it is ready.
         """
         path = self.select_file_callback()
         if not path:
             return
 
-        filename_ext = os.path.basename(path)
-        filename = self._build_filename(filename_ext)
+        load_options = {}
+        dataset_name = os.path.basename(path)
+        sheet_names = self.loader_service.get_sheet_names(path)
+        if len(sheet_names) > 1 and self.select_sheet_callback:
+            sheet = self.select_sheet_callback(sheet_names)
+            if not sheet:
+                return
+            load_options['sheet'] = sheet
+            if sheet != sheet_names[0]:
+                dataset_name = f"{dataset_name}[{sheet}]"
 
-        data = self.loader_service.load_data(path)
+        if self.select_columns_callback:
+            columns = self.loader_service.get_columns(path, **load_options)
+            if len(columns) > COLUMN_SELECTION_THRESHOLD:
+                selected = self.select_columns_callback(columns)
+                if not selected:
+                    return
+                if len(selected) < len(columns):
+                    load_options['columns'] = selected
+        dtype = self._storage_dtype()
+        load_options['dtype'] = dtype
 
-        if data is None or data.empty:
+        progress = self.messanger.show_progress(
+            "Loading", f"Loading {os.path.basename(path)}...", 100, cancellable=True
+        )
+        worker = DataLoadWorker(self.loader_service, path, lambda data: self._build_model(data, dtype), load_options)
+        worker.finished.connect(lambda model: self._on_file_loaded(path, model, dataset_name))
+        self._start_task(worker, progress)
+
+    def is_loading(self) -> bool:
+        """Return True while a file or directory is being loaded in the background."""
+        return bool(self._tasks)
+
+    def _start_task(self, worker: DataLoadWorker, progress) -> None:
+        """Run the worker on its thread, reporting to the cancellable progress dialog until the thread ends."""
+        worker.progress.connect(progress.setValue)
+        progress.canceled.connect(lambda: worker.cancel())
+        thread = worker.start()
+
+        task = (worker, thread, progress)
+        self._tasks.append(task)
+        thread.finished.connect(lambda: self._finish_task(task))
+
+    def _storage_dtype(self) -> np.dtype:
+        """Storage dtype selected for new datasets."""
+        if self.storage_dtype_callback is None:
+            return np.dtype(np.float64)
+        return storage_dtype(self.storage_dtype_callback())
+
+    def _build_model(self, data, dtype=np.float64) -> DataModel:
+        """Create the original DataModel for loaded data (runs in the worker thread)."""
+        bin_count = get_default_bin_count(data)
+        model = self.data_model_class(data, bins=bin_count, label="Original", dtype=dtype)
+        # the first column is rendered right after loading: build its histogram here, off the GUI thread
+        _ = model.accumulator if model.is_out_of_core else model.hist
+        return model
+
+    def _on_file_loaded(self, path: str, model: DataModel | None, dataset_name: str) -> None:
+        """Register loaded dataset and update context (runs in the GUI thread)."""
+        if model is None:
             self.messanger.show_info("DataLoadController ERROR", f"Failed to load file {path} or file is empty")
             return
 
-        # Create new data model and update context
-        bin_count = get_default_bin_count(data)
-        model = self.data_model_class(data, bins=bin_count, label="Original")
+        filename = self._build_filename(dataset_name)
         self.version_manager.add_dataset(filename, model)
         self.context.data_model = model
         self.event_bus.emit_type(EventType.DATA_LOADED)
 
+        coerced = model.original.attrs.get(COERCED_ATTR)
+        if coerced:
+            report = ", ".join(f"{col}: {n}" for col, n in coerced.items())
+            self.messanger.show_warning("Data Loaded", f"Non-numeric cells were replaced with NaN ({report})")
+
+    def _finish_task(self, task: tuple) -> None:
+        worker, thread, progress = task
+        progress.close()
+        if task in self._tasks:
+            self._tasks.remove(task)
+        worker.deleteLater()
+        thread.deleteLater()
+
+    def load_data_directory(self) -> None:
+        """
+        Load all supported files from a directory selected by the user.
+        Files are parsed in parallel and their models built on a worker thread with a
+        cancellable progress dialog; each one is added as a separate dataset and a single
+        DATA_LOADED event is emitted at the end.
+        """
+        if not self.select_directory_callback:
+            return
+        dir_path = self.select_directory_callback()
+        if not dir_path:
+            return
+
+        total = len(self.loader_service.get_supported_files(dir_path))
+        if total == 0:
+            self.messanger.show_info("DataLoadController ERROR", f"No supported files found in {dir_path}")
+            return
+
+        dtype = self._storage_dtype()
+        progress = self.messanger.show_progress(
+            "Loading", f"Loading {total} files from {dir_path}...", 100, cancellable=True
+        )
+        worker = DirectoryLoadWorker(self.loader_service, dir_path, lambda data: self._build_model(data, dtype))
+        worker.finished.connect(lambda result: self._on_directory_loaded(*result))
+        self._start_task(worker, progress)
+
+    def _on_directory_loaded(self, models: list[tuple[str, DataModel]], failed: list[str]) -> None:
+        """Register the datasets of a loaded directory and update context (runs in the GUI thread)."""
+        model = None
+        for path, model in models:
+            filename = self._build_filename(os.path.basename(path))
+            self.version_manager.add_dataset(filename, model)
+
+        if failed:
+            names = ", ".join(os.path.basename(path) for path in failed)
+            self.messanger.show_info("DataLoadController ERROR", f"Failed to load files or files are empty: {names}")
+        if model is None:
+            return
+
+        self.context.data_model = model
+        self.event_bus.emit_type(EventType.DATA_LOADED)
+
     def _build_filename(self, filename_ext: str) -> str:
         """
         Creates unique filename for dataset
@@ -14,7 +14,8 @@ class DatasetController:
         context: AppContext,
         version_combo_controls: Optional[ComboUICallbacks] = None,
         columns_combo_control: Optional[ComboUICallbacks] = None,
-        set_bins_value: Optional[Callable[[int], None]] = None
+        set_bins_value: Optional[Callable[[int], None]] = None,
+        history_combo_controls: Optional[ComboUICallbacks] = None
     ):
         """
         Args:
@@ -22,6 +23,7 @@ class DatasetController:
             version_combo_controls: Container of dataset combo control callbacks
             columns_combo_control: Container of column changing combo control callbacks
             set_bins_value: Function for setting bin count configuration
+            history_combo_controls: Container of data version (history node) combo control callbacks
         """
         self.context: AppContext = context
         self.event_bus: EventBus = context.event_bus
@@ -29,6 +31,8 @@ class DatasetController:
         self.version_combo_controls = version_combo_controls
         self.columns_combo_control = columns_combo_control
         self.set_bins_value = set_bins_value
+        self.history_combo_controls = history_combo_controls
+        self._history_ids: list[int] = []
         
         self._subscribe_to_events()
 
@@ -36,10 +40,14 @@ class DatasetController:
         self.event_bus.subscribe(EventType.DATA_LOADED, self._on_dataset_update)
         self.event_bus.subscribe(EventType.DATASET_CHANGED, self._on_dataset_update)
         self.event_bus.subscribe(EventType.DATA_REVERTED, self._on_dataset_update)
+        self.event_bus.subscribe(EventType.DATA_TRANSFORMED, self._on_data_transformed)
 
     def _on_dataset_update(self, event: Event):
         self.update_dataset_list()
 
+    def _on_data_transformed(self, event: Event):
+        self.update_history_list()
+
     def on_dataset_selection_changed(self, index: int) -> None:
         """
         Called when the user selects a different dataset from the dropdown.
@@ -69,6 +77,26 @@ class DatasetController:
             assert self.context.data_model.current_col_idx == col_idx
             self.event_bus.emit_type(EventType.COLUMN_CHANGED)
 
+    def on_version_selection_changed(self, index: int) -> None:
+        """
+        Called when the user selects a different version of the current dataset.
+        """
+        model = self.context.data_model
+        if not model or not 0 <= index < len(self._history_ids):
+            return
+        version_id = self._history_ids[index]
+        if version_id == model.version_id:
+            return
+
+        model.checkout(version_id)
+        dataset_name = self.version_manager.get_current_dataset_name()
+        if list(model.dataframe.columns) != self.version_manager.get_all_columns_names(dataset_name):
+            self.version_manager.sync_columns(model)
+        else:
+            self.version_manager.change_column(model.dataframe.columns[model.current_col_idx])
+        self.update_columns_list()
+        self.event_bus.emit_type(EventType.DATA_TRANSFORMED)
+
     def revert_to_original(self, whole_dataset: bool = False) -> None:
         """
         Revert current dataset to its original version.
@@ -98,8 +126,26 @@ class DatasetController:
         self.version_combo_controls.block_signals(False)
 
         self.update_columns_list()
+        self.update_history_list()
         self._set_bins_for_new_data()
 
+    def update_history_list(self) -> None:
+        """
+        Update dropdown menu with all versions of the current dataset.
+        """
+        if not self.history_combo_controls:
+            return
+
+        model = self.context.data_model
+        nodes = model.history.nodes if model else []
+        self._history_ids = [node.id for node in nodes]
+
+        self.history_combo_controls.block_signals(True)
+        self.history_combo_controls.set([f"{'  ' * node.depth}{node.id}: {node.label}" for node in nodes])
+        if model:
+            self.history_combo_controls.set_current_index(self._history_ids.index(model.version_id))
+        self.history_combo_controls.block_signals(False)
+
     def update_columns_list(self):
         """
         Update dropdown menu with all available dataset's columns.
@@ -135,7 +181,9 @@ class DatasetController:
     def connect_ui(self, 
                    version_combo_controls: ComboUICallbacks,
                    columns_combo_control: ComboUICallbacks,
-                   set_bins_value: Callable[[int], None]) -> None:
+                   set_bins_value: Callable[[int], None],
+                   history_combo_controls: Optional[ComboUICallbacks] = None) -> None:
         self.version_combo_controls = version_combo_controls
         self.columns_combo_control = columns_combo_control
-        self.set_bins_value = set_bins_value
\ No newline at end of file
+        self.set_bins_value = set_bins_value
+        self.history_combo_controls = history_combo_controls
\ No newline at end of file
@@ -0,0 +1,88 @@
+import os
+from typing import Any, Callable
+
+from utils import AppContext, EventType, EventBus
+from services import WorkspaceService, UIMessager, DataVersionManager
+
+PROGRESS_STEPS = 100
+
+
+class WorkspaceController:
+    """
+    Controller for saving the whole session to a workspace file and opening it again.
+    """
+    def __init__(
+        self,
+        context: AppContext,
+        workspace_service: WorkspaceService,
+        select_save_path_callback: Callable[[], str | None],
+        select_open_path_callback: Callable[[], str | None],
+        stateful_controllers: dict[str, Any] | None = None,
+    ):
+        """
+        Args:
+            context: Shared application state and dependencies
+            workspace_service: Service for writing and reading workspace files
+            select_save_path_callback: Function to show save dialog and return file path
+            select_open_path_callback: Function to show open dialog and return file path
+            stateful_controllers: {name: controller} whose fitted state is saved with the data,
+                controllers provide export_state() and restore_state(state)
+        """
+        self.context: AppContext = context
+        self.event_bus: EventBus = context.event_bus
+        self.messanger: UIMessager = context.messanger
+        self.version_manager: DataVersionManager = context.version_manager
+        self.workspace_service: WorkspaceService = workspace_service
+        self.select_save_path_callback = select_save_path_callback
+        self.select_open_path_callback = select_open_path_callback
+        self.stateful_controllers: dict[str, Any] = stateful_controllers or {}
+
+    def save_workspace(self) -> None:
+        """Save all datasets with their versions and the fitted model state to a file selected by the user."""
+        if not self.version_manager.datasets:
+            self.messanger.show_info("WorkspaceController", "There is no data to save")
+            return
+        path = self.select_save_path_callback()
+        if not path:
+            return
+
+        state = {name: controller.export_state() for name, controller in self.stateful_controllers.items()}
+        progress = self.messanger.show_progress("Saving", f"Saving workspace {os.path.basename(path)}...", PROGRESS_STEPS)
+        try:
+            saved = self.workspace_service.save(
+                path,
+                self.version_manager.datasets,
+                current_dataset=self.version_manager.current_dataset_name,
+                current_column=self.version_manager.current_col_name,
+                state=state,
+                progress_callback=lambda done, total: progress.setValue(PROGRESS_STEPS * done // max(total, 1))
+            )
+        finally:
+            progress.close()
+        if not saved:
+            self.messanger.show_info("WorkspaceController ERROR", f"Failed to save workspace {path}")
+
+    def open_workspace(self) -> None:
+        """Replace all loaded datasets and fitted model state with a workspace file selected by the user."""
+        path = self.select_open_path_callback()
+        if not path:
+            return
+        workspace = self.workspace_service.load(path)
+        if workspace is None or not workspace.datasets:
+            self.messanger.show_info("WorkspaceController ERROR", f"Failed to open workspace {path} or it is empty")
+            return
+
+        self.version_manager.clear()
+        for name, model in workspace.datasets.items():
+            self.version_manager.add_dataset(name, model)
+        if workspace.current_dataset in workspace.datasets:
+            self.version_manager.switch_to_dataset(workspace.current_dataset)
+        if workspace.current_column is not None:
+            self.version_manager.change_column(workspace.current_column)
+
+        for name, controller in self.stateful_controllers.items():
+            if name in workspace.state:
+                controller.restore_state(workspace.state[name])
+
+        self.context.data_model = self.version_manager.get_current_data_model()
+        self.event_bus.emit_type(EventType.DATA_LOADED)
@@ -43,7 +43,13 @@ class AnomalyController:
         Detect and remove anomalies using confidence interval bounds.
         Confidence level is selected via the gamma spinbox.
         """
-        func = lambda data: self.anomaly_proc.detect_conf_anomalies(data, gamma)
+        # detection works on the first column; its cached sort order is reused,
+        # or its quantile sketch if the column is too large to sort
+        model = self.context.data_model
+        if model.column_uses_sketch(0):
+            func = lambda data: self.anomaly_proc.detect_conf_anomalies(data, gamma, sketch=model.sketch_column(0))
+        else:
+            func = lambda data: self.anomaly_proc.detect_conf_anomalies(data, gamma, order=model.argsort_column(0))
         self._remove_anomalies(func, f"Conf. Filtered γ={gamma}")
 
     def _remove_anomalies(self, detection_func: Callable[[pd.DataFrame], pd.DataFrame], label: str) -> None:
@@ -88,8 +94,8 @@ class AnomalyController:
                 'upper': result['upper_limit']
             }
         })
-        self.messanger.show_info(
-            "Anomalies Removed",
-            f"Removed {len(anomalies)} anomalies.\n"
-            f"Lower: {result['lower_limit']:.4f}, Upper: {result['upper_limit']:.4f}"
-        )
\ No newline at end of file
+        message = (f"Removed {len(anomalies)} anomalies.\n"
+                   f"Lower: {result['lower_limit']:.4f}, Upper: {result['upper_limit']:.4f}")
+        if 'rank_error' in result:
+            message += f"\nBounds from quantile sketch, rank error ±{100 * result['rank_error']:.2f}%"
+        self.messanger.show_info("Anomalies Removed", message)
\ No newline at end of file
@@ -151,6 +151,28 @@ class ComponentController:
     def get_eigenvectors(self) -> Optional[np.ndarray]:
         return self.pca.eigenvectors
 
+    def export_state(self) -> dict:
+        """Return fitted PCA and transform state (see restore_state)."""
+        return {
+            'pca': self.pca.get_state(),
+            'orig_full_df': self._orig_full_df_,
+            'orig_X_df': self.orig_X_df_,
+            'bystander_df': self._bystander_df_,
+            'pca_labels': self.pca_labels,
+            'state': self._state.name,
+            'fitted_ds_name': self._fitted_ds_name
+        }
+
+    def restore_state(self, state: dict) -> None:
+        """Restore state returned by export_state (e.g. from a saved workspace), without refitting."""
+        self.pca.set_state(state.get('pca', {}))
+        self._orig_full_df_ = state.get('orig_full_df')
+        self.orig_X_df_ = state.get('orig_X_df')
+        self._bystander_df_ = state.get('bystander_df')
+        self.pca_labels = state.get('pca_labels')
+        self._state = PCAState[state.get('state', PCAState.IDLE.name)]
+        self._fitted_ds_name = state.get('fitted_ds_name')
+
     def _emit(self) -> None:
         self.event_bus.emit_type(EventType.DATASET_CHANGED)
     
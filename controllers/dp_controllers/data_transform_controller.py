@@ -1,7 +1,6 @@
 from utils import AppContext, EventBus, EventType
 from services import DataVersionManager
 from models import TransformationProcessor
-import pandas as pd
 
 
 class DataTransformController:
@@ -82,25 +81,23 @@ class DataTransformController:
 
     def log_transform_data(self, kind: str = "ln") -> None:
         if self.context.data_model:
-            transformed = self.transform_proc.log_transform(self.context.data_model.series, kind=kind)
-            self._apply_series(transformed, f"Log Transform ({kind})")
+            self._apply_transform('log', {'kind': kind}, f"Log Transform ({kind})")
 
     def inverse_log_transform_data(self, kind: str = "ln") -> None:
         if self.context.data_model:
-            transformed = self.transform_proc.inverse_log_transform(self.context.data_model.series, kind=kind)
-            self._apply_series(transformed, f"Inv. Log ({kind})")
+            self._apply_transform('inverse_log', {'kind': kind}, f"Inv. Log ({kind})")
 
     def shift_data(self, shift_value: float) -> None:
         if self.context.data_model:
-            transformed = self.transform_proc.shift(self.context.data_model.series, shift_value)
-            self._apply_series(transformed, f"Shifted by {shift_value}")
+            self._apply_transform('shift', {'shift_value': shift_value}, f"Shifted by {shift_value}")
 
     # ── internal ──────────────────────────────────────────────────
-    def _apply_series(self, new_series: pd.Series, label: str) -> None:
+    def _apply_transform(self, transform: str, params: dict, label: str) -> None:
+        """Apply a named column transform; the model keeps its name and params in version history."""
         model = self.context.data_model
-        model.add_version_from_series(new_series, label)
+        model.apply_column_transform(transform, params, label)
         self.version_manager.update_current_dataset(model)
-        self._emit(label, model)
+        self._emit()
 
     def _emit(self) -> None:
         self.event_bus.emit_type(EventType.DATA_TRANSFORMED)
\ No newline at end of file
@@ -14,15 +14,15 @@ from controllers import (
     AnomalyController, MissingDataController, DataTransformController,
     ParameterEstimation, SimulationController, StatisticController, GOFController, HomogenController, 
     CorrelationController, RegressionController, ComponentController,
-    DataLoadController, DatasetController, DistributionRegister
+    DataLoadController, DatasetController, WorkspaceController, DistributionRegister
 )
 
 # Services
 from services import (
     ConfidenceAssesment, TestPerformer, SimpleLinearRegression,
     UIMessager, StatsRenderer, VarSerRenderer, MultiVarRenderer,
-    DataVersionManager, DataLoaderService,
-    DataSaver, DataExporter
+    DataVersionManager, DataLoaderService, DataCache,
+    DataSaver, DataExporter, WorkspaceService
 )
 
 # Views
@@ -31,7 +31,7 @@ from views import (
     # tabs
     DataProcessingTab, GOFTestTab, ParamEstimationTab, SimulationTab, StatisticTab, HomogenTab, CorrelationTab, RegressionTab,
     # widgets
-    WindowWidgets,
+    WindowWidgets, ColumnSelectDialog,
     AnomalyWidget, MissingWidget, TransformDataWidget, PCAResultWidget,
     KolmogorovSmirnovPanel, PearsonChi2Panel, Pearson2DNormalPanel, RegrSummaryWidget, RegrPredictionWidget,
     GenerationWidget, ExperimentWidget, CorrelationTestWidget, PartialCorrWidget, MultiCorrWidget, ComponentAnalysisTab,
@@ -66,14 +66,19 @@ class ControllersFactory:
         )
         controllers['data_loader'] = DataLoadController(
             context=self.context,
-            loader_service=DataLoaderService(),
-            select_file_callback=lambda: DataLoaderService.select_file(self.window)
+            loader_service=DataLoaderService(cache=DataCache()),
+            select_file_callback=lambda: DataLoaderService.select_file(self.window),
+            select_directory_callback=lambda: DataLoaderService.select_directory(self.window),
+            select_sheet_callback=lambda sheet_names: DataLoaderService.select_sheet(sheet_names, self.window),
+            select_columns_callback=lambda columns: ColumnSelectDialog.select(columns, self.window),
+            storage_dtype_callback=lambda: self.window.widgets.storage_combo.currentText()
         )
         controllers['simulation'] = SimulationController(
             context=self.context,
             simulation_engine=SimulationEngine(TestPerformer()),
             data_saver=DataSaver(),
-            data_exporter=DataExporter
+            data_exporter=DataExporter,
+            storage_dtype_callback=lambda: self.window.widgets.storage_combo.currentText()
         )
         controllers['estimation'] = ParameterEstimation(estimation_methods)
         controllers['gof'] = GOFController(gof_tests)
@@ -102,6 +107,16 @@ class ControllersFactory:
             context=self.context, 
             pca=PCA()
         ) 
+        controllers['workspace'] = WorkspaceController(
+            context=self.context,
+            workspace_service=WorkspaceService(),
+            select_save_path_callback=lambda: WorkspaceService.select_save_path(self.window),
+            select_open_path_callback=lambda: WorkspaceService.select_open_path(self.window),
+            stateful_controllers={
+                'component': controllers['component'],
+                'regression': controllers['regression']
+            }
+        )
         return controllers
 
 class UIFactory:
@@ -218,7 +233,13 @@ class ConnectFactory:
 
     def connect_ui(self, controllers):
         self.window.widgets.load_button.clicked.connect(lambda: controllers['data_loader'].load_data_file())
+        self.window.widgets.load_dir_button.clicked.connect(lambda: controllers['data_loader'].load_data_directory())
+        self.window.widgets.save_workspace_button.clicked.connect(lambda: controllers['workspace'].save_workspace())
+        self.window.widgets.open_workspace_button.clicked.connect(lambda: controllers['workspace'].open_workspace())
         self.window.widgets.precision_spinbox.valueChanged.connect(lambda: self.event_bus.emit_type(EventType.PRECISION_CHANGED))
+        self.window.widgets.quantile_combo.currentIndexChanged.connect(
+            lambda: self.event_bus.emit_type(EventType.QUANTILE_ERROR_CHANGED)
+        )
 
         controllers['statistic'].connect_ui(
             stats_renderer=self.window.stat_tab.stat_renderer,
@@ -226,7 +247,8 @@ class ConnectFactory:
             multi_renderer=self.window.stat_tab.multi_renderer,
             get_bins_value=self.window.graph_panel.bins_spinbox.value,     
             get_confidence_value=self.window.graph_panel.confidence_spinbox.value,         
-            get_precision_value=self.window.widgets.precision_spinbox.value
+            get_precision_value=self.window.widgets.precision_spinbox.value,
+            get_quantile_error_value=self.window.widgets.quantile_combo.currentData
         )
 
         data_tab = self.window.data_tab
@@ -234,6 +256,7 @@ class ConnectFactory:
         controllers['data_version'].connect_ui(
             version_combo_controls=build_combo_callbacks(data_tab.data_version_combo),
             columns_combo_control=build_combo_callbacks(data_tab.dataframe_cols_combo),
+            history_combo_controls=build_combo_callbacks(data_tab.history_combo),
             set_bins_value=lambda bins: self.window.graph_panel.bins_spinbox.setValue(bins)
         )
 
@@ -0,0 +1,275 @@
+import hashlib
+import itertools
+import mmap
+import threading
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+
+FINGERPRINT_CACHE_SIZE = 4096
+STORAGE_DTYPES = (np.dtype(np.float64), np.dtype(np.float32))
+
+_column_versions = itertools.count(1)
+_fingerprints: OrderedDict[int, str] = OrderedDict()
+_fingerprints_lock = threading.Lock()
+
+
+def new_column_version() -> int:
+    """Return a process-wide unique version number for newly written column data."""
+    return next(_column_versions)
+
+
+def content_fingerprint(buf: np.ndarray) -> str:
+    """
+    Fast hash of the column content: one pass over the raw bytes together with the
+    dtype and length, so equal fingerprints mean equal columns.
+    """
+    digest = hashlib.sha1(f"{buf.dtype.str}|{len(buf)}|".encode(), usedforsecurity=False)
+    if buf.dtype.hasobject:
+        digest.update(pd.util.hash_array(buf).tobytes())
+    else:
+        digest.update(memoryview(np.ascontiguousarray(buf)).cast('B'))
+    return digest.hexdigest()
+
+
+def storage_dtype(dtype) -> np.dtype:
+    """
+    Normalize a column storage dtype (float64 or float32, as a dtype, type or name).
+    Raises:
+        ValueError: if dtype is not a supported storage dtype
+    """
+    dtype = np.dtype(dtype)
+    if dtype not in STORAGE_DTYPES:
+        raise ValueError(f"Unsupported storage dtype {dtype}, expected one of {[str(d) for d in STORAGE_DTYPES]}")
+    return dtype
+
+
+def column_buffer(values, dtype=np.float64) -> np.ndarray:
+    """
+    Return column data as a contiguous array of the storage dtype (float64 by default).
+    Numeric data that already is one (e.g. a memory-mapped column) is returned as is,
+    other numeric data is converted once; non-numeric data is left unchanged.
+    """
+    values = np.asanyarray(values)
+    if values.dtype.kind in 'biuf' and (values.dtype != dtype or not values.flags.c_contiguous):
+        return np.ascontiguousarray(values, dtype=dtype)
+    return values
+
+
+def known_fingerprint(version: int) -> str | None:
+    """Return the fingerprint remembered for a column version, or None if it was not hashed yet."""
+    with _fingerprints_lock:
+        fingerprint = _fingerprints.get(version)
+        if fingerprint is not None:
+            _fingerprints.move_to_end(version)
+        return fingerprint
+
+
+def remember_fingerprint(version: int, fingerprint: str) -> None:
+    """Remember the fingerprint of a column version (e.g. one restored from a saved workspace)."""
+    with _fingerprints_lock:
+        _fingerprints[version] = fingerprint
+        _fingerprints.move_to_end(version)
+        while len(_fingerprints) > FINGERPRINT_CACHE_SIZE:
+            _fingerprints.popitem(last=False)
+
+
+class ColumnStore:
+    """
+    Immutable set of named column buffers behind a DataModel version.
+    Versions share the buffers of unmodified columns: deriving a new store only
+    stores the columns that were actually written, so memory grows with what changed
+    and not with the number of versions. Buffers are never written in place.
+    Numeric columns are stored as contiguous arrays of the store dtype (float64, or
+    float32 to halve memory, see column_buffer), so views of them can be handed to
+    analysis code without copying.
+    All stores derived from a store keep its dtype.
+    Every column carries a version number that changes only when its data is written,
+    and a content fingerprint computed on first use and remembered per version, so
+    comparing columns costs O(1) and equal content can key anything derived from it.
+    """
+    def __init__(self, names: list, buffers: list[np.ndarray], attrs: dict | None = None,
+                 versions: list[int] | None = None, dtype=np.float64):
+        """
+        Args:
+            names: column names
+            buffers: 1D arrays of equal length, one per column
+            attrs: DataFrame.attrs to attach to materialized frames
+            versions: version numbers of the columns, new ones are assigned if None
+            dtype: storage dtype of numeric columns (float64 or float32)
+        """
+        if len(names) != len(buffers):
+            raise ValueError("Number of column names and buffers differs")
+        if len({len(buf) for buf in buffers}) > 1:
+            raise ValueError("Columns must have the same length")
+        self._names = list(names)
+        self._dtype = storage_dtype(dtype)
+        self._buffers = [column_buffer(buf, self._dtype) for buf in buffers]
+        self._versions = list(versions) if versions is not None else [new_column_version() for _ in buffers]
+        self.attrs = dict(attrs or {})
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame, dtype=np.float64) -> 'ColumnStore':
+        """Wrap columns of a DataFrame without copying them (columns of another dtype are converted)."""
+        return cls(list(df.columns), [df.iloc[:, i].to_numpy() for i in range(df.shape[1])], df.attrs, dtype=dtype)
+
+    @property
+    def names(self) -> list:
+        return list(self._names)
+
+    @property
+    def dtype(self) -> np.dtype:
+        """Storage dtype of numeric columns."""
+        return self._dtype
+
+    @property
+    def n_rows(self) -> int:
+        return len(self._buffers[0]) if self._buffers else 0
+
+    @property
+    def n_cols(self) -> int:
+        return len(self._buffers)
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the column data, counting every buffer once."""
+        return unique_nbytes(self)
+
+    def column(self, idx: int) -> np.ndarray:
+        """Return buffer of the column at position idx (must not be modified)."""
+        return self._buffers[idx]
+
+    def column_version(self, idx: int) -> int:
+        """Return version number of the column at position idx."""
+        return self._versions[idx]
+
+    def fingerprint(self, idx: int) -> str:
+        """Return content hash of the column at position idx (hashed once per column version)."""
+        version = self._versions[idx]
+        fingerprint = known_fingerprint(version)
+        if fingerprint is None:
+            fingerprint = content_fingerprint(self._buffers[idx])
+            remember_fingerprint(version, fingerprint)
+        return fingerprint
+
+    def with_column(self, idx: int, values, version: int | None = None) -> 'ColumnStore':
+        """
+        Return a store where only the column at position idx is replaced.
+        Args:
+            idx: column position
+            values: new column data
+            version: version number of values if they were stored before, a new one if None
+        """
+        values = column_buffer(values, self._dtype)
+        if len(values) != self.n_rows:
+            raise ValueError(f"Length of values ({len(values)}) does not match length of data ({self.n_rows})")
+        buffers, versions = list(self._buffers), list(self._versions)
+        buffers[idx] = values
+        versions[idx] = new_column_version() if version is None else version
+        return ColumnStore(self._names, buffers, self.attrs, versions, self._dtype)
+
+    def map_buffers(self, func) -> 'ColumnStore':
+        """Return a store with func(buffer) for every column; func must keep the values unchanged."""
+        return ColumnStore(self._names, [func(buf) for buf in self._buffers], self.attrs, self._versions, self._dtype)
+
+    def derive(self, df: pd.DataFrame) -> 'ColumnStore':
+        """
+        Return a store with the contents of df that reuses buffers of this store for
+        columns whose data did not change (same name, same values), so that only the
+        columns a transformation wrote get new storage.
+        """
+        positions = {}
+        for i, name in enumerate(self._names):
+            positions.setdefault(name, i)
+
+        buffers, versions = [], []
+        for i, name in enumerate(df.columns):
+            values = column_buffer(df.iloc[:, i].to_numpy(), self._dtype)
+            j = positions.get(name)
+            if j is not None and self.same_values(self._buffers[j], values):
+                buffers.append(self._buffers[j])
+                versions.append(self._versions[j])
+            else:
+                buffers.append(values)
+                versions.append(new_column_version())
+        return ColumnStore(list(df.columns), buffers, self.attrs, versions, self._dtype)
+
+    def shares_column(self, other: 'ColumnStore', idx: int) -> bool:
+        """True if the column at idx is the same buffer in both stores (O(1))."""
+        return (idx < self.n_cols and idx < other.n_cols
+                and _same_buffer(self._buffers[idx], other._buffers[idx]))
+
+    def column_equals(self, other: 'ColumnStore', idx: int) -> bool:
+        """
+        True if the column at idx has the same values in both stores.
+        Decided by version numbers and fingerprints, so repeated checks are O(1).
+        """
+        if idx >= self.n_cols or idx >= other.n_cols:
+            return False
+        if self._versions[idx] == other._versions[idx] or _same_buffer(self._buffers[idx], other._buffers[idx]):
+            return True
+        a, b = self._buffers[idx], other._buffers[idx]
+        if a.shape != b.shape or a.dtype != b.dtype:
+            return False
+        return self.fingerprint(idx) == other.fingerprint(idx)
+
+    def equals(self, other: 'ColumnStore') -> bool:
+        """True if both stores have the same columns with the same values."""
+        if self is other:
+            return True
+        return (self._names == other._names and self.n_rows == other.n_rows
+                and all(self.column_equals(other, i) for i in range(self.n_cols)))
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Build a DataFrame over the buffers without copying them."""
+        df = pd.DataFrame(dict(enumerate(self._buffers)), copy=False)
+        df.columns = pd.Index(self._names)
+        df.attrs.update(self.attrs)
+        return df
+
+    @staticmethod
+    def same_values(a: np.ndarray, b: np.ndarray) -> bool:
+        """True if arrays hold the same values: buffer identity is checked first, elements only if needed."""
+        if _same_buffer(a, b):
+            return True
+        if a.shape != b.shape or a.dtype != b.dtype:
+            return False
+        return bool(np.array_equal(a, b, equal_nan=a.dtype.kind in 'fc'))
+
+
+def buffer_key(buf: np.ndarray) -> tuple:
+    """Identity of the memory an array views (address, size and layout)."""
+    return (buf.__array_interface__['data'][0], buf.nbytes, buf.strides)
+
+
+def is_memory_mapped(buf: np.ndarray) -> bool:
+    """True if the array views a memory map, also through views taken of it (e.g. by pandas)."""
+    while isinstance(buf, np.ndarray):
+        if isinstance(buf, np.memmap):
+            return True
+        buf = buf.base
+    return isinstance(buf, mmap.mmap)
+
+
+def _same_buffer(a: np.ndarray, b: np.ndarray) -> bool:
+    """True if both arrays view exactly the same memory with the same layout."""
+    return a is b or (
+        a.shape == b.shape and a.dtype == b.dtype and a.strides == b.strides
+        and a.__array_interface__['data'][0] == b.__array_interface__['data'][0]
+    )
+
+
+def unique_nbytes(*stores: ColumnStore) -> int:
+    """
+    Total size of column data of the given stores, counting buffers shared
+    between columns, versions or datasets only once.
+    """
+    seen = set()
+    total = 0
+    for store in stores:
+        for buf in store._buffers:
+            key = buffer_key(buf)
+            if key not in seen:
+                seen.add(key)
+                total += buf.nbytes
+    return total
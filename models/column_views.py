@@ -0,0 +1,16 @@
+import numpy as np
+import pandas as pd
+
+
+def drop_nan(data: pd.Series | pd.DataFrame | np.ndarray) -> np.ndarray:
+    """
+    Values of a Series, DataFrame or array without NaN, as a NumPy array.
+    Data without NaN (e.g. DataModel.valid_values or sorted_values) is returned as a view
+    of its buffer; only data with NaN is copied. Rows with any NaN are dropped from 2D data.
+    """
+    values = data.to_numpy() if isinstance(data, (pd.Series, pd.DataFrame)) else np.asarray(data)
+    # min propagates NaN: one pass without a temporary mask
+    if values.size == 0 or values.dtype.kind not in 'fc' or not np.isnan(values.min()):
+        return values
+    mask = np.isnan(values)
+    return values[~mask] if values.ndim == 1 else values[~mask.any(axis=1)]
@@ -138,6 +138,27 @@ class PCA:
             explained_variance = np.sum(self.eigenvalues_)
             return explained_variance, evr
     
+    def get_state(self) -> dict:
+        """Return fitted state (eigendecomposition, selected components, mean) for saving."""
+        return {
+            'eigenvalues': self.eigenvalues_,
+            'eigenvectors': self.eigenvectors_,
+            'components': self.components_,
+            'evr': self.evr_,
+            'mean': self.mean_,
+            'fitted': self.fitted
+        }
+
+    def set_state(self, state: dict) -> None:
+        """Restore fitted state returned by get_state, without refitting."""
+        self.clear_state()
+        self.eigenvalues_ = state.get('eigenvalues')
+        self.eigenvectors_ = state.get('eigenvectors')
+        self.components_ = state.get('components')
+        self.evr_ = state.get('evr')
+        self.mean_ = state.get('mean')
+        self.fitted = bool(state.get('fitted', False))
+
     def clear_state(self) -> None:
         """Clear PCA model state."""
         self.eigenvalues_ = None
@@ -1,6 +1,7 @@
 from .corr_coeff import ICorrelationCoefficient
 from models.correlation_coeffs._significance_test_result import SignificanceTestResult
 from scipy import stats
+from models import critical_values
 import numpy as np
 from typing import Tuple
 
@@ -30,7 +31,7 @@ class KendallCorrelation(ICorrelationCoefficient):
         
         p_value = self.p_value
         is_significant = p_value < alpha
-        z_crit = stats.norm.ppf(1 - alpha / 2)
+        z_crit = critical_values.ppf('norm', 1 - alpha / 2)
 
         return SignificanceTestResult(
             r=self.r,
@@ -60,7 +61,7 @@ class KendallCorrelation(ICorrelationCoefficient):
         if self.r is None or self.n is None: 
             raise ValueError("Call fit() first")
         _, se = self._get_asymptotic_stats()
-        z_crit = stats.norm.ppf(alpha / 2)
+        z_crit = critical_values.ppf('norm', alpha / 2)
         return (self.r - z_crit * se, self.r + z_crit * se)
     
     def name(self) -> str:
@@ -2,6 +2,7 @@ from models.correlation_coeffs._significance_test_result import SignificanceTest
 from typing import List
 from .corr_coeff import ICorrelationCoefficient
 from scipy import stats
+from models import critical_values
 import numpy as np
 
 
@@ -36,8 +37,8 @@ class MultipleCorrelation(ICorrelationCoefficient):
 
         r2 = self.r ** 2
         f_stat = (r2 / df1) / ((1 - r2) / df2)
-        p_value = stats.f.sf(f_stat, df1, df2)
-        f_crit = stats.f.ppf(1 - alpha, df1, df2)
+        p_value = critical_values.sf('f', f_stat, df1, df2)
+        f_crit = critical_values.ppf('f', 1 - alpha, df1, df2)
         is_significant = f_stat > f_crit
 
         return SignificanceTestResult(
@@ -60,7 +61,7 @@ class MultipleCorrelation(ICorrelationCoefficient):
         # fisher z
         z = np.arctanh(self.r)
         se = 1 / np.sqrt(self.n - self.k - 2)
-        z_crit = stats.norm.ppf(1 - alpha / 2)
+        z_crit = critical_values.ppf('norm', 1 - alpha / 2)
         low = np.tanh(z - z_crit * se)
         high = np.tanh(z + z_crit * se)
         return (float(low), float(high))
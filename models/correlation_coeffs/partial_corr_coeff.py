@@ -2,6 +2,7 @@ from models.correlation_coeffs._significance_test_result import SignificanceTest
 from typing import List
 from .corr_coeff import ICorrelationCoefficient
 from scipy import stats
+from models import critical_values
 import numpy as np
 
 
@@ -38,8 +39,8 @@ class PartialCorrelation(ICorrelationCoefficient):
         df = self.n - k - 2
 
         t_stat = self.r * np.sqrt(df) / np.sqrt(1 - self.r ** 2)
-        p_value = 2 * stats.t.sf(np.abs(t_stat), df=df)
-        t_crit = stats.t.ppf(1 - alpha / 2, df=df)
+        p_value = 2 * critical_values.sf('t', np.abs(t_stat), df)
+        t_crit = critical_values.ppf('t', 1 - alpha / 2, df)
         is_significant = abs(t_stat) > t_crit
 
         return SignificanceTestResult(
@@ -63,7 +64,7 @@ class PartialCorrelation(ICorrelationCoefficient):
         # fisher z-transform
         z = np.arctanh(self.r)
         se = 1 / np.sqrt(df - 1)
-        z_crit = stats.norm.ppf(1 - alpha / 2)
+        z_crit = critical_values.ppf('norm', 1 - alpha / 2)
         low = np.tanh(z - z_crit * se)
         high = np.tanh(z + z_crit * se)
         return (float(low), float(high))
@@ -1,6 +1,7 @@
 from models.correlation_coeffs._significance_test_result import SignificanceTestResult
 from .corr_coeff import ICorrelationCoefficient
 from scipy import stats
+from models import critical_values
 import numpy as np
 
 class PearsonCorrelation(ICorrelationCoefficient):
@@ -20,8 +21,8 @@ class PearsonCorrelation(ICorrelationCoefficient):
         df = self.n - 2
         t_stat = self.r * np.sqrt(df) / np.sqrt(1 - self.r**2 + self.EPSILON)
         
-        p_value = 2 * (1 - stats.t.cdf(abs(t_stat), df))
-        t_crit = stats.t.ppf(1 - alpha / 2, df)
+        p_value = 2 * critical_values.sf('t', abs(t_stat), df)
+        t_crit = critical_values.ppf('t', 1 - alpha / 2, df)
         is_significant = p_value < alpha
         
         return SignificanceTestResult(
@@ -44,7 +45,7 @@ class PearsonCorrelation(ICorrelationCoefficient):
         if self.r is None: raise ValueError("Call fit() first")
         z = 0.5 * np.log((1 + self.r) / (1 - self.r + self.EPSILON))
         se = 1 / np.sqrt(self.n - 3)
-        z_crit = stats.norm.ppf(alpha / 2)
+        z_crit = critical_values.ppf('norm', alpha / 2)
         low, high = z - z_crit * se, z + z_crit * se
         low, high = np.tanh([low, high])
         return (float(low), float(high))
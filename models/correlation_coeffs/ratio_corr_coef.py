@@ -1,7 +1,7 @@
 from .corr_coeff import ICorrelationCoefficient
 from models.correlation_coeffs._significance_test_result import SignificanceTestResult
 import numpy as np
-from scipy import stats
+from models import critical_values
 from typing import Tuple
 
 class CorrelationRatio(ICorrelationCoefficient):
@@ -45,9 +45,9 @@ class CorrelationRatio(ICorrelationCoefficient):
             p_value = 0.0
         else:
             f_stat = (eta_squared / df1) / ((1 - eta_squared) / df2)
-            p_value = 1 - stats.f.cdf(f_stat, df1, df2)
+            p_value = critical_values.sf('f', f_stat, df1, df2)
         
-        f_crit = stats.f.ppf(1 - alpha, df1, df2)
+        f_crit = critical_values.ppf('f', 1 - alpha, df1, df2)
         is_significant = p_value < alpha
 
         return SignificanceTestResult(
@@ -1,6 +1,7 @@
 from models.correlation_coeffs._significance_test_result import SignificanceTestResult
 from .corr_coeff import ICorrelationCoefficient
 from scipy import stats
+from models import critical_values
 import numpy as np
 from typing import Tuple
 
@@ -31,7 +32,7 @@ class SpearmanCorrelation(ICorrelationCoefficient):
         
         p_value = self.p_value
         is_significant = p_value < alpha
-        t_crit = stats.t.ppf(1 - alpha / 2, df)
+        t_crit = critical_values.ppf('t', 1 - alpha / 2, df)
 
         return SignificanceTestResult(
             r=self.r,
@@ -0,0 +1,119 @@
+from functools import lru_cache
+import numpy as np
+from scipy import stats
+
+# distribution families by name; parameters after the probability are their degrees of freedom
+FAMILIES = {
+    'norm': stats.norm,
+    't': stats.t,
+    'chi2': stats.chi2,
+    'f': stats.f,
+    'kstwobign': stats.kstwobign,
+}
+# significance and confidence levels offered by the UI: their quantiles are tabulated up front
+COMMON_ALPHAS = (0.1, 0.05, 0.025, 0.01, 0.005, 0.001)
+COMMON_CONFIDENCES = (0.9, 0.95, 0.99)
+# degrees of freedom tabulated for the one-parameter families
+TABLE_MAX_DF = 200
+# quantiles and tail probabilities remembered beyond the tables
+CACHE_SIZE = 4096
+
+
+def _common_probabilities() -> np.ndarray:
+    """Probabilities of the critical values used by the tests and intervals, computed as they are there."""
+    probabilities = set()
+    for alpha in COMMON_ALPHAS:
+        probabilities.update((1 - alpha, 1 - alpha / 2, alpha / 2, alpha))
+    for confidence in COMMON_CONFIDENCES:
+        probabilities.update(((1 + confidence) / 2, (1 - confidence) / 2))
+    return np.array(sorted(probabilities))
+
+
+@lru_cache(maxsize=1)
+def _tables() -> dict[tuple, float]:
+    """
+    Quantiles of norm, t and chi2 for all common probabilities (and dfs 1..TABLE_MAX_DF),
+    one vectorized call each, built on first use.
+    """
+    q = _common_probabilities()
+    dfs = np.arange(1, TABLE_MAX_DF + 1)
+    tables = {('norm', p): float(value) for p, value in zip(q, stats.norm.ppf(q))}
+    for family in ('t', 'chi2'):
+        values = FAMILIES[family].ppf(q[:, None], dfs[None, :])
+        tables.update({
+            (family, p, int(df)): float(values[i, j])
+            for i, p in enumerate(q) for j, df in enumerate(dfs)
+        })
+    return tables
+
+
+def ppf(family: str, q: float, *df) -> float:
+    """
+    Quantile (critical value) of a distribution family, memoized by (family, q, df):
+    common levels come from the precomputed tables, others are computed once.
+    Args:
+        family: name of the family in FAMILIES
+        q: probability
+        df: degrees of freedom of the family (none for norm and kstwobign)
+    Return:
+        same value as scipy.stats.<family>.ppf(q, *df)
+    """
+    key = (family, float(q), *(_df_key(d) for d in df))
+    value = _tables().get(key)
+    return value if value is not None else _cached_ppf(*key)
+
+
+def sf(family: str, x: float, *df) -> float:
+    """
+    Survival function (upper tail probability) of a distribution family, memoized by
+    (family, x, df), so refreshing a test on unchanged data does not recompute it.
+    Args:
+        family: name of the family in FAMILIES
+        x: value of the statistic
+        df: degrees of freedom of the family (none for norm and kstwobign)
+    Return:
+        same value as scipy.stats.<family>.sf(x, *df)
+    """
+    return _cached_sf(family, float(x), *(_df_key(d) for d in df))
+
+
+def cdf(family: str, x: float, *df) -> float:
+    """
+    Distribution function (lower tail probability) of a distribution family, memoized
+    by (family, x, df), for the lower tail of two-sided tests.
+    Args:
+        family: name of the family in FAMILIES
+        x: value of the statistic
+        df: degrees of freedom of the family (none for norm and kstwobign)
+    Return:
+        same value as scipy.stats.<family>.cdf(x, *df)
+    """
+    return _cached_cdf(family, float(x), *(_df_key(d) for d in df))
+
+
+def cache_clear() -> None:
+    """Forget the quantiles and tail probabilities computed beyond the tables."""
+    _cached_ppf.cache_clear()
+    _cached_sf.cache_clear()
+    _cached_cdf.cache_clear()
+
+
+def _df_key(df) -> int | float:
+    """Degrees of freedom as a hashable number: integral values as int, so 10 and 10.0 share an entry."""
+    df = float(df)
+    return int(df) if df.is_integer() else df
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _cached_ppf(family: str, q: float, *df) -> float:
+    return float(FAMILIES[family].ppf(q, *df))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _cached_sf(family: str, x: float, *df) -> float:
+    return float(FAMILIES[family].sf(x, *df))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _cached_cdf(family: str, x: float, *df) -> float:
+    return float(FAMILIES[family].cdf(x, *df))
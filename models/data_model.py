@@ -1,5 +1,16 @@
 import pandas as pd
 import numpy as np
+from models.column_store import ColumnStore, unique_nbytes, is_memory_mapped
+from models.version_history import VersionHistory, RowDropDelta, TransformDelta
+from models.stats_cache import StatsCache
+from models.order_statistics import average_ranks, median_mad
+from models.stats_accumulator import StatsAccumulator, array_chunks, streamed_median_mad
+from models.quantile_sketch import QuantileSketch, DEFAULT_RANK_ERROR, k_for_rank_error
+
+# memory-mapped columns from this size on are summarized chunk by chunk instead of in RAM
+OUT_OF_CORE_BYTES = 512 * 1024 * 1024
+# columns from this many values on answer median, MAD and quantile bounds from a sketch instead of sorting
+SKETCH_MIN_VALUES = 1 << 26
 
 
 class Hist:
@@ -33,33 +44,64 @@ class DataModel:
     """
     Model that holds the current data df along with histogram, and statistics cache.
     Supports transformations with revert to original.
+    Data lives in copy-on-write column stores: the current version shares buffers of
+    all columns a transformation did not write with the original version.
+    Columns are contiguous arrays of the dataset storage dtype (float64, or float32 for
+    half the memory): values, nan_mask and valid_values (and their per-column variants)
+    are zero-copy or cached views of them for analysis code.
+    Derived values (histogram, stats, sorted view, argsort, ranks) are computed on first
+    access and cached in stats_cache (shared by all models) by column fingerprint and bins,
+    so transformations cost nothing until something is rendered, and switching columns
+    or versions reuses earlier results.
     """
+    stats_cache: StatsCache = StatsCache()
+
     def __init__(self, df: pd.DataFrame, bins: int = 10, label: str = "Original",
-                 history=None, current_col_idx: int = 0):
+                 history=None, current_col_idx: int = 0, dtype=np.float64):
         """
         Initialize DataModel with original data and histogram/statistics cache.
         Args:
             df: input pandas df
             bins: number of histogram bins
             label: description label for current version
-            history: ignored, kept for backwards compatibility
+            history: VersionHistory to continue (see from_history), df must hold its original data;
+                a new history is started if None
             current_col_idx: index of currently selected column
+            dtype: storage dtype of the columns (float64 or float32), ignored if history is given
         Raises:
-             ValueError: if input df is empty
+             ValueError: if input df is empty or dtype is not a storage dtype
         """
         if df.empty or len(df) == 0:
             raise ValueError("No valid data points in df")
 
-        self._original_df: pd.DataFrame = df.reset_index(drop=True).copy()
-        self._df: pd.DataFrame = self._original_df.copy()
+        # contiguous input buffers of the storage dtype are wrapped, not copied, so read-only
+        # (e.g. memory-mapped) inputs are never copied up front; other columns are
+        # converted once and the frames are rebuilt over the stored buffers
+        if history is None:
+            history = VersionHistory(ColumnStore.from_dataframe(self._reset_index(df), dtype), label)
+        self._history: VersionHistory = history
+        self._original_df: pd.DataFrame = None
+        self._df: pd.DataFrame = None
+        self._rebuild_frames()
 
         self.label: str = label
         self.current_col_idx: int = current_col_idx
         self.bins: int = bins
         self.anomalies_removed: bool = False
+        # rank error allowed for sketched quantiles of large columns, None to keep them exact
+        self.quantile_error: float | None = DEFAULT_RANK_ERROR
 
-        self._cache: dict = {}
-        self._recompute_cache()
+    @classmethod
+    def from_history(cls, history: VersionHistory, bins: int = 10, current_col_idx: int = 0,
+                     anomalies_removed: bool = False) -> 'DataModel':
+        """
+        Create a model at the current version of an existing history (e.g. one restored
+        from a saved workspace) without copying or recomputing any data.
+        """
+        model = cls(history.root_store.to_dataframe(), bins, history.head.label, history, current_col_idx,
+                    history.root_store.dtype)
+        model.anomalies_removed = anomalies_removed
+        return model
 
     @property
     def original(self) -> pd.DataFrame:
@@ -74,30 +116,48 @@ class DataModel:
     def series(self) -> pd.Series:
         return self._df.iloc[:, self.current_col_idx]
 
+    @property
+    def history(self) -> VersionHistory:
+        """Graph of all versions of this dataset."""
+        return self._history
+
+    @property
+    def dtype(self) -> np.dtype:
+        """Storage dtype of the columns of this dataset."""
+        return self._history.root_store.dtype
+
+    @property
+    def version_id(self) -> int:
+        """Id of the current version in history."""
+        return self._history.head.id
+
     def select_column(self, idx: int) -> None:
         """Select a different column by index as current series."""
         if idx < 0 or idx >= self._df.shape[1]:
             raise IndexError("Column index out of range")
         self.current_col_idx = idx
-        self.clear_cache()
 
     def add_version_from_series(self, new_series: pd.Series, label: str) -> 'DataModel':
-        """Apply series to current column in-place and return self."""
-        self._df.iloc[:, self.current_col_idx] = new_series.values
-        self.label = label
-        self._recompute_cache()
+        """Apply series to current column as a new version and return self."""
+        self._commit_store(self._store.with_column(self.current_col_idx, new_series), label)
         return self
 
     def add_version(self, new_df: pd.DataFrame, label: str) -> 'DataModel':
-        """Apply dataframe in-place and return self."""
-        self._df = new_df.reset_index(drop=True)
-        self.label = label
-        self._recompute_cache()
+        """
+        Apply dataframe as a new version and return self.
+        Columns of new_df equal to the current ones keep sharing their buffers, and
+        a frame that only drops rows of the current one is stored as the dropped positions.
+        """
+        dropped = self._dropped_rows(new_df)
+        if dropped is not None:
+            self._commit(RowDropDelta(dropped), label)
+        else:
+            self._commit_store(self._store.derive(self._reset_index(new_df)), label)
         return self
 
     def apply_transformation(self, func, label: str = None, to_series: bool = True) -> 'DataModel':
         """
-        Apply transformation function to current df or specific column in-place.
+        Apply transformation function to current df or specific column as a new version.
         Args:
             func: function to apply to df or series
             label: optional label for new version
@@ -105,79 +165,391 @@ class DataModel:
         Return:
             self
         """
+        label = label or "Transformed"
         if to_series:
-            transformed = func(self._df.iloc[:, self.current_col_idx])
-            self._df.iloc[:, self.current_col_idx] = transformed
+            self._commit_store(self._store.with_column(self.current_col_idx, func(self.series)), label)
         else:
-            self._df = func(self._df).reset_index(drop=True)
-        self.label = label or "Transformed"
-        self._recompute_cache()
+            self._commit_store(self._store.derive(self._reset_index(func(self._df))), label)
+        return self
+
+    def apply_column_transform(self, transform: str, params: dict = None, label: str = None) -> 'DataModel':
+        """
+        Apply a named transform to the current column as a new version.
+        The version stores only the transform and its parameters and recomputes the column when needed.
+        Args:
+            transform: name of the transform in COLUMN_TRANSFORMS ('log', 'inverse_log', 'shift')
+            params: keyword parameters of the transform
+            label: optional label for new version
+        Return:
+            self
+        """
+        self._commit(TransformDelta(self.current_col_idx, transform, params), label or "Transformed")
         return self
 
     def revert_to_original(self, whole_dataset: bool = False) -> 'DataModel':
         """
-        Revert to original data in-place and return self.
+        Revert to original data and return self.
         Args:
-            whole_dataset: if True revert entire df; if False revert current column only
+            whole_dataset: if True switch to the original version; if False revert current column only
+                (to its original values of the rows still present if rows were dropped)
         Return:
             self
         """
         if whole_dataset:
-            self._df = self._original_df.copy()
-        else:
-            self._df.iloc[:, self.current_col_idx] = (
-                self._original_df.iloc[:, self.current_col_idx].copy()
-            )
-        self.label = "Original"
-        self.anomalies_removed = False
-        self._recompute_cache()
+            return self.checkout(self._history.root.id)
+        root, idx = self._history.root_store, self.current_col_idx
+        if root.n_rows == self._store.n_rows:
+            self._commit_store(self._store.with_column(idx, root.column(idx), root.column_version(idx)), "Original")
+            self.anomalies_removed = False
+            return self
+        kept = self._kept_rows()
+        if kept is None:
+            # rows were changed in a way that can not be traced back to the original
+            return self.checkout(self._history.root.id)
+        self._commit_store(self._store.with_column(idx, root.column(idx)[kept]), "Original")
+        return self
+
+    def checkout(self, version_id: int) -> 'DataModel':
+        """
+        Switch to any version from history and return self.
+        Args:
+            version_id: id of a node in history
+        """
+        self._history.checkout(version_id)
+        node = self._history.head
+        self.label = node.label
+        self.anomalies_removed = any(isinstance(step.delta, RowDropDelta) for step in node.path())
+        self._update_frame()
+        if self.current_col_idx >= self._df.shape[1]:
+            self.current_col_idx = 0
         return self
 
     def is_current_column_modified(self) -> bool:
-        """Check if current column has been modified from original."""
-        return not self.series.equals(self._original_df.iloc[:, self.current_col_idx])
+        """Check if current column has been modified from original (O(1) after the first check of a version)."""
+        return not self._store.column_equals(self._history.root_store, self.current_col_idx)
 
     def is_dataset_modified(self) -> bool:
         """Check if entire dataset has been modified from original."""
-        return not self._df.equals(self._original_df)
+        return not self._store.equals(self._history.root_store)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory taken by the original and current versions, shared buffers counted once."""
+        return unique_nbytes(self._history.root_store, self._store)
+
+    @property
+    def resident_nbytes(self) -> int:
+        """RAM taken by the data of all versions (memory-mapped data excluded)."""
+        return self._history.resident_bytes()
+
+    def spill(self) -> int:
+        """
+        Move all data of the model to memory-mapped files and return the bytes freed.
+        The model stays fully usable, its data is read from disk on access.
+        """
+        freed = self._history.spill_all()
+        self._rebuild_frames()
+        return freed
+
+    def page_in(self) -> int:
+        """Load spilled data of the current and original versions back into RAM, return bytes loaded."""
+        loaded = self._history.page_in()
+        if loaded:
+            self._rebuild_frames()
+        return loaded
+
+    @property
+    def _store(self) -> ColumnStore:
+        return self._history.head_store
+
+    def _commit(self, delta, label: str) -> None:
+        self._history.commit(delta, label)
+        self._on_new_version(label)
+
+    def _commit_store(self, store: ColumnStore, label: str) -> None:
+        self._history.commit_store(store, label)
+        self._on_new_version(label)
+
+    def _on_new_version(self, label: str) -> None:
+        self.label = label
+        self._update_frame()
+
+    def _rebuild_frames(self) -> None:
+        """Point the original and current dataframes at the (moved) buffers of the history."""
+        self._original_df = self._history.root_store.to_dataframe()
+        self._update_frame()
+
+    def _update_frame(self) -> None:
+        """Rebuild the dataframe over buffers of the current version."""
+        store = self._store
+        self._df = self._original_df.copy(deep=False) if store is self._history.root_store else store.to_dataframe()
+
+    def _dropped_rows(self, new_df: pd.DataFrame) -> np.ndarray | None:
+        """
+        Return positions of rows dropped from the current data if new_df is the current
+        data with some rows removed (index holds the positions of kept rows), otherwise None.
+        """
+        store, index = self._store, new_df.index
+        if (len(new_df) >= store.n_rows or list(new_df.columns) != store.names
+                or not pd.api.types.is_integer_dtype(index) or not index.is_monotonic_increasing
+                or not index.is_unique or (len(index) and (index[0] < 0 or index[-1] >= store.n_rows))):
+            return None
+        kept = index.to_numpy()
+        for i in range(store.n_cols):
+            if not ColumnStore.same_values(new_df.iloc[:, i].to_numpy(), store.column(i)[kept]):
+                return None
+        return np.setdiff1d(np.arange(store.n_rows), kept)
+
+    def _kept_rows(self) -> np.ndarray | None:
+        """
+        Positions of the original rows present in the current version, composed from the
+        row drops on its path; None if the row count can not be explained by them.
+        """
+        kept = np.arange(self._history.root_store.n_rows)
+        for node in self._history.head.path()[1:]:
+            if isinstance(node.delta, RowDropDelta):
+                kept = np.delete(kept, node.delta.dropped)
+        return kept if len(kept) == self._store.n_rows else None
+
+    @staticmethod
+    def _reset_index(df: pd.DataFrame) -> pd.DataFrame:
+        """Reset index to a default RangeIndex, without copying data if it already is one."""
+        if df.index.equals(pd.RangeIndex(len(df))):
+            return df
+        return df.reset_index(drop=True)
 
     @property
     def current_transformation(self) -> str:
         """Return human-readable current transformation label."""
         return self.label
 
-    def _recompute_cache(self) -> None:
-        """Recompute and store histogram and descriptive stats in cache."""
-        s = self.series
-        self._cache['hist'] = Hist(s, self.bins)
-        self._cache['stats'] = {
-            "n": len(s),
-            "mean": s.mean(),
-            "std": s.std(ddof=1),
-            "var": s.var(ddof=1),
-            "min": s.min(),
-            "max": s.max()
-        }
-
     def clear_cache(self) -> None:
-        """Clear and recompute all cached values."""
-        self._cache.clear()
-        self._recompute_cache()
+        """Drop cached values of the current column, they are recomputed on next access."""
+        fingerprint = self.fingerprint
+        self.stats_cache.discard(lambda key: key[0] == fingerprint)
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        Content hash of the current column, computed once per column version.
+        Key for results derived from the column: equal data (e.g. the same file loaded
+        twice or a transform undone) shares cached results.
+        """
+        return self._store.fingerprint(self.current_col_idx)
 
     @property
     def hist(self) -> Hist:
         """Return histogram object."""
-        return self._cache.get('hist')
+        return self.stats_cache.get(
+            (self.fingerprint, 'hist', self.bins), lambda: Hist(self.series, self.bins)
+        )
+
+    @property
+    def is_out_of_core(self) -> bool:
+        """
+        True if the current column is a large memory-mapped buffer (e.g. a .npy file or a
+        spilled version): its statistics then come from accumulator and median_mad,
+        which read it chunk by chunk instead of copying or sorting it in RAM.
+        """
+        return self.is_column_out_of_core(self.current_col_idx)
+
+    def is_column_out_of_core(self, idx: int) -> bool:
+        """True if the column at position idx is a memory-mapped buffer of at least OUT_OF_CORE_BYTES."""
+        column = self._store.column(idx)
+        return is_memory_mapped(column) and column.nbytes >= OUT_OF_CORE_BYTES
+
+    @property
+    def uses_sketch(self) -> bool:
+        """True if quantiles of the current column come from quantile_sketch (see column_uses_sketch)."""
+        return self.column_uses_sketch(self.current_col_idx)
+
+    def column_uses_sketch(self, idx: int) -> bool:
+        """
+        True if quantiles of the column at position idx are approximated: a quantile error
+        is allowed and the column is out of core or has at least SKETCH_MIN_VALUES values.
+        """
+        return self.quantile_error is not None and (
+            self.is_column_out_of_core(idx) or self._store.n_rows >= SKETCH_MIN_VALUES
+        )
+
+    @property
+    def quantile_sketch(self) -> QuantileSketch:
+        """Quantile sketch of the current column (see sketch_column)."""
+        return self.sketch_column(self.current_col_idx)
+
+    def sketch_column(self, idx: int) -> QuantileSketch:
+        """
+        Quantile sketch of the column at position idx within quantile_error (the default error
+        if quantiles are exact), built in one pass over its chunks once per column version.
+        """
+        k = k_for_rank_error(self.quantile_error or DEFAULT_RANK_ERROR)
+        return self.stats_cache.get(
+            (self._store.fingerprint(idx), 'sketch', k),
+            lambda: QuantileSketch.from_chunks(array_chunks(self._store.column(idx))(), k, seed=0)
+        )
+
+    @property
+    def accumulator(self) -> StatsAccumulator:
+        """Chunk by chunk summary of the current column with histogram over bins, computed once per version."""
+        idx = self.current_col_idx
+        return self.stats_cache.get(
+            (self.fingerprint, 'accumulator', self.bins),
+            lambda: StatsAccumulator.from_source(array_chunks(self._store.column(idx)), self.bins)
+        )
+
+    @property
+    def median_mad(self) -> tuple[float, float]:
+        """
+        Median and MAD of the current column: from the quantile sketch if used, otherwise
+        read off the sorted view in RAM or selected exactly from chunks with bounded memory
+        for out-of-core columns.
+        """
+        if self.uses_sketch:
+            return self.quantile_sketch.median_mad()
+        if not self.is_out_of_core:
+            return median_mad(None, self.sorted_values)
+        idx = self.current_col_idx
+        return self.stats_cache.get(
+            (self.fingerprint, 'median_mad'),
+            lambda: streamed_median_mad(array_chunks(self._store.column(idx)), self.accumulator)
+        )
 
     def describe(self) -> dict:
         """Return dictionary with descriptive statistics."""
-        return self._cache.get('stats')
+        return self.stats_cache.get((self.fingerprint, 'stats'), self._compute_stats)
+
+    @property
+    def values(self) -> np.ndarray:
+        """Current column as a contiguous array of the storage dtype: the stored buffer itself (must not be modified)."""
+        return self.column_values(self.current_col_idx)
+
+    @property
+    def nan_mask(self) -> np.ndarray:
+        """True where the current column is NaN."""
+        return self.column_nan_mask(self.current_col_idx)
+
+    @property
+    def valid_values(self) -> np.ndarray:
+        """Non-NaN values of the current column in data order (must not be modified)."""
+        return self.valid_column(self.current_col_idx)
+
+    def column_values(self, idx: int) -> np.ndarray:
+        """Column at position idx as a contiguous array of the storage dtype, without copying (must not be modified)."""
+        return self._store.column(idx)
+
+    def column_frame(self, names: list) -> pd.DataFrame:
+        """DataFrame of the named columns of the current version over their stored buffers (no copy)."""
+        positions = [self._df.columns.get_loc(name) for name in names]
+        df = pd.DataFrame({i: self._store.column(pos) for i, pos in enumerate(positions)}, copy=False)
+        df.columns = pd.Index(names)
+        return df
+
+    def column_nan_mask(self, idx: int) -> np.ndarray:
+        """NaN mask of the column at position idx, computed once per column version."""
+        return self.stats_cache.get(
+            (self._store.fingerprint(idx), 'nan_mask'), lambda: np.isnan(self._store.column(idx))
+        )
+
+    def valid_column(self, idx: int) -> np.ndarray:
+        """
+        Non-NaN values of the column at position idx in data order. A column without NaN
+        is returned as is; otherwise the filtered copy is made once per column version.
+        """
+        valid = self.stats_cache.get(
+            (self._store.fingerprint(idx), 'valid'), lambda: self._compute_valid(idx)
+        )
+        return self._store.column(idx) if valid is None else valid
+
+    @property
+    def sorted_values(self) -> np.ndarray:
+        """Non-NaN values of the current column in ascending order (must not be modified)."""
+        return self.sorted_column(self.current_col_idx)
+
+    @property
+    def argsort(self) -> np.ndarray:
+        """Positions of non-NaN values of the current column in ascending order of values."""
+        return self.argsort_column(self.current_col_idx)
+
+    @property
+    def ranks(self) -> np.ndarray:
+        """Average ranks (1-based) of the current column values, NaN for missing values."""
+        idx = self.current_col_idx
+        return self.stats_cache.get(
+            (self._store.fingerprint(idx), 'ranks'), lambda: self._compute_ranks(idx)
+        )
+
+    def sorted_column(self, idx: int) -> np.ndarray:
+        """
+        Non-NaN values of the column at position idx in ascending order.
+        Sorted once per column version and shared by all consumers (EDF, KS, quantiles,
+        anomalies, rank tests); the result must not be modified.
+        """
+        return self.stats_cache.get(
+            (self._store.fingerprint(idx), 'sorted'), lambda: self._compute_sorted(idx)
+        )
+
+    def argsort_column(self, idx: int) -> np.ndarray:
+        """Positions of non-NaN values of the column at position idx in ascending order (stable)."""
+        return self.stats_cache.get(
+            (self._store.fingerprint(idx), 'argsort'), lambda: self._compute_argsort(idx)
+        )
+
+    def quantile(self, q: float | np.ndarray) -> float | np.ndarray:
+        """
+        Return quantile(s) of the current column, read off the cached sorted view.
+        Args:
+            q: probability or array of probabilities in [0, 1]
+        """
+        values = self.sorted_values
+        if len(values) == 0:
+            return np.full(np.shape(q), np.nan) if np.ndim(q) else np.nan
+        # same linear interpolation as np.quantile
+        pos = np.asarray(q, dtype=np.float64) * (len(values) - 1)
+        lower = np.floor(pos).astype(np.int64)
+        upper = np.minimum(lower + 1, len(values) - 1)
+        result = values[lower] + (pos - lower) * (values[upper] - values[lower])
+        return result if np.ndim(q) else float(result)
+
+    def _compute_valid(self, idx: int) -> np.ndarray | None:
+        """Filtered copy of the column, or None if it has no NaN (the column itself is used)."""
+        mask = self.column_nan_mask(idx)
+        return self._store.column(idx)[~mask] if mask.any() else None
+
+    def _compute_sorted(self, idx: int) -> np.ndarray:
+        return np.sort(self.valid_column(idx))
+
+    def _compute_argsort(self, idx: int) -> np.ndarray:
+        valid = np.flatnonzero(~self.column_nan_mask(idx))
+        return valid[np.argsort(self.valid_column(idx), kind='stable')]
+
+    def _compute_ranks(self, idx: int) -> np.ndarray:
+        ranks = np.full(self._store.n_rows, np.nan)
+        ranks[self.argsort_column(idx)] = average_ranks(self.sorted_column(idx))
+        return ranks
+
+    def _compute_stats(self) -> dict:
+        s = self.series
+        return {
+            "n": len(s),
+            "mean": s.mean(),
+            "std": s.std(ddof=1),
+            "var": s.var(ddof=1),
+            "min": s.min(),
+            "max": s.max()
+        }
 
     def update_bins(self, bins: int) -> None:
         """
-        Update histogram bin count and recompute histogram cache.
+        Update histogram bin count; the histogram is rebuilt on next access.
         Args:
             bins: new number of bins
         """
         self.bins = bins
-        self._cache['hist'] = Hist(self.series, bins)
\ No newline at end of file
+
+    def update_quantile_error(self, error: float | None) -> None:
+        """
+        Update the rank error allowed for sketched quantiles; sketches are rebuilt on next access.
+        Args:
+            error: normalized rank error (e.g. 0.001), None for exact quantiles
+        """
+        self.quantile_error = error
\ No newline at end of file
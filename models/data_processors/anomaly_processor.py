@@ -1,6 +1,7 @@
 import numpy as np
 import pandas as pd
 from scipy import stats
+from models.quantile_sketch import QuantileSketch
 
 class AnomalyProcessor:
     """
@@ -31,26 +32,47 @@ class AnomalyProcessor:
         }
 
     @staticmethod
-    def detect_conf_anomalies(data: pd.DataFrame, confidence_level: float = 0.95) -> dict:
+    def detect_conf_anomalies(data: pd.DataFrame, confidence_level: float = 0.95, order: np.ndarray = None,
+                              sketch: QuantileSketch = None) -> dict:
         """
         Detect anomalies using confidence interval based on order statistics.
         Args:
             data: input 1-dimensional pandas Dataframe
             confidence_level: confidence level for the interval
+            order: positions of the column values in ascending order, if already available
+            sketch: quantile sketch of the column, if the bounds may be approximated
+                (the column is then not sorted)
         Return:
-            dictionary with anomaly indices and bounds
+            dictionary with anomaly indices and bounds (and rank_error of the bounds if sketched)
         """
         col = data.columns[0]
         series = data[col]
 
-        sorted_series = np.sort(series)
+        values = series.to_numpy()
         n = len(series)
         gamma = 1 - confidence_level
         lower_index = max(0, int(np.round(gamma * n)) - 1)
         upper_index = min(n - 1, int(np.round((1 - gamma) * n)) - 1)
+        if sketch is not None:
+            lower = sketch.value_at_rank(lower_index)
+            upper = sketch.value_at_rank(upper_index)
+            anomalies = series.index[(values < lower) | (values > upper)].to_numpy()
+            return {
+                'anomalies': anomalies,
+                'lower_limit': lower,
+                'upper_limit': upper,
+                'rank_error': sketch.rank_error
+            }
+
+        if order is None:
+            order = np.argsort(values, kind='stable')
+        sorted_series = values[order]
         lower = sorted_series[lower_index]
         upper = sorted_series[upper_index]
-        anomalies = series.index[(series < lower) | (series > upper)].to_numpy()
+        # values out of bounds are the head and the tail of the sorted order
+        below = np.searchsorted(sorted_series, lower, side='left')
+        above = np.searchsorted(sorted_series, upper, side='right')
+        anomalies = series.index[np.sort(np.concatenate([order[:below], order[above:]]))].to_numpy()
         return {
             'anomalies': anomalies,
             'lower_limit': lower,
@@ -1,3 +1,4 @@
+from typing import Callable
 import pandas as pd
 import numpy as np
 
@@ -85,4 +86,12 @@ class TransformationProcessor:
         Return:
             shifted series
         """
-        return data + shift_value
\ No newline at end of file
+        return data + shift_value
+
+
+# column transforms a version can store by name and parameters and recompute when needed
+COLUMN_TRANSFORMS: dict[str, Callable[..., pd.Series]] = {
+    'log': TransformationProcessor.log_transform,
+    'inverse_log': TransformationProcessor.inverse_log_transform,
+    'shift': TransformationProcessor.shift,
+}
@@ -1,4 +1,4 @@
-from scipy.stats import chi2
+from models import critical_values
 import numpy as np
 from models.gofs.base_gof_test import BaseGOFTest
 from models.stat_distributions.stat_distribution import StatisticalDistribution
@@ -43,8 +43,8 @@ class ChiSquaredGOFTest(BaseGOFTest):
 
         chi2_stat = np.sum((hist_safe - expected_safe) ** 2 / expected_safe)
         df = np.sum(mask) - 1 - len(params)
-        chi2_crit = chi2.ppf(1 - alpha, df)
-        p_value = 1 - chi2.cdf(chi2_stat, df)
+        chi2_crit = critical_values.ppf('chi2', 1 - alpha, df)
+        p_value = critical_values.sf('chi2', chi2_stat, df)
 
         return {
             "statistic": chi2_stat,
@@ -1,6 +1,7 @@
-from scipy.stats import kstwobign
+from models import critical_values
 import numpy as np
 from models.gofs.base_gof_test import BaseGOFTest
+from models.order_statistics import sorted_view
 from models.stat_distributions.stat_distribution import StatisticalDistribution
 
 class KolmogorovSmirnovGOFTest(BaseGOFTest):
@@ -16,7 +17,7 @@ class KolmogorovSmirnovGOFTest(BaseGOFTest):
         """
         Perform the Kolmogorov-Smirnov goodness-of-fit test.
         Args:
-            data: input data array
+            data: input data array (an already sorted array is used without sorting again)
             dist: fitted StatisticalDistribution object
             alpha: significance level
         Returns:
@@ -26,7 +27,7 @@ class KolmogorovSmirnovGOFTest(BaseGOFTest):
             raise ValueError("Data must be a 1D array")
         
         n = len(data)
-        sorted_data = np.sort(data)
+        sorted_data = sorted_view(data)
         params = dist.fit(data)
         dist_obj = dist.get_distribution_object(params)
 
@@ -38,7 +39,7 @@ class KolmogorovSmirnovGOFTest(BaseGOFTest):
         dn = max(dn_plus, dn_minus)
 
         z = np.sqrt(n) * dn
-        critical = kstwobign.ppf(1 - alpha)
+        critical = critical_values.ppf('kstwobign', 1 - alpha)
         p_value = 1 - self._kolmogorov_cdf(z, n)
 
         return {
@@ -2,7 +2,8 @@ import numpy as np
 from typing import Optional
 from models.gofs.base_gof_test import BaseGOFTest
 from models.stat_distributions.stat_distribution import StatisticalDistribution
-from scipy.stats import chi2, multivariate_normal
+from scipy.stats import multivariate_normal
+from models import critical_values
 
 class Normal2DChi2GOFTest(BaseGOFTest):
     """Chi-squared goodness-of-fit test for testing data on 2D Normal distribution."""
@@ -56,8 +57,8 @@ class Normal2DChi2GOFTest(BaseGOFTest):
         # chi^2
         chi2_stat = np.sum((O_safe - E_safe) ** 2 / E_safe)
         df = np.sum(mask) - 1 - 3  # 2 means + 1 cov
-        chi2_crit = chi2.ppf(1 - alpha, df)
-        p_value = 1 - chi2.cdf(chi2_stat, df)
+        chi2_crit = critical_values.ppf('chi2', 1 - alpha, df)
+        p_value = critical_values.sf('chi2', chi2_stat, df)
 
         return {
             "statistic": chi2_stat,
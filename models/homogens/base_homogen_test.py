@@ -3,6 +3,10 @@ import numpy as np
 
 class BaseHomogenTest(ABC):
     """Abstract base class for homogeneity tests."""
+    # True if the result does not depend on the order of values within samples,
+    # such tests may be given the samples sorted
+    order_invariant: bool = False
+
     @abstractmethod
     def name(self) -> str:
         pass
@@ -1,5 +1,5 @@
 import numpy as np
-from scipy.stats import f
+from models import critical_values
 from models.homogens.base_homogen_test import BaseHomogenTest
 
 
@@ -52,8 +52,8 @@ class ANOVATest(BaseHomogenTest):
         df1 = k - 1
         df2 = N - k
 
-        f_crit = f.ppf(1 - alpha, df1, df2)
-        p_value = 1 - f.cdf(F, df1, df2)
+        f_crit = critical_values.ppf('f', 1 - alpha, df1, df2)
+        p_value = critical_values.sf('f', F, df1, df2)
 
         decision = F <= f_crit        
 
@@ -1,5 +1,5 @@
 import numpy as np
-from scipy.stats import chi2
+from models import critical_values
 from models.homogens.base_homogen_test import BaseHomogenTest
 
 
@@ -42,8 +42,8 @@ class BartlettTest(BaseHomogenTest):
         chi2_stat = B / C
 
         df = k - 1
-        chi2_crit = chi2.ppf(1 - alpha, df)
-        p_value = 1 - chi2.cdf(chi2_stat, df)
+        chi2_crit = critical_values.ppf('chi2', 1 - alpha, df)
+        p_value = critical_values.sf('chi2', chi2_stat, df)
 
         decision = chi2_stat <= chi2_crit
 
@@ -1,5 +1,5 @@
 import numpy as np
-from scipy.stats import chi2
+from models import critical_values
 from models.homogens.base_homogen_test import BaseHomogenTest
 
 
@@ -60,8 +60,8 @@ class CochranQTest(BaseHomogenTest):
         Q_statistic = numerator / denominator
         
         df = k - 1
-        chi2_crit = chi2.ppf(1 - alpha, df)
-        p_value = 1 - chi2.cdf(Q_statistic, df)
+        chi2_crit = critical_values.ppf('chi2', 1 - alpha, df)
+        p_value = critical_values.sf('chi2', Q_statistic, df)
         
         decision = Q_statistic <= chi2_crit
         
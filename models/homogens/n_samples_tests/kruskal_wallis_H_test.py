@@ -1,10 +1,12 @@
 import numpy as np
-from scipy.stats import chi2, rankdata
+from models import critical_values
 from models.homogens.base_homogen_test import BaseHomogenTest
+from models.order_statistics import sorted_view, pooled_ranks
 
 
 class HTest(BaseHomogenTest):
     """Homogeneity Kruskal-Wallis H test."""
+    order_invariant = True
 
     def name(self) -> str:
         """
@@ -31,25 +33,21 @@ class HTest(BaseHomogenTest):
         k = len(samples)
         if k < 3: return {}
 
-        all_data = np.concatenate(samples)
-        ranks = rankdata(all_data)
+        ranks = pooled_ranks([sorted_view(sample) for sample in samples])
 
-        N = len(all_data)
+        N = sum(len(sample) for sample in samples)
         H = 0.0
 
-        start = 0
-        for sample in samples:
-            Ni = len(sample)
-            ranks_i = ranks[start : start + Ni]
+        for ranks_i in ranks:
+            Ni = len(ranks_i)
             W_bar_i = np.sum(ranks_i) / Ni
             E_W_bar = (N + 1) / 2
             var_W_bar = (N + 1) * (N - Ni) / (12 * Ni)
             H += ((W_bar_i - E_W_bar)**2) / var_W_bar * (1 - Ni / N)
-            start += Ni
 
         df = k - 1
-        chi2_crit = chi2.ppf(1 - alpha, df)
-        p_value = 1 - chi2.cdf(H, df)
+        chi2_crit = critical_values.ppf('chi2', 1 - alpha, df)
+        p_value = critical_values.sf('chi2', H, df)
         decision = H <= chi2_crit
 
         return {
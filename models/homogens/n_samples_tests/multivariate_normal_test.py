@@ -1,6 +1,6 @@
 import numpy as np
 from models.homogens.base_homogen_test import BaseHomogenTest
-from scipy import stats
+from models import critical_values
 
 
 class MultiNormalTest(BaseHomogenTest):
@@ -85,8 +85,8 @@ class MultiNormalTest(BaseHomogenTest):
         V = sum(((N_d[d] - 1) / 2) * (np.log(ln_S / np.linalg.det(S_d[d]) + 1e-10))
                                                                  for d in range(k))
         df = n * (n + 1) * (k - 1) // 2
-        chi2_crit = stats.chi2.ppf(1 - alpha, df)
-        p_value = float(1 - stats.chi2.cdf(V, df))
+        chi2_crit = critical_values.ppf('chi2', 1 - alpha, df)
+        p_value = critical_values.sf('chi2', V, df)
         decision = bool(V <= chi2_crit)
  
         return {
@@ -115,8 +115,8 @@ class MultiNormalTest(BaseHomogenTest):
         V = sum(N_d[d] * (x_bar_d[d] - x_bar).T @ S_d_inv[d] @ (x_bar_d[d] - x_bar)
                                                                  for d in range(k))
         df = n * (k - 1)
-        chi2_crit = stats.chi2.ppf(1 - alpha, df)
-        p_value = 1 - stats.chi2.cdf(V, df)
+        chi2_crit = critical_values.ppf('chi2', 1 - alpha, df)
+        p_value = critical_values.sf('chi2', V, df)
         decision = V <= chi2_crit
 
         return {
@@ -138,8 +138,8 @@ class MultiNormalTest(BaseHomogenTest):
         V = -(N1 + N2 - 2 - n/2) * np.log(np.linalg.det(S1) / (np.linalg.det(S0) + 1e-10))
 
         df = n * (n + 1) // 2
-        chi2_crit = stats.chi2.ppf(1 - alpha, df)
-        p_value = 1 - stats.chi2.cdf(V, df)
+        chi2_crit = critical_values.ppf('chi2', 1 - alpha, df)
+        p_value = critical_values.sf('chi2', V, df)
         decision = V <= chi2_crit
 
         return {
@@ -1,5 +1,5 @@
 import numpy as np
-from scipy.stats import norm
+from models import critical_values
 from models.homogens.base_homogen_test import BaseHomogenTest
 
 
@@ -45,7 +45,7 @@ class AbbeTest(BaseHomogenTest):
 
         U = (q - 1) * np.sqrt((N**2 - 1) / (N - 2))
 
-        p_value = 2 * (1 - norm.cdf(abs(U)))
+        p_value = 2 * critical_values.sf('norm', abs(U))
         decision = p_value > alpha
 
         return {
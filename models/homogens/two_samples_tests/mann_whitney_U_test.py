@@ -1,10 +1,12 @@
 import numpy as np
-from scipy.stats import norm
+from models import critical_values
 from models.homogens.base_homogen_test import BaseHomogenTest
+from models.order_statistics import sorted_view
 
 
 class MannWhitneyUTest(BaseHomogenTest):
     """Homogeneity Mann-Whitney U test."""
+    order_invariant = True
 
     def name(self) -> str:
         """
@@ -38,15 +40,16 @@ class MannWhitneyUTest(BaseHomogenTest):
         N1, N2 = len(x), len(y)
         N = N1 + N2
 
-        U = sum(1 for xi in x for yj in y if xi > yj)
+        # number of pairs with xi > yj: for every xi, the count of smaller values in sorted y
+        U = int(np.sum(np.searchsorted(sorted_view(y), x, side='left')))
 
         EU = (N1 * N2) / 2
         DU = N1 * N2 * (N + 1) / 12
 
         u = (U - EU) / np.sqrt(DU)
 
-        z_crit = norm.ppf(1 - alpha / 2)
-        p_value = 2 * (1 - norm.cdf(abs(u)))
+        z_crit = critical_values.ppf('norm', 1 - alpha / 2)
+        p_value = 2 * critical_values.sf('norm', abs(u))
         decision = abs(u) < z_crit
 
         return {
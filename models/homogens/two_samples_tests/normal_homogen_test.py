@@ -1,5 +1,5 @@
 import numpy as np
-from scipy.stats import f, t
+from models import critical_values
 from models.homogens.base_homogen_test import BaseHomogenTest
 
 
@@ -76,7 +76,7 @@ class NormalHomogenTest(BaseHomogenTest):
             f_stat = s2 / s1
             v1, v2 = n2 - 1, n1 - 1
 
-        p_value = 2 * min(f.cdf(f_stat, v1, v2), 1 - f.cdf(f_stat, v1, v2))
+        p_value = 2 * min(critical_values.cdf('f', f_stat, v1, v2), critical_values.sf('f', f_stat, v1, v2))
         is_consistent = p_value > alpha
 
         return f_stat, p_value, is_consistent
@@ -106,7 +106,7 @@ class NormalHomogenTest(BaseHomogenTest):
             else:
                 t_stat = np.mean(d) / (std_d / np.sqrt(len(d)))
                 df = len(d) - 1
-                p_value = 2 * (1 - t.cdf(abs(t_stat), df=df))
+                p_value = 2 * critical_values.sf('t', abs(t_stat), df)
 
             is_consistent = p_value > alpha
             return t_stat, p_value, is_consistent
@@ -122,7 +122,7 @@ class NormalHomogenTest(BaseHomogenTest):
             t_stat = (np.mean(x) - np.mean(y)) / S_diff
             df = n1 + n2 - 2
 
-        p_value = 2 * (1 - t.cdf(abs(t_stat), df=df))
+        p_value = 2 * critical_values.sf('t', abs(t_stat), df)
         is_consistent = p_value > alpha
 
         return t_stat, p_value, is_consistent
\ No newline at end of file
@@ -1,10 +1,12 @@
 import numpy as np
-from scipy.stats import norm, rankdata
+from models import critical_values
 from models.homogens.base_homogen_test import BaseHomogenTest
+from models.order_statistics import sorted_view, pooled_ranks
 
 
 class RankMeanDiffTest(BaseHomogenTest):
     """Homogeneity Rank Mean Difference test."""
+    order_invariant = True
 
     def name(self) -> str:
         """
@@ -35,16 +37,15 @@ class RankMeanDiffTest(BaseHomogenTest):
         N1, N2 = len(x), len(y)
         N = N1 + N2
 
-        all_values = np.concatenate([x, y])
-        ranks = rankdata(all_values, method="average")
+        x_ranks, y_ranks = pooled_ranks([sorted_view(x), sorted_view(y)])
 
-        rx = np.mean(ranks[:N1])
-        ry = np.mean(ranks[N1:])
+        rx = np.mean(x_ranks)
+        ry = np.mean(y_ranks)
 
         v = (rx - ry) / (N * np.sqrt((N + 1) / 12 * N1 * N2))
 
-        z_crit = norm.ppf(1 - alpha / 2)
-        p_value = 2 * (1 - norm.cdf(abs(v)))
+        z_crit = critical_values.ppf('norm', 1 - alpha / 2)
+        p_value = 2 * critical_values.sf('norm', abs(v))
         decision = abs(v) < z_crit
 
         return {
@@ -1,5 +1,5 @@
 import numpy as np
-from scipy.stats import norm
+from models import critical_values
 from math import comb
 from models.homogens.base_homogen_test import BaseHomogenTest
 
@@ -53,8 +53,8 @@ class SignsCriterionTest(BaseHomogenTest):
             E_S = N / 2
             sigma_S = np.sqrt(N) / 2
             S_star = (S - E_S) / sigma_S
-            z_crit = norm.ppf(1 - alpha / 2)
-            p_value = 2 * (1 - norm.cdf(abs(S_star)))
+            z_crit = critical_values.ppf('norm', 1 - alpha / 2)
+            p_value = 2 * critical_values.sf('norm', abs(S_star))
             decision = abs(S_star) < z_crit
 
         shift_val_theta = None
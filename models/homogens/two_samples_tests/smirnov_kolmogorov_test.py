@@ -1,9 +1,11 @@
 import numpy as np
 from models.homogens.base_homogen_test import BaseHomogenTest
+from models.order_statistics import sorted_view
 
 
 class SmirnovKolmogorovTest(BaseHomogenTest):
     """Homogeneity Smirnov-Kolmogorov test."""
+    order_invariant = True
 
     def name(self) -> str:
         """
@@ -33,14 +35,18 @@ class SmirnovKolmogorovTest(BaseHomogenTest):
         N1, N2 = len(x), len(y)
         N = min(N1, N2)
 
-        x_sorted = np.sort(x)
-        y_sorted = np.sort(y)
-        all_values = np.sort(np.concatenate([x_sorted, y_sorted]))
+        x_sorted = sorted_view(x)
+        y_sorted = sorted_view(y)
 
-        cdf_x = np.searchsorted(x_sorted, all_values, side='right') / len(x_sorted)
-        cdf_y = np.searchsorted(y_sorted, all_values, side='right') / len(y_sorted)
-
-        max_diff = np.max(np.abs(cdf_x - cdf_y))
+        # the largest EDF difference is reached at one of the sample values,
+        # so both EDFs are evaluated at the values of each sample in turn
+        max_diff = max(
+            np.max(np.abs(
+                np.searchsorted(x_sorted, points, side='right') / N1
+                - np.searchsorted(y_sorted, points, side='right') / N2
+            ))
+            for points in (x_sorted, y_sorted)
+        )
         z = max_diff * np.sqrt(N)
 
         l_z = (1 - np.exp(-2 * z**2)) * (
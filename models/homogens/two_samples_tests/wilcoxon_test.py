@@ -1,10 +1,12 @@
 import numpy as np
-from scipy.stats import norm, rankdata
+from models import critical_values
 from models.homogens.base_homogen_test import BaseHomogenTest
+from models.order_statistics import sorted_view, pooled_ranks
 
 
 class WilcoxonTest(BaseHomogenTest):
     """Homogeneity Wilcoxon test."""
+    order_invariant = True
 
     def name(self) -> str:
         """
@@ -38,18 +40,17 @@ class WilcoxonTest(BaseHomogenTest):
         N1, N2 = len(x), len(y)
         N = N1 + N2
 
-        all_values = np.concatenate([x, y])
-        ranks = rankdata(all_values, method="average")
+        x_ranks, _ = pooled_ranks([sorted_view(x), sorted_view(y)])
 
-        W = np.sum(ranks[:N1])
+        W = np.sum(x_ranks)
 
         EW = N1 * (N + 1) / 2
         DW = N1 * N2 * (N + 1) / 12
 
         w = (W - EW) / np.sqrt(DW)
 
-        z_crit = norm.ppf(1 - alpha / 2)
-        p_value = 2 * (1 - norm.cdf(abs(w)))
+        z_crit = critical_values.ppf('norm', 1 - alpha / 2)
+        p_value = 2 * critical_values.sf('norm', abs(w))
         decision = abs(w) < z_crit
 
         return {
@@ -0,0 +1,167 @@
+from typing import NamedTuple
+import numpy as np
+
+# values per block: a block and its temporaries stay in cache while all sums are taken
+MOMENT_BLOCK = 1 << 16
+# values per block of a multi-column pass (rows x columns)
+COLUMN_BLOCK = 1 << 18
+# relative spread below which data counts as constant (as in scipy.stats.skew)
+CONSTANT_RESOLUTION = np.finfo(np.float64).resolution
+
+
+class Moments(NamedTuple):
+    """
+    Count, mean, central sums M2..M4 and range of a sample, accumulated in float64.
+    Moments of disjoint parts merge exactly (Chan et al.), so a sample can be
+    summarized block by block, chunk by chunk or in parallel.
+    Fields are scalars for one sample or arrays with one entry per column
+    (see column_moments); derived statistics follow the same shape.
+    """
+    n: int = 0
+    mean: float = np.nan
+    m2: float = 0.0
+    m3: float = 0.0
+    m4: float = 0.0
+    minimum: float = np.nan
+    maximum: float = np.nan
+
+    @classmethod
+    def of_block(cls, values: np.ndarray) -> 'Moments':
+        """Moments of a small array (NaN skipped) from its own mean: two passes over cached data."""
+        x = np.asarray(values, dtype=np.float64)
+        if len(x) and np.isnan(x.min()):
+            x = x[~np.isnan(x)]
+        n = len(x)
+        if n == 0:
+            return cls()
+        mean = x.sum() / n
+        d = x - mean
+        d2 = d * d
+        return cls(n, float(mean), float(d2.sum()), float(np.dot(d2, d)), float(np.dot(d2, d2)),
+                   float(x.min()), float(x.max()))
+
+    @classmethod
+    def of_rows(cls, block: np.ndarray) -> 'Moments':
+        """Moments of every row of a small 2D float64 array (NaN skipped), one entry per row."""
+        nan = np.isnan(block)
+        has_nan = bool(nan.any())
+        n = block.shape[1] - nan.sum(axis=1) if has_nan else np.full(len(block), block.shape[1])
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = (np.where(nan, 0.0, block) if has_nan else block).sum(axis=1) / n
+        d = block - mean[:, None]
+        if has_nan:
+            d[nan] = 0.0
+        d2 = d * d
+        return cls(n, mean, d2.sum(axis=1), np.einsum('ij,ij->i', d2, d), np.einsum('ij,ij->i', d2, d2),
+                   np.fmin.reduce(block, axis=1), np.fmax.reduce(block, axis=1))
+
+    def merge(self, other: 'Moments') -> 'Moments':
+        """Moments of the union of two disjoint samples (column by column for array fields)."""
+        if np.ndim(self.n) == 0:
+            if other.n == 0:
+                return self
+            if self.n == 0:
+                return other
+            return Moments(*_combine(self, other))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            merged = _combine(self, other)
+        return Moments(*(np.where(self.n == 0, b, np.where(other.n == 0, a, m))
+                         for a, b, m in zip(self, other, merged)))
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (ddof=1)."""
+        n = np.asarray(self.n, dtype=np.float64)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return _unwrap(np.where(n > 1, self.m2 / (n - 1), np.nan))
+
+    @property
+    def std_dev(self) -> float:
+        """Sample standard deviation (ddof=1)."""
+        return _unwrap(np.sqrt(self.variance))
+
+    @property
+    def skewness(self) -> float:
+        """Biased sample skewness, same as scipy.stats.skew; NaN for constant data."""
+        n = np.asarray(self.n, dtype=np.float64)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            value = (self.m3 / n) / (self.m2 / n) ** 1.5
+        return _unwrap(np.where(self._is_constant(), np.nan, value))
+
+    @property
+    def excess(self) -> float:
+        """Biased excess kurtosis, same as scipy.stats.kurtosis; NaN for constant data."""
+        n = np.asarray(self.n, dtype=np.float64)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            value = (self.m4 / n) / (self.m2 / n) ** 2 - 3
+        return _unwrap(np.where(self._is_constant(), np.nan, value))
+
+    def _is_constant(self):
+        n = np.asarray(self.n, dtype=np.float64)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return (n == 0) | (self.m2 / n <= (CONSTANT_RESOLUTION * self.mean) ** 2)
+
+
+def _combine(a: Moments, b: Moments) -> tuple:
+    """Chan et al. update of the moment fields of two non-empty samples (elementwise for arrays)."""
+    na, nb = a.n, b.n
+    n = na + nb
+    delta = b.mean - a.mean
+    delta_n = delta / n
+    mean = a.mean + delta_n * nb
+    m2 = a.m2 + b.m2 + delta * delta_n * na * nb
+    m3 = (a.m3 + b.m3 + delta * delta_n * delta_n * na * nb * (na - nb)
+          + 3 * delta_n * (na * b.m2 - nb * a.m2))
+    m4 = (a.m4 + b.m4 + delta * delta_n ** 3 * na * nb * (na * na - na * nb + nb * nb)
+          + 6 * delta_n * delta_n * (na * na * b.m2 + nb * nb * a.m2)
+          + 4 * delta_n * (na * b.m3 - nb * a.m3))
+    return n, mean, m2, m3, m4, np.fmin(a.minimum, b.minimum), np.fmax(a.maximum, b.maximum)
+
+
+def _unwrap(value):
+    """Plain float for 0-d results, arrays unchanged."""
+    return float(value) if np.ndim(value) == 0 else value
+
+
+def moments(values, block_size: int = MOMENT_BLOCK) -> Moments:
+    """
+    Moments of the non-NaN values in one pass over memory: blocks are summarized
+    in cache from their own mean and merged, which keeps the sums numerically stable
+    (also for float32 data, promoted block by block).
+    Args:
+        values: 1D array or Series
+        block_size: number of values per block
+    """
+    values = np.asarray(values)
+    result = Moments()
+    for start in range(0, len(values), block_size):
+        result = result.merge(Moments.of_block(values[start:start + block_size]))
+    return result
+
+
+def column_moments(columns: list[np.ndarray], block_size: int = COLUMN_BLOCK) -> Moments:
+    """
+    Moments of the non-NaN values of every column in one sweep over the data.
+    Rows are taken in blocks of about block_size values that are copied side by side
+    into one float64 buffer, summarized for all columns at once and merged, so the
+    cost does not depend on the number of columns beyond the memory it occupies.
+    Args:
+        columns: 1D arrays of equal length
+        block_size: number of values (rows x columns) per block
+    Return:
+        Moments with one entry per column in every field
+    """
+    k = len(columns)
+    n_rows = len(columns[0]) if k else 0
+    result = Moments(*(np.asarray(field, dtype=np.float64).repeat(k) for field in Moments()))
+    result = result._replace(n=np.zeros(k, dtype=np.int64))
+    if n_rows == 0:
+        return result
+    rows = max(1, block_size // k)
+    buffer = np.empty((k, min(rows, n_rows)))
+    for start in range(0, n_rows, rows):
+        block = buffer[:, :min(rows, n_rows - start)]
+        for j, column in enumerate(columns):
+            block[j] = column[start:start + rows]
+        result = result.merge(Moments.of_rows(block))
+    return result
@@ -0,0 +1,153 @@
+import numpy as np
+
+# values per batch of columns partitioned together in column_medians
+MEDIAN_BATCH = 1 << 24
+
+
+def is_sorted(values: np.ndarray) -> bool:
+    """True if values are in ascending order (one linear pass)."""
+    return len(values) < 2 or bool(np.all(values[1:] >= values[:-1]))
+
+
+def sorted_view(values: np.ndarray) -> np.ndarray:
+    """
+    Return values in ascending order. Already sorted input (e.g. DataModel.sorted_values)
+    is returned as is, so callers can pass a cached sorted view and skip the sort.
+    """
+    values = np.asarray(values)
+    return values if is_sorted(values) else np.sort(values)
+
+
+def median_sorted(sorted_values: np.ndarray) -> float:
+    """Median of an ascending array in O(1)."""
+    n = len(sorted_values)
+    if n == 0:
+        return np.nan
+    mid = n // 2
+    return float(sorted_values[mid]) if n % 2 else (float(sorted_values[mid - 1]) + float(sorted_values[mid])) / 2
+
+
+def mad_sorted(sorted_values: np.ndarray, median: float | None = None) -> float:
+    """
+    Median absolute deviation from the median of an ascending array.
+    Deviations of values below and above the median form two ascending runs,
+    so their median is selected by binary search in O(log n) instead of a full pass.
+    Args:
+        sorted_values: ascending array without NaN
+        median: median of sorted_values if already known
+    """
+    s = sorted_values
+    n = len(s)
+    if n == 0:
+        return np.nan
+    m = median_sorted(s) if median is None else median
+    split = int(np.searchsorted(s, m))
+    below = lambda j: m - s[split - 1 - j]
+    above = lambda j: s[split + j] - m
+
+    def kth(k: int) -> float:
+        # take i deviations from below and k + 1 - i from above
+        lo, hi = max(0, k + 1 - (n - split)), min(k + 1, split)
+        while lo < hi:
+            i = (lo + hi) // 2
+            if below(i) < above(k - i):
+                lo = i + 1
+            else:
+                hi = i
+        candidates = []
+        if lo > 0:
+            candidates.append(below(lo - 1))
+        if k + 1 - lo > 0:
+            candidates.append(above(k - lo))
+        return float(max(candidates))
+
+    mid = n // 2
+    return kth(mid) if n % 2 else (kth(mid - 1) + kth(mid)) / 2
+
+
+def median_mad(values: np.ndarray, sorted_values: np.ndarray | None = None) -> tuple[float, float]:
+    """
+    Median and median absolute deviation of values without NaN.
+    Read off sorted_values when available; otherwise both come from one working copy:
+    the median is selected in it, the copy is turned into absolute deviations in
+    place and the MAD is selected from the same buffer.
+    Args:
+        values: array without NaN
+        sorted_values: values in ascending order, if available
+    Return:
+        (median, mad), NaN for empty values
+    """
+    if sorted_values is not None:
+        median = median_sorted(sorted_values)
+        return median, mad_sorted(sorted_values, median)
+    if len(values) == 0:
+        return np.nan, np.nan
+    work = np.array(values, dtype=np.float64)
+    median = _select_median(work)
+    np.subtract(work, median, out=work)
+    np.abs(work, out=work)
+    return median, _select_median(work)
+
+
+def column_medians(columns: list[np.ndarray], counts: np.ndarray) -> np.ndarray:
+    """
+    Medians of the non-NaN values of every column. Columns with the same number of
+    valid values are copied side by side and partitioned in one batched call (NaN
+    sorts last, so the medians sit at the same positions in every row).
+    Args:
+        columns: 1D arrays of equal length
+        counts: number of non-NaN values per column (e.g. column_moments(columns).n)
+    Return:
+        array of medians, NaN for columns without valid values
+    """
+    counts = np.asarray(counts)
+    medians = np.full(len(columns), np.nan)
+    n_rows = len(columns[0]) if columns else 0
+    batch = max(1, MEDIAN_BATCH // max(n_rows, 1))
+    for count in np.unique(counts[counts > 0]):
+        lower, upper = (count - 1) // 2, count // 2
+        positions = np.flatnonzero(counts == count)
+        for start in range(0, len(positions), batch):
+            chunk = positions[start:start + batch]
+            work = np.empty((len(chunk), n_rows))
+            for row, j in enumerate(chunk):
+                work[row] = columns[j]
+            work.partition(sorted({lower, upper}), axis=1)
+            medians[chunk] = (work[:, lower] + work[:, upper]) / 2
+    return medians
+
+
+def _select_median(work: np.ndarray) -> float:
+    """Median of a non-empty array by partial sorting (reorders work in place)."""
+    mid = len(work) // 2
+    if len(work) % 2:
+        work.partition(mid)
+        return float(work[mid])
+    work.partition((mid - 1, mid))
+    return (float(work[mid - 1]) + float(work[mid])) / 2
+
+
+def average_ranks(sorted_values: np.ndarray) -> np.ndarray:
+    """1-based ranks of an ascending array, tied values get the average of their ranks."""
+    return pooled_ranks([sorted_values])[0]
+
+
+def pooled_ranks(sorted_samples: list[np.ndarray]) -> list[np.ndarray]:
+    """
+    Average ranks of every value in the pooled sample, computed from the sorted
+    samples by binary search instead of sorting their concatenation.
+    Args:
+        sorted_samples: ascending arrays without NaN
+    Return:
+        list of rank arrays aligned with sorted_samples
+    """
+    ranks = []
+    for sample in sorted_samples:
+        less = np.zeros(len(sample), dtype=np.int64)
+        less_equal = np.zeros(len(sample), dtype=np.int64)
+        for other in sorted_samples:
+            less += np.searchsorted(other, sample, side='left')
+            less_equal += np.searchsorted(other, sample, side='right')
+        # tied values occupy positions less + 1 .. less_equal
+        ranks.append((less + less_equal + 1) / 2)
+    return ranks
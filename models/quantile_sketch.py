@@ -0,0 +1,165 @@
+from typing import Iterable, Optional
+import numpy as np
+from models.column_views import drop_nan
+
+# rank error of the sketches used when none is selected
+DEFAULT_RANK_ERROR = 0.001
+# values added to the bottom level at once: one in-cache sort per block
+SKETCH_BLOCK = 1 << 16
+# smallest capacity of a level
+MIN_LEVEL_CAPACITY = 8
+# capacity ratio of a level to the one above it
+LEVEL_RATIO = 2 / 3
+
+
+def rank_error_of(k: int) -> float:
+    """
+    Normalized rank error of a single quantile of a KLL sketch with parameter k
+    (bound holding with 99% confidence, fit of the KLL reference implementation).
+    """
+    return 2.296 / k ** 0.9723
+
+
+def k_for_rank_error(rank_error: float) -> int:
+    """Smallest sketch parameter k whose rank error is at most rank_error."""
+    return int(np.ceil((2.296 / rank_error) ** (1 / 0.9723)))
+
+
+DEFAULT_K = k_for_rank_error(DEFAULT_RANK_ERROR)
+
+
+class QuantileSketch:
+    """
+    KLL quantile sketch: a mergeable summary that answers any quantile of a column
+    within a rank error of about rank_error * n, in memory that only depends on k.
+    Level h holds sorted-on-demand items of weight 2**h; a full level is sorted and
+    every other item (random offset) moves up, so the total weight stays n.
+    Until the first compaction every value is kept and the answers are exact.
+    """
+    def __init__(self, k: int = DEFAULT_K, seed: Optional[int] = None):
+        """
+        Args:
+            k: accuracy parameter (see k_for_rank_error), memory is about 3k values
+            seed: seed of the random compaction offsets
+        """
+        self.k: int = k
+        self.n: int = 0
+        self.levels: list[np.ndarray] = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+        self._weighted: Optional[tuple[np.ndarray, np.ndarray]] = None
+
+    @classmethod
+    def from_chunks(cls, chunks: Iterable[np.ndarray], k: int = DEFAULT_K,
+                    seed: Optional[int] = None) -> 'QuantileSketch':
+        """Sketch of all values of the chunks (e.g. stats_accumulator.array_chunks of a column)."""
+        sketch = cls(k, seed)
+        for chunk in chunks:
+            sketch.update(chunk)
+        return sketch
+
+    def update(self, chunk: np.ndarray) -> 'QuantileSketch':
+        """Add the non-NaN values of a chunk and return self."""
+        chunk = np.asarray(chunk)
+        for start in range(0, len(chunk), SKETCH_BLOCK):
+            values = np.asarray(drop_nan(chunk[start:start + SKETCH_BLOCK]), dtype=np.float64)
+            self.n += len(values)
+            self.levels[0] = np.concatenate([self.levels[0], values])
+            self._compress()
+        self._weighted = None
+        return self
+
+    def merge(self, other: 'QuantileSketch') -> 'QuantileSketch':
+        """
+        Return the sketch of the values of both sketches.
+        Raises:
+            ValueError: if the sketches have different k
+        """
+        if self.k != other.k:
+            raise ValueError(f"Sketches with different k ({self.k}, {other.k}) can not be merged")
+        merged = QuantileSketch(self.k)
+        merged._rng = self._rng
+        merged.n = self.n + other.n
+        depth = max(len(self.levels), len(other.levels))
+        merged.levels = [
+            np.concatenate([levels[h] for levels in (self.levels, other.levels) if h < len(levels)])
+            for h in range(depth)
+        ]
+        merged._compress()
+        return merged
+
+    @property
+    def is_exact(self) -> bool:
+        """True while no value was compacted away."""
+        return len(self.levels) == 1
+
+    @property
+    def rank_error(self) -> float:
+        """Normalized rank error of the answers: 0 while exact."""
+        return 0.0 if self.is_exact else rank_error_of(self.k)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(level.nbytes for level in self.levels)
+
+    def value_at_rank(self, rank: int) -> float:
+        """Value of the given 0-based rank among the n values (NaN if the sketch is empty)."""
+        items, cumulative = self._sorted_items()
+        return _weighted_order_statistic(items, cumulative, rank)
+
+    def quantile(self, q: float) -> float:
+        """Value at probability q, from the nearest rank (q * (n - 1))."""
+        return self.value_at_rank(int(np.round(q * (self.n - 1))))
+
+    def median_mad(self) -> tuple[float, float]:
+        """
+        Median and median absolute deviation, both read off the sketch: the MAD is the
+        weighted median of the absolute deviations of the sketch items.
+        Return:
+            (median, mad), NaN for an empty sketch
+        """
+        if self.n == 0:
+            return np.nan, np.nan
+        items, cumulative = self._sorted_items()
+        ranks = ((self.n - 1) // 2, self.n // 2)
+        median = sum(_weighted_order_statistic(items, cumulative, k) for k in ranks) / 2
+        deviations = np.abs(items - median)
+        order = np.argsort(deviations, kind='stable')
+        weights = np.diff(cumulative, prepend=0)[order]
+        deviations, cumulative = deviations[order], np.cumsum(weights)
+        return median, sum(_weighted_order_statistic(deviations, cumulative, k) for k in ranks) / 2
+
+    def _sorted_items(self) -> tuple[np.ndarray, np.ndarray]:
+        """All items in ascending order with the cumulative weights, cached until the next update."""
+        if self._weighted is None:
+            items = np.concatenate(self.levels)
+            weights = np.concatenate([np.full(len(level), 1 << h, dtype=np.int64)
+                                      for h, level in enumerate(self.levels)])
+            order = np.argsort(items, kind='stable')
+            self._weighted = items[order], np.cumsum(weights[order])
+        return self._weighted
+
+    def _capacity(self, h: int) -> int:
+        return max(MIN_LEVEL_CAPACITY, int(np.ceil(self.k * LEVEL_RATIO ** (len(self.levels) - 1 - h))))
+
+    def _compress(self) -> None:
+        """Compact every level above its capacity into the next one, adding a level on top if needed."""
+        h = 0
+        while h < len(self.levels):
+            if len(self.levels[h]) > self._capacity(h):
+                if h + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                # levels above the bottom one are concatenated sorted runs: merged in linear time
+                level = np.sort(self.levels[h], kind='stable' if h else 'quicksort')
+                # an odd item stays, every pair keeps one item of double weight
+                odd = len(level) % 2
+                promoted = level[odd + int(self._rng.integers(2))::2]
+                self.levels[h + 1] = np.concatenate([self.levels[h + 1], promoted])
+                self.levels[h] = level[:odd]
+            h += 1
+
+
+def _weighted_order_statistic(items: np.ndarray, cumulative: np.ndarray, rank: int) -> float:
+    """Item of 0-based rank among items in ascending order with cumulative weights."""
+    if len(items) == 0:
+        return np.nan
+    return float(items[min(int(np.searchsorted(cumulative, rank, side='right')), len(items) - 1)])
@@ -1,5 +1,5 @@
 import numpy as np
-from scipy import stats
+from models import critical_values
 from ..interfaces import IOptimizationAlgorithm
 from typing import Any, Dict
 
@@ -86,10 +86,10 @@ class OLS(IOptimizationAlgorithm):
         if self._std_err_ is None:
             self._compute_std_errors(X, residuals)
         
-        t_val = stats.t.ppf(1 - alpha / 2, self._df_)
+        t_val = critical_values.ppf('t', 1 - alpha / 2, self._df_)
 
         t_stats = self._all_params_ / self._std_err_
-        p_vals = 2 * (1 - stats.t.cdf(np.abs(t_stats), self._df_))
+        p_vals = 2 * np.array([critical_values.sf('t', abs(t_stat), self._df_) for t_stat in t_stats])
         
         ci_lower = self._all_params_ - t_val * self._std_err_
         ci_upper = self._all_params_ + t_val * self._std_err_
@@ -172,7 +172,7 @@ class OLS(IOptimizationAlgorithm):
         # F-statistic
         f_stat = MSE_model / MSE_residual
         # p-value
-        p_value = 1 - stats.f.cdf(f_stat, df_model, df_residual)
+        p_value = critical_values.sf('f', f_stat, df_model, df_residual)
         
         return {
             'stat': {'name': 'F_stat', 'val': f_stat},
@@ -82,6 +82,19 @@ class IOptimizationAlgorithm(ABC):
         """
         pass
 
+    def get_state(self) -> Dict[str, Any]:
+        """Returns fitted state of the algorithm (all instance attributes by default)."""
+        return dict(vars(self))
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        """
+        Restores fitted state returned by get_state, without refitting.
+        Args:
+            state (Dict[str, Any]): fitted attributes by name.
+        """
+        for name, value in state.items():
+            setattr(self, name, value)
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -135,6 +135,30 @@ class IRegression(ABC):
     def residuals(self) -> Optional[np.ndarray]:
         """Returns residuals of the fitted model."""
         return self.residuals_
+
+    def get_state(self) -> Dict[str, Any]:
+        """
+        Returns fitted state of the model (attributes ending with '_') with the state
+        of its algorithm under 'algorithm', e.g. for saving a workspace.
+        """
+        state = {name: value for name, value in vars(self).items() if name.endswith('_')}
+        algorithm = getattr(self, 'algorithm', None)
+        if algorithm is not None:
+            state['algorithm'] = algorithm.get_state()
+        return state
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        """
+        Restores fitted state returned by get_state, without refitting.
+        Args:
+            state (Dict[str, Any]): fitted attributes by name.
+        """
+        state = dict(state)
+        algorithm_state = state.pop('algorithm', None)
+        if algorithm_state is not None:
+            self.algorithm.set_state(algorithm_state)
+        for name, value in state.items():
+            setattr(self, name, value)
     
     def _generate_equation(self) -> str:
         """Generate the string representation of the model equation"""
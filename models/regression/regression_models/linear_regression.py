@@ -1,6 +1,6 @@
 from ..interfaces import IRegression, IOptimizationAlgorithm
 from typing import Dict, Any, Optional, List, Tuple
-from scipy import stats
+from models import critical_values
 import numpy as np
 
 class LinearRegression(IRegression):
@@ -137,7 +137,7 @@ class LinearRegression(IRegression):
         n_samples, n_features = self.X_.shape
         df = n_samples - n_features - 1
         
-        t_val = stats.t.ppf(1 - alpha / 2, df)
+        t_val = critical_values.ppf('t', 1 - alpha / 2, df)
         
         margin_mean = t_val * SE_mean
         CI_mean_lower = y_hat_new - margin_mean
@@ -173,8 +173,8 @@ class LinearRegression(IRegression):
 
         sigma2_hat = np.sum(residuals ** 2) / df
 
-        chi2_lower = stats.chi2.ppf(alpha / 2, df)
-        chi2_upper = stats.chi2.ppf(1 - alpha / 2, df)
+        chi2_lower = critical_values.ppf('chi2', alpha / 2, df)
+        chi2_upper = critical_values.ppf('chi2', 1 - alpha / 2, df)
 
         lower = df * sigma2_hat / chi2_upper
         upper = df * sigma2_hat / chi2_lower
@@ -1,7 +1,7 @@
 from ..interfaces import IRegression, IOptimizationAlgorithm
 from typing import Dict, Any, Optional, List, Tuple
 from itertools import combinations_with_replacement
-from scipy import stats
+from models import critical_values
 import numpy as np
 
 class PolynomialRegression(IRegression):
@@ -126,7 +126,7 @@ class PolynomialRegression(IRegression):
         n_samples, n_features = self.X_poly_.shape
         df = n_samples - n_features - 1
         
-        t_val = stats.t.ppf(1 - alpha / 2, df)
+        t_val = critical_values.ppf('t', 1 - alpha / 2, df)
         
         margin_mean = t_val * SE_mean
         CI_mean_lower = y_hat_new - margin_mean
@@ -166,8 +166,8 @@ class PolynomialRegression(IRegression):
         RSS = np.sum(residuals ** 2)
         sigma2_hat = RSS / df
 
-        chi2_lower = stats.chi2.ppf(alpha / 2, df)
-        chi2_upper = stats.chi2.ppf(1 - alpha / 2, df)
+        chi2_lower = critical_values.ppf('chi2', alpha / 2, df)
+        chi2_upper = critical_values.ppf('chi2', 1 - alpha / 2, df)
 
         lower = df * sigma2_hat / chi2_upper
         upper = df * sigma2_hat / chi2_lower
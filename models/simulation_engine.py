@@ -1,7 +1,7 @@
 import numpy as np
 import pandas as pd
 from typing import List, Optional, Dict
-from scipy.stats import t
+from models import critical_values
 from models.stat_distributions.stat_distribution import StatisticalDistribution
 from services.stat_services.test_performer import TestPerformer
 
@@ -67,7 +67,7 @@ class SimulationEngine:
 
             mean_t = np.mean(t_stats)
             std_t = np.std(t_stats, ddof=1)
-            t_crit = t.ppf(1 - alpha / 2, df=size - 1)
+            t_crit = critical_values.ppf('t', 1 - alpha / 2, size - 1)
 
             param_estimates = np.array(param_estimates) 
             params_mean = tuple(np.mean(param_estimates, axis=0)) 
@@ -86,7 +86,7 @@ class SimulationEngine:
     
     def generate_data(self, distribution: StatisticalDistribution, n_features: int,
                       params_list: list[tuple[float]], corr_coeffs: Optional[List[List[float]]], 
-                      size: int) -> np.ndarray:
+                      size: int, dtype=np.float64) -> np.ndarray:
         """
         Generate multivariate correlated data from specified statistical distribution.
             Args:
@@ -95,6 +95,7 @@ class SimulationEngine:
                 params_list: list of parameter tuples for each feature
                 corr_coeffs: correlation matrix or None
                 size: sample size
+                dtype: dtype of the generated dataset (float64 or float32)
         Returns:
             np.ndarray: Generated dataset with shape (size, n_features) with specified correlations
         """
@@ -103,13 +104,13 @@ class SimulationEngine:
         if n_features == 1 or not corr_coeffs:
             distribution.params = params_list[0]
             sample = self.generate_sample(distribution, size, distribution.params)
-            return sample.reshape(-1, 1) if sample is not None else None
+            return sample.astype(dtype, copy=False).reshape(-1, 1) if sample is not None else None
         
         # validate correlation matrix
         self._validate_correlation_matrix(corr_coeffs, n_features)
         
         # generate independent samples for each feature
-        independent_samples = np.zeros((size, n_features))
+        independent_samples = np.zeros((size, n_features), dtype=dtype)
         for i in range(n_features):
             distribution.params = params_list[i]
             sample = self.generate_sample(distribution, size, distribution.params)
@@ -128,19 +129,20 @@ class SimulationEngine:
         Returns:
             Correlated data with approximately the target correlation structure
         """
+        # moments are accumulated in float64 and applied in the dtype of data
+        original_mean = np.mean(data, axis=0, dtype=np.float64).astype(data.dtype)
+        original_std = np.std(data, axis=0, ddof=1, dtype=np.float64).astype(data.dtype)
         # standardize
-        standardized = (data - np.mean(data, axis=0)) / np.std(data, axis=0, ddof=1)
+        standardized = (data - original_mean) / original_std
         try:
             # calc Lapinskiy matrix
             L = np.linalg.cholesky(corr_matrix)
         except np.linalg.LinAlgError:
             raise ValueError("Correlation matrix is not positive definite")
         # apply transformation
-        correlated = standardized @ L.T
+        correlated = standardized @ L.T.astype(data.dtype)
         
         # original scale
-        original_mean = np.mean(data, axis=0)
-        original_std = np.std(data, axis=0, ddof=1)
         correlated = correlated * original_std + original_mean
         
         return correlated
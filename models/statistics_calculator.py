@@ -1,84 +1,141 @@
 import pandas as pd
 import numpy as np
-from scipy.stats import skew, kurtosis, t, chi2
+from models import critical_values
+from models.moments import moments, column_moments
+from models.order_statistics import median_mad, column_medians
+from models.column_views import drop_nan
+from models.stats_accumulator import StatsAccumulator
+from models.quantile_sketch import QuantileSketch
 
 class StatisticsCalculator:
     """
     Class for computing descriptive statistics and its confidence intervals.
     """
     @staticmethod
-    def _common_stats(data: pd.Series) -> dict:
+    def _common_stats(data: pd.Series, sorted_data: np.ndarray = None, sketch: QuantileSketch = None) -> dict:
         """
-        Compute common descriptive statistics.
+        Compute common descriptive statistics of the non-NaN values.
+        Moments and range come from one fused pass in float64 (see models.moments),
+        median and MAD from one shared selection step.
         Args:
-            data: input pandas Series
+            data: input pandas Series or array
+            sorted_data: non-NaN values of data in ascending order, if available
+                (median and MAD are then read off it)
+            sketch: quantile sketch of data, if median and MAD may be approximated
+                (no selection over the data then)
         Return:
-            dictionary with n, mean, std, var, median, skewness, excess
+            dictionary with n, mean, std_dev, variance, median, mad, skewness, excess, minimum, maximum
         """
+        m = moments(data)
+        if sketch is not None:
+            median, mad = sketch.median_mad()
+        else:
+            median, mad = median_mad(drop_nan(data) if sorted_data is None else None, sorted_data)
         return {
-            'n': len(data),
-            'mean': np.mean(data),
-            'std_dev': np.std(data, ddof=1),
-            'variance': np.var(data, ddof=1),
-            'median': np.median(data),
-            'skewness': skew(data),
-            'excess': kurtosis(data)
+            'n': m.n,
+            'mean': m.mean,
+            'std_dev': m.std_dev,
+            'variance': m.variance,
+            'median': median,
+            'mad': mad,
+            'skewness': m.skewness,
+            'excess': m.excess,
+            'minimum': m.minimum,
+            'maximum': m.maximum
         }
 
     @staticmethod
-    def get_characteristics(hist) -> pd.Series:
+    def get_characteristics(hist, sorted_data: np.ndarray = None, sketch: QuantileSketch = None) -> pd.Series:
         """
         Compute rounded descriptive stats and shape characteristics from histogram.
         Args:
             hist: histogram model
+            sorted_data: histogram data in ascending order, if available
+                (median and MAD are then read off it)
+            sketch: quantile sketch of the histogram data, if median and MAD may be approximated
+                (its rank error is added to the table)
         Return:
             pandas Series with labeled values
         """
-        stats = StatisticsCalculator._common_stats(hist.data)
+        stats = StatisticsCalculator._common_stats(hist.data, sorted_data, sketch)
+        return StatisticsCalculator._characteristics_table(
+            stats, hist.bins, None if sketch is None else sketch.rank_error
+        )
 
-        splitting_step = round(stats['n'] / hist.bins, 2)
+    @staticmethod
+    def get_accumulated_characteristics(accumulator: StatsAccumulator, median: float = np.nan,
+                                        mad: float = np.nan, rank_error: float = None) -> pd.Series:
+        """
+        Same table as get_characteristics for a column summarized chunk by chunk
+        (e.g. one larger than RAM).
+        Args:
+            accumulator: summary of the column with its histogram bins
+            median, mad: median and MAD of the column (see streamed_median_mad)
+            rank_error: rank error of median and MAD if they come from a quantile sketch
+        Return:
+            pandas Series with labeled values
+        """
+        return StatisticsCalculator._characteristics_table(
+            accumulator.stats(median, mad), accumulator.bins, rank_error
+        )
+
+    @staticmethod
+    def _characteristics_table(stats: dict, bins: int, rank_error: float = None) -> pd.Series:
+        splitting_step = round(stats['n'] / bins, 2)
         contrec_excess = round(1 / (stats['excess'] + 3), 2) if (stats['excess'] + 3) != 0 else 0
         pearson_variation = round((stats['std_dev'] / stats['mean']) * 100, 2) if stats['mean'] != 0 else 0
-        mad = round(np.median(np.abs(hist.data - stats['median'])), 2)
 
-        return pd.Series({
-            'Classes': hist.bins,
+        table = pd.Series({
+            'Classes': bins,
             'Number of data': stats['n'],
             'Splitting step': splitting_step,
             'Mean': round(stats['mean'], 2),
             'Variance': round(stats['variance'], 2),
             'RMS deviation': round(stats['std_dev'], 2),
-            'Minimum': round(np.min(hist.data), 2),
-            'Maximum': round(np.max(hist.data), 2),
+            'Minimum': round(stats['minimum'], 2),
+            'Maximum': round(stats['maximum'], 2),
             'Assymetry coeff.': round(stats['skewness'], 2),
             'Excess': round(stats['excess'], 2),
             'Contrec excess': contrec_excess,
             'Pearson var (%)': pearson_variation,
             'MED': round(stats['median'], 2),
-            'MAD': mad
+            'MAD': round(stats['mad'], 2)
         })
+        if rank_error is not None:
+            # median and MAD are sketched: bound of their rank error relative to n
+            table['Quantile rank error (%)'] = round(100 * rank_error, 2)
+        return table
     
     @staticmethod
     def get_multi_var_stats(df: pd.DataFrame) -> dict[str, dict]:
         """
-        Compute descriptive statistics for all numeric columns.
+        Compute descriptive statistics for all numeric columns (NaN values are skipped).
+        All columns are summarized together: moments in one sweep over the data and
+        medians in batched selections, so wide frames cost about one pass over memory.
         Args:
             df: input DataFrame with multiple columns
         Returns:
             {col_name: {stat_name: value, ...}, ...}
         """
-        result = {}
-        for col in df.select_dtypes(include='number').columns:
-            stats = StatisticsCalculator._common_stats(df[col].dropna())
-            result[col] = {
-                'Mean':             round(stats['mean'], 2),
-                'RMS deviation':    round(stats['std_dev'], 2),
-                'Variance':         round(stats['variance'], 2),
-                'MED':              round(stats['median'], 2),
-                'Assymetry coeff.': round(stats['skewness'], 2),
-                'Excess':           round(stats['excess'], 2),
-            }
-        return result
+        positions = [i for i, dtype in enumerate(df.dtypes) if pd.api.types.is_numeric_dtype(dtype)
+                     and not pd.api.types.is_bool_dtype(dtype)]
+        if not positions:
+            return {}
+        # column buffers are read in place: selecting the numeric sub-frame would copy them
+        columns = [df.iloc[:, i].to_numpy() for i in positions]
+        m = column_moments(columns)
+        stats = {
+            'Mean':             m.mean,
+            'RMS deviation':    m.std_dev,
+            'Variance':         m.variance,
+            'MED':              column_medians(columns, m.n),
+            'Assymetry coeff.': m.skewness,
+            'Excess':           m.excess,
+        }
+        return {
+            col: {name: round(float(values[j]), 2) for name, values in stats.items()}
+            for j, col in enumerate(df.columns[positions])
+        }
 
     @staticmethod
     def get_var_series(hist) -> pd.Series:
@@ -90,8 +147,23 @@ class StatisticsCalculator:
             pandas Series with variation series data
         """
         counts, bin_edges = np.histogram(hist.data, bins=hist.bins)
+        return StatisticsCalculator._var_series_table(counts, bin_edges, len(hist.data))
+
+    @staticmethod
+    def get_accumulated_var_series(accumulator: StatsAccumulator) -> pd.Series:
+        """
+        Same table as get_var_series from the histogram counts of an accumulator.
+        Args:
+            accumulator: summary of the column with its histogram bins
+        Return:
+            pandas Series with variation series data
+        """
+        return StatisticsCalculator._var_series_table(accumulator.bin_counts, accumulator.bin_edges, accumulator.n)
+
+    @staticmethod
+    def _var_series_table(counts: np.ndarray, bin_edges: np.ndarray, n: int) -> pd.Series:
         midpoints = [(bin_edges[i] + bin_edges[i+1]) / 2 for i in range(len(bin_edges)-1)]
-        relative_freq = counts / len(hist.data)
+        relative_freq = counts / n
         cumulative_rel_freq = np.cumsum(relative_freq)
         boundaries = [f"[{bin_edges[i]:.2f}, {bin_edges[i+1]:.2f})" for i in range(len(bin_edges)-1)]
         var_series_data = pd.Series({
@@ -106,24 +178,46 @@ class StatisticsCalculator:
         return var_series_data
 
     @staticmethod
-    def compute_intervals(data: pd.Series, confidence_level: float = 0.95, precision: int = 2) -> pd.Series:
+    def compute_intervals(data: pd.Series, confidence_level: float = 0.95, precision: int = 2,
+                          sorted_data: np.ndarray = None, sketch: QuantileSketch = None) -> pd.Series:
         """
         Compute confidence intervals for various characteristics.
         Args:
-            data: input pandas Series
+            data: input pandas Series (NaN values are skipped)
+            confidence_level: confidence level for intervals
+            precision: number of decimals in output
+            sorted_data: non-NaN values of data in ascending order, if available
+            sketch: quantile sketch of data, if the median may be approximated
+        Return:
+            pandas Series with confidence intervals as tuples
+        """
+        stats = StatisticsCalculator._common_stats(data, sorted_data, sketch)
+        return StatisticsCalculator._intervals_table(stats, confidence_level, precision)
+
+    @staticmethod
+    def compute_accumulated_intervals(accumulator: StatsAccumulator, confidence_level: float = 0.95,
+                                      precision: int = 2, median: float = np.nan) -> pd.Series:
+        """
+        Same intervals as compute_intervals for a column summarized chunk by chunk.
+        Args:
+            accumulator: summary of the column
             confidence_level: confidence level for intervals
             precision: number of decimals in output
+            median: median of the column (see streamed_median_mad)
         Return:
             pandas Series with confidence intervals as tuples
         """
-        stats = StatisticsCalculator._common_stats(data)
+        return StatisticsCalculator._intervals_table(accumulator.stats(median), confidence_level, precision)
+
+    @staticmethod
+    def _intervals_table(stats: dict, confidence_level: float, precision: int) -> pd.Series:
         n, mean, std_dev, variance = stats['n'], stats['mean'], stats['std_dev'], stats['variance']
         median, skewness, excess = stats['median'], stats['skewness'], stats['excess']
 
         df = n - 1
-        t_crit = t.ppf((1 + confidence_level) / 2, df=df)
-        chi2_lower = chi2.ppf((1 - confidence_level) / 2, df=df)
-        chi2_upper = chi2.ppf((1 + confidence_level) / 2, df=df)
+        t_crit = critical_values.ppf('t', (1 + confidence_level) / 2, df)
+        chi2_lower = critical_values.ppf('chi2', (1 - confidence_level) / 2, df)
+        chi2_upper = critical_values.ppf('chi2', (1 + confidence_level) / 2, df)
 
         se_mean = std_dev / np.sqrt(n)
         se_skewness = np.sqrt(6 * n * (n - 1) / ((n - 2) * (n + 1) * (n + 3)))
@@ -0,0 +1,200 @@
+from typing import Callable, Iterable, Iterator, Optional
+import numpy as np
+from models.moments import Moments, moments
+from models.column_views import drop_nan
+
+# values per chunk when a column is read in pieces (32 MB of float64)
+CHUNK_SIZE = 1 << 22
+# bins of one refinement level when selecting order statistics from a stream
+SELECTION_BINS = 4096
+# values of the selected bin that are collected in memory instead of refining further
+MAX_SELECTION_VALUES = 1 << 22
+
+# callable returning a fresh iterator over the chunks of a column, so it can be read more than once
+ChunkSource = Callable[[], Iterable[np.ndarray]]
+
+
+def array_chunks(values: np.ndarray, chunk_size: int = CHUNK_SIZE) -> ChunkSource:
+    """Chunk source over an array; a memory-mapped array is paged in one chunk at a time."""
+    return lambda: (values[start:start + chunk_size] for start in range(0, len(values), chunk_size))
+
+
+class StatsAccumulator:
+    """
+    Mergeable summary of a column consumed chunk by chunk: count, range, central
+    moments up to order 4 (see models.moments) and counts over fixed histogram bins.
+    Chunks may come from a file stream, a memory map or an appending source, and
+    accumulators of disjoint chunks merge exactly, so chunks can be summarized in
+    parallel. Memory does not depend on the number of values.
+    """
+    def __init__(self, bin_edges: Optional[np.ndarray] = None):
+        """
+        Args:
+            bin_edges: fixed histogram bin edges (values outside them are not counted),
+                no histogram is kept if None
+        """
+        self.moments: Moments = Moments()
+        self.bin_edges: Optional[np.ndarray] = None if bin_edges is None else np.asarray(bin_edges, dtype=np.float64)
+        self.bin_counts: Optional[np.ndarray] = (
+            None if bin_edges is None else np.zeros(len(self.bin_edges) - 1, dtype=np.int64)
+        )
+
+    @classmethod
+    def from_source(cls, source: ChunkSource, bins: Optional[int] = None) -> 'StatsAccumulator':
+        """
+        Summarize a re-readable column. With bins, a second pass counts the values over
+        `bins` equal bins between minimum and maximum, the same bins as Hist.
+        """
+        accumulator = cls().update_all(source())
+        if bins is None or accumulator.n == 0:
+            return accumulator
+        edges = np.linspace(accumulator.minimum, accumulator.maximum, bins + 1)
+        histogram = cls(edges)
+        for chunk in source():
+            histogram._count(drop_nan(chunk))
+        accumulator.bin_edges, accumulator.bin_counts = histogram.bin_edges, histogram.bin_counts
+        return accumulator
+
+    def update(self, chunk: np.ndarray) -> 'StatsAccumulator':
+        """Add the non-NaN values of a chunk and return self."""
+        self.moments = self.moments.merge(moments(chunk))
+        if self.bin_edges is not None:
+            self._count(drop_nan(chunk))
+        return self
+
+    def update_all(self, chunks: Iterable[np.ndarray]) -> 'StatsAccumulator':
+        """Add every chunk of an iterable and return self."""
+        for chunk in chunks:
+            self.update(chunk)
+        return self
+
+    def merge(self, other: 'StatsAccumulator') -> 'StatsAccumulator':
+        """
+        Return the summary of the chunks of both accumulators.
+        Raises:
+            ValueError: if the accumulators count over different histogram bins
+        """
+        if (self.bin_edges is None) != (other.bin_edges is None) or (
+                self.bin_edges is not None and not np.array_equal(self.bin_edges, other.bin_edges)):
+            raise ValueError("Accumulators with different histogram bins can not be merged")
+        merged = StatsAccumulator(self.bin_edges)
+        merged.moments = self.moments.merge(other.moments)
+        if merged.bin_counts is not None:
+            merged.bin_counts = self.bin_counts + other.bin_counts
+        return merged
+
+    @property
+    def n(self) -> int:
+        return int(self.moments.n)
+
+    @property
+    def minimum(self) -> float:
+        return self.moments.minimum
+
+    @property
+    def maximum(self) -> float:
+        return self.moments.maximum
+
+    @property
+    def bins(self) -> Optional[int]:
+        return None if self.bin_counts is None else len(self.bin_counts)
+
+    def stats(self, median: float = np.nan, mad: float = np.nan) -> dict:
+        """
+        Descriptive statistics in the form of StatisticsCalculator._common_stats.
+        Median and MAD are not mergeable: pass them if known (see streamed_median_mad).
+        """
+        m = self.moments
+        return {
+            'n': self.n,
+            'mean': m.mean,
+            'std_dev': m.std_dev,
+            'variance': m.variance,
+            'median': median,
+            'mad': mad,
+            'skewness': m.skewness,
+            'excess': m.excess,
+            'minimum': m.minimum,
+            'maximum': m.maximum
+        }
+
+    def _count(self, values: np.ndarray) -> None:
+        counts, _ = np.histogram(values, bins=self.bin_edges)
+        self.bin_counts += counts
+
+
+def streamed_median_mad(source: ChunkSource, accumulator: StatsAccumulator) -> tuple[float, float]:
+    """
+    Exact median and MAD of a re-readable column with bounded memory.
+    Args:
+        source: chunks of the column
+        accumulator: summary of the same column (count and range)
+    Return:
+        (median, mad), NaN for a column without values
+    """
+    n = accumulator.n
+    if n == 0:
+        return np.nan, np.nan
+    ranks = ((n - 1) // 2, n // 2)
+    lower, upper = _select(source, None, ranks, accumulator.minimum, accumulator.maximum)
+    median = (lower + upper) / 2
+    spread = max(median - accumulator.minimum, accumulator.maximum - median)
+    lower, upper = _select(source, median, ranks, 0.0, spread)
+    return median, (lower + upper) / 2
+
+
+def _values(source: ChunkSource, center: Optional[float]) -> Iterator[np.ndarray]:
+    """Non-NaN values of every chunk, as absolute deviations from center if given."""
+    for chunk in source():
+        values = np.asarray(drop_nan(chunk), dtype=np.float64)
+        yield values if center is None else np.abs(values - center)
+
+
+def _select(source: ChunkSource, center: Optional[float], ranks: tuple, lo: float, hi: float) -> list[float]:
+    """
+    Exact order statistics (0-based ranks) of the streamed values by histogram refinement:
+    a pass counts values over SELECTION_BINS bins of [lo, hi] to find the bin of each rank,
+    and the bin is collected and partitioned once it is small enough; larger bins are
+    narrowed to the range of their values and refined again.
+    """
+    found = {}
+    pending = [(sorted(set(ranks)), lo, hi)]
+    while pending:
+        ks, lo, hi = pending.pop()
+        if lo == hi:
+            found.update(dict.fromkeys(ks, lo))
+            continue
+        edges = np.linspace(lo, hi, SELECTION_BINS + 1)
+        counts = np.zeros(SELECTION_BINS, dtype=np.int64)
+        below = 0
+        for values in _values(source, center):
+            counts += np.histogram(values, bins=edges)[0]
+            below += int(np.count_nonzero(values < lo))
+        cumulative = below + np.cumsum(counts)
+
+        by_bin = {}
+        for k in ks:
+            by_bin.setdefault(int(np.searchsorted(cumulative, k, side='right')), []).append(k)
+        for b, bin_ranks in by_bin.items():
+            inside = _bin_filter(edges, b)
+            if counts[b] <= MAX_SELECTION_VALUES:
+                start = int(cumulative[b] - counts[b])
+                collected = np.concatenate([values[inside(values)] for values in _values(source, center)])
+                collected.partition([k - start for k in bin_ranks])
+                found.update({k: float(collected[k - start]) for k in bin_ranks})
+            else:
+                low, high = np.inf, -np.inf
+                for values in _values(source, center):
+                    values = values[inside(values)]
+                    if len(values):
+                        low, high = min(low, values.min()), max(high, values.max())
+                pending.append((bin_ranks, float(low), float(high)))
+    return [found[k] for k in ranks]
+
+
+def _bin_filter(edges: np.ndarray, b: int) -> Callable[[np.ndarray], np.ndarray]:
+    """Mask function of values in bin b, with the same bounds as np.histogram (last bin closed)."""
+    low, high = edges[b], edges[b + 1]
+    if b == len(edges) - 2:
+        return lambda values: (values >= low) & (values <= high)
+    return lambda values: (values >= low) & (values < high)
@@ -0,0 +1,78 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+import numpy as np
+
+DEFAULT_MAX_BYTES = 256 * 1024 ** 2
+
+
+class StatsCache:
+    """
+    LRU cache of values derived from columns (histograms, descriptive stats).
+    Keys include the column content fingerprint, so entries of unchanged columns stay
+    valid across versions and column switches, and entries of rewritten columns
+    are never hit again and age out. Least recently used entries are evicted when
+    the estimated size of all entries exceeds max_bytes.
+    Safe to use from a worker thread (values are computed outside the lock).
+    """
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Args:
+            max_bytes: memory cap for cached values
+        """
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._total = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return cached value for key, computing and storing it on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry[0]
+
+        value = compute()
+        size = self._sizeof(value)
+        if size <= self.max_bytes:
+            with self._lock:
+                if key not in self._entries:
+                    self._entries[key] = (value, size)
+                    self._total += size
+                    self._evict()
+        return value
+
+    def discard(self, match: Callable[[Hashable], bool]) -> None:
+        """Remove all entries whose key satisfies match."""
+        with self._lock:
+            for key in [key for key in self._entries if match(key)]:
+                self._total -= self._entries.pop(key)[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._total = 0
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _evict(self) -> None:
+        while self._total > self.max_bytes and self._entries:
+            _, (_, size) = self._entries.popitem(last=False)
+            self._total -= size
+
+    @staticmethod
+    def _sizeof(value: Any) -> int:
+        """Rough size of a cached value: its arrays plus a small per-object overhead."""
+        if isinstance(value, np.ndarray):
+            return value.nbytes
+        if isinstance(value, dict):
+            return 64 + sum(StatsCache._sizeof(item) for item in value.values())
+        if hasattr(value, '__dict__'):
+            return 64 + sum(StatsCache._sizeof(item) for item in vars(value).values())
+        return 32
@@ -0,0 +1,437 @@
+import os
+import time
+import itertools
+import shutil
+import weakref
+import tempfile
+from typing import Callable, Iterator, Optional
+import numpy as np
+import pandas as pd
+from models.column_store import ColumnStore, buffer_key, column_buffer, new_column_version
+from models.data_processors.transformation_processor import COLUMN_TRANSFORMS
+
+DEFAULT_RAM_BUDGET = 512 * 1024 ** 2
+
+
+class ColumnDelta:
+    """
+    Version that replaces columns: every column either comes from the parent
+    version (its position there) or has its own buffer.
+    Own buffers can be spilled to memory-mapped files.
+    """
+    recomputable = False
+
+    def __init__(self, names: list, sources: list, attrs: dict | None = None,
+                 versions: list[int | None] | None = None):
+        """
+        Args:
+            names: column names of the version
+            sources: per column, position of the column in the parent or a 1D array
+            attrs: DataFrame.attrs of the version
+            versions: column version numbers of own buffers (None for parent columns)
+        """
+        self.names = list(names)
+        self.sources = list(sources)
+        self.attrs = attrs
+        self.versions = list(versions) if versions is not None else [
+            None if isinstance(src, int) else new_column_version() for src in self.sources
+        ]
+
+    @classmethod
+    def between(cls, parent: ColumnStore, store: ColumnStore) -> 'ColumnDelta':
+        """Describe store relative to parent, referencing every buffer the two share."""
+        positions = {}
+        for i in range(parent.n_cols):
+            positions.setdefault(buffer_key(parent.column(i)), i)
+        sources, versions = [], []
+        for i in range(store.n_cols):
+            buf = store.column(i)
+            src = positions.get(buffer_key(buf), buf)
+            sources.append(src)
+            versions.append(None if isinstance(src, int) else store.column_version(i))
+        return cls(store.names, sources, store.attrs, versions)
+
+    def apply(self, parent: ColumnStore) -> ColumnStore:
+        buffers = [parent.column(src) if isinstance(src, int) else src for src in self.sources]
+        versions = [parent.column_version(src) if isinstance(src, int) else version
+                    for src, version in zip(self.sources, self.versions)]
+        return ColumnStore(self.names, buffers, parent.attrs if self.attrs is None else self.attrs, versions,
+                           parent.dtype)
+
+    def own_buffers(self) -> list[np.ndarray]:
+        return [src for src in self.sources if not isinstance(src, int)]
+
+    def spill(self, path_for: Callable[[int], str], keep: set) -> int:
+        """Move own in-RAM buffers (except those in keep) to .npy files. Return bytes freed."""
+        freed = 0
+        for i, src in enumerate(self.sources):
+            if isinstance(src, int) or isinstance(src, np.memmap) or buffer_key(src) in keep:
+                continue
+            path = path_for(i)
+            np.save(path, src)
+            self.sources[i] = np.load(path, mmap_mode='r')
+            freed += src.nbytes
+        return freed
+
+
+class RowDropDelta:
+    """
+    Version that drops rows of the parent: only the dropped positions are stored,
+    the columns are rebuilt from the parent on checkout and kept until evicted.
+    """
+    recomputable = True
+
+    def __init__(self, dropped: np.ndarray):
+        """
+        Args:
+            dropped: sorted positions of dropped rows in the parent
+        """
+        self.dropped = np.asarray(dropped, dtype=np.int64)
+        self.cached: Optional[ColumnStore] = None
+        self.versions: Optional[list[int]] = None
+
+    def apply(self, parent: ColumnStore) -> ColumnStore:
+        if self.cached is None:
+            keep = np.ones(parent.n_rows, dtype=bool)
+            keep[self.dropped] = False
+            self.cached = ColumnStore(
+                parent.names, [parent.column(i)[keep] for i in range(parent.n_cols)], parent.attrs, self.versions,
+                parent.dtype
+            )
+            # recomputed columns keep their version numbers
+            self.versions = [self.cached.column_version(i) for i in range(self.cached.n_cols)]
+        return self.cached
+
+    def own_buffers(self) -> list[np.ndarray]:
+        if self.cached is None:
+            return []
+        return [self.cached.column(i) for i in range(self.cached.n_cols)]
+
+    def evict(self) -> None:
+        self.cached = None
+
+
+class TransformDelta:
+    """
+    Version that applies a parameterized transform to one column of the parent.
+    Only the transform name and its parameters are stored: the column is recomputed
+    from the parent through COLUMN_TRANSFORMS on checkout and kept until evicted.
+    """
+    recomputable = True
+
+    def __init__(self, position: int, transform: str, params: Optional[dict] = None,
+                 values: Optional[np.ndarray] = None):
+        """
+        Args:
+            position: position of the transformed column
+            transform: name of the transform in COLUMN_TRANSFORMS
+            params: keyword parameters of the transform (e.g. shift_value for 'shift')
+            values: already computed result of the transform, if available
+        Raises:
+            ValueError: if the transform is unknown
+        """
+        if transform not in COLUMN_TRANSFORMS:
+            raise ValueError(f"Unknown column transform: {transform}")
+        self.position = position
+        self.transform = transform
+        self.params = dict(params or {})
+        self.cached = values
+        self.version = new_column_version()
+
+    def apply(self, parent: ColumnStore) -> ColumnStore:
+        if self.cached is None:
+            series = pd.Series(parent.column(self.position), name=parent.names[self.position], copy=False)
+            self.cached = column_buffer(COLUMN_TRANSFORMS[self.transform](series, **self.params), parent.dtype)
+        return parent.with_column(self.position, self.cached, self.version)
+
+    def own_buffers(self) -> list[np.ndarray]:
+        return [] if self.cached is None else [self.cached]
+
+    def evict(self) -> None:
+        self.cached = None
+
+
+class VersionNode:
+    """Node of the version graph: a label and a delta relative to the parent node."""
+    def __init__(self, node_id: int, parent: Optional['VersionNode'], label: str, delta=None):
+        self.id = node_id
+        self.parent = parent
+        self.label = label
+        self.delta = delta
+        self.children: list['VersionNode'] = []
+        self.last_access = time.monotonic()
+
+    @property
+    def depth(self) -> int:
+        return 0 if self.parent is None else self.parent.depth + 1
+
+    def path(self) -> list['VersionNode']:
+        """Nodes from the root to this node."""
+        nodes, node = [], self
+        while node is not None:
+            nodes.append(node)
+            node = node.parent
+        return nodes[::-1]
+
+
+class VersionHistory:
+    """
+    Graph of dataset versions. The root holds the original data, every other
+    node stores only a delta (changed column buffers, dropped rows or a column
+    transform), so checkout costs as much as the data that changed.
+    Delta data of versions not in use is kept under ram_budget: recomputable
+    deltas drop their cached columns and own column buffers are spilled to
+    memory-mapped files, least recently used versions first.
+    The whole history of an inactive dataset can be spilled as well (spill_all)
+    and its current and original versions paged back in when needed (page_in).
+    """
+    def __init__(self, root: ColumnStore, label: str = "Original", ram_budget: int = DEFAULT_RAM_BUDGET,
+                 spill_dir: Optional[str] = None):
+        """
+        Args:
+            root: original data
+            label: label of the root version
+            ram_budget: bytes of version data allowed in RAM (current and original versions excluded)
+            spill_dir: directory for spilled buffers, a temporary one is created if None
+        """
+        self.root = VersionNode(0, None, label)
+        self.head = self.root
+        self.ram_budget = ram_budget
+        self._root_store = root
+        self._head_store = root
+        self._nodes: dict[int, VersionNode] = {0: self.root}
+        self._spill_dir = spill_dir
+        self._spilled_bytes = 0
+
+    @classmethod
+    def restore(cls, root: ColumnStore, nodes: list[tuple], head_id: int, head_store: ColumnStore,
+                label: str = "Original", ram_budget: int = DEFAULT_RAM_BUDGET) -> 'VersionHistory':
+        """
+        Rebuild a history from saved versions, nothing is replayed.
+        Args:
+            root: original data
+            nodes: (id, parent id, label, delta) of every version except the root, parents first
+            head_id: id of the current version
+            head_store: data of the current version
+            label: label of the root version
+            ram_budget: bytes of version data allowed in RAM
+        """
+        history = cls(root, label, ram_budget)
+        for node_id, parent_id, node_label, delta in nodes:
+            parent = history._nodes[parent_id]
+            node = VersionNode(node_id, parent, node_label, delta)
+            parent.children.append(node)
+            history._nodes[node_id] = node
+        history.head = history._nodes[head_id]
+        history._head_store = root if history.head is history.root else head_store
+        return history
+
+    @property
+    def head_store(self) -> ColumnStore:
+        """Data of the current version."""
+        return self._head_store
+
+    @property
+    def root_store(self) -> ColumnStore:
+        """Original data."""
+        return self._root_store
+
+    @property
+    def nodes(self) -> list[VersionNode]:
+        """All versions in creation order."""
+        return list(self._nodes.values())
+
+    @property
+    def spilled_bytes(self) -> int:
+        return self._spilled_bytes
+
+    def get_node(self, node_id: int) -> VersionNode:
+        if node_id not in self._nodes:
+            raise KeyError(f"No version with id {node_id}")
+        return self._nodes[node_id]
+
+    def commit(self, delta, label: str) -> ColumnStore:
+        """Add a child version of the current one, make it current and return its data."""
+        node = VersionNode(max(self._nodes) + 1, self.head, label, delta)
+        store = delta.apply(self._head_store)
+        self.head.children.append(node)
+        self._nodes[node.id] = node
+        self.head, self._head_store = node, store
+        self.enforce_budget()
+        return store
+
+    def commit_store(self, store: ColumnStore, label: str) -> ColumnStore:
+        """Add a version with the given data, storing only buffers it does not share with the current one."""
+        return self.commit(ColumnDelta.between(self._head_store, store), label)
+
+    def checkout(self, node_id: int) -> ColumnStore:
+        """Make the version current and return its data."""
+        node = self.get_node(node_id)
+        if node is not self.head:
+            path = node.path()
+            start = path.index(self.head) + 1 if self.head in path else 1
+            store = self._head_store if self.head in path else self._root_store
+            for step in path[start:]:
+                store = step.delta.apply(store)
+                step.last_access = time.monotonic()
+            self.head, self._head_store = node, store
+            self.enforce_budget()
+        node.last_access = time.monotonic()
+        return self._head_store
+
+    def walk(self) -> Iterator[tuple[VersionNode, Optional[ColumnStore], ColumnStore]]:
+        """
+        Yield (version, data of its parent, its data) for every version, parents before
+        children (the root has no parent data). Versions whose data
+        is not cached are replayed from their parent and evicted again once yielded.
+        """
+        stack = [(self.root, None)]
+        while stack:
+            node, parent_store = stack.pop()
+            if node is self.root:
+                store = self._root_store
+            elif node is self.head:
+                store = self._head_store
+            else:
+                delta = node.delta
+                cached = not delta.recomputable or bool(delta.own_buffers())
+                store = delta.apply(parent_store)
+                if not cached:
+                    delta.evict()
+            yield node, parent_store, store
+            stack.extend((child, store) for child in reversed(node.children))
+
+    def spill_all(self) -> int:
+        """
+        Move every column buffer held in RAM, including those of the current and original
+        versions, to memory-mapped files. The data stays readable and is paged in by the OS
+        on access. Return bytes freed.
+        """
+        freed = 0
+        files = itertools.count()
+
+        def spill(buf: np.ndarray) -> np.ndarray:
+            nonlocal freed
+            if isinstance(buf, np.memmap):
+                return buf
+            path = self._spill_path(-1, next(files))
+            np.save(path, buf)
+            freed += buf.nbytes
+            return np.load(path, mmap_mode='r')
+
+        for node in self._nodes.values():
+            if node.delta is not None and node.delta.recomputable:
+                node.delta.evict()
+        self._map_buffers(spill)
+        self._spilled_bytes += freed
+        return freed
+
+    def page_in(self) -> int:
+        """Load spilled buffers of the current and original versions back into RAM. Return bytes loaded."""
+        keep = self._protected_keys()
+        loaded, files = 0, []
+
+        def load(buf: np.ndarray) -> np.ndarray:
+            nonlocal loaded
+            if buffer_key(buf) not in keep or not self._is_spilled(buf):
+                return buf
+            loaded += buf.nbytes
+            files.append(buf.filename)
+            return np.array(buf)
+
+        self._map_buffers(load)
+        for path in files:
+            try:
+                os.remove(path)
+            except OSError:
+                # still mapped (e.g. on Windows), removed with the spill directory
+                pass
+        self._spilled_bytes = max(0, self._spilled_bytes - loaded)
+        self.enforce_budget()
+        return loaded
+
+    def resident_bytes(self) -> int:
+        """Bytes of all column data held in RAM (memory-mapped buffers excluded), shared buffers counted once."""
+        buffers = {buffer_key(buf): buf for buf in self._buffers() if not isinstance(buf, np.memmap)}
+        return sum(buf.nbytes for buf in buffers.values())
+
+    def ram_bytes(self) -> int:
+        """Bytes of version data held in RAM, not counting the current and original versions."""
+        keep = self._protected_keys()
+        return sum(
+            buf.nbytes for node in self._nodes.values() if node.delta is not None
+            for buf in node.delta.own_buffers()
+            if not isinstance(buf, np.memmap) and buffer_key(buf) not in keep
+        )
+
+    def enforce_budget(self) -> None:
+        """Evict cached columns, then spill own buffers of least recently used versions until under budget."""
+        used = self.ram_bytes()
+        if used <= self.ram_budget:
+            return
+        keep = self._protected_keys()
+        candidates = sorted(
+            (node for node in self._nodes.values() if node.delta is not None and node is not self.head),
+            key=lambda node: node.last_access
+        )
+        for node in candidates:
+            if used <= self.ram_budget:
+                return
+            if node.delta.recomputable:
+                used -= sum(buf.nbytes for buf in node.delta.own_buffers() if buffer_key(buf) not in keep)
+                node.delta.evict()
+        for node in candidates:
+            if used <= self.ram_budget:
+                return
+            if not node.delta.recomputable:
+                freed = node.delta.spill(lambda i, node=node: self._spill_path(node.id, i), keep)
+                self._spilled_bytes += freed
+                used -= freed
+
+    def _buffers(self):
+        """All column buffers held by the history."""
+        for store in (self._root_store, self._head_store):
+            for i in range(store.n_cols):
+                yield store.column(i)
+        for node in self._nodes.values():
+            if node.delta is not None:
+                yield from node.delta.own_buffers()
+
+    def _map_buffers(self, func: Callable[[np.ndarray], np.ndarray]) -> None:
+        """Replace every buffer with func(buffer), buffers shared between versions stay shared."""
+        memo = {}
+
+        def mapped(buf: np.ndarray) -> np.ndarray:
+            key = buffer_key(buf)
+            if key not in memo:
+                # the source buffer is kept in memo so its address is not reused meanwhile
+                memo[key] = (buf, func(buf))
+            return memo[key][1]
+
+        self._root_store = self._root_store.map_buffers(mapped)
+        self._head_store = self._head_store.map_buffers(mapped)
+        for node in self._nodes.values():
+            delta = node.delta
+            if isinstance(delta, ColumnDelta):
+                delta.sources = [src if isinstance(src, int) else mapped(src) for src in delta.sources]
+            elif isinstance(delta, TransformDelta) and delta.cached is not None:
+                delta.cached = mapped(delta.cached)
+            elif isinstance(delta, RowDropDelta) and delta.cached is not None:
+                delta.cached = delta.cached.map_buffers(mapped)
+
+    def _is_spilled(self, buf: np.ndarray) -> bool:
+        """True if buf is memory-mapped from a file this history spilled."""
+        return (isinstance(buf, np.memmap) and self._spill_dir is not None and buf.filename is not None
+                and os.path.dirname(buf.filename) == os.path.abspath(self._spill_dir))
+
+    def _protected_keys(self) -> set:
+        """Buffers used by the current and original versions are never evicted."""
+        return {buffer_key(store.column(i)) for store in (self._head_store, self._root_store)
+                for i in range(store.n_cols)}
+
+    def _spill_path(self, node_id: int, col: int) -> str:
+        if self._spill_dir is None:
+            self._spill_dir = tempfile.mkdtemp(prefix="matstat_versions_")
+            weakref.finalize(self, shutil.rmtree, self._spill_dir, True)
+        return os.path.join(self._spill_dir, f"v{node_id}_col{col}_{time.monotonic_ns()}.npy")
+
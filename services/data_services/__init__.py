@@ -1,4 +1,7 @@
 from .data_version_manager import DataVersionManager
 from .data_loader.data_loader_service import DataLoaderService
+from .data_loader.data_cache import DataCache
+from .data_loader.load_worker import DataLoadWorker, DirectoryLoadWorker
 from .data_exporter import DataExporter
-from .data_saver import DataSaver
\ No newline at end of file
+from .data_saver import DataSaver
+from .workspace_service import WorkspaceService
\ No newline at end of file
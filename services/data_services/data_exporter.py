@@ -1,40 +1,150 @@
-from io import BytesIO
+import bz2
+import gzip
+import io
+import lzma
 import pandas as pd
 import numpy as np
 import os
+import zipfile
 from abc import ABC, abstractmethod
+from typing import BinaryIO, Optional
+
+CHUNK_ROWS = 100_000
 
 
 class IExporter(ABC):
+    """
+    Writes a DataFrame to a binary file handle. Implementations stream the data
+    in chunks of CHUNK_ROWS rows, so memory use does not grow with the data size.
+    """
     extension: str
+    # whether the output can be written through a compressing stream (gzip/xz/bz2)
+    compressible: bool = True
     @staticmethod
     @abstractmethod
-    def export(data: pd.DataFrame) -> BytesIO:
+    def export(data: pd.DataFrame, file: BinaryIO) -> None:
         pass
 
 class CSVExporter(IExporter):
     extension = "csv"
     @staticmethod
-    def export(data: pd.DataFrame) -> BytesIO:
-        buffer = BytesIO()
-        data.to_csv(buffer, index=False)
-        buffer.seek(0)
-        return buffer
+    def export(data: pd.DataFrame, file: BinaryIO) -> None:
+        text = io.TextIOWrapper(file, encoding="utf-8", newline="")
+        try:
+            for start in range(0, max(len(data), 1), CHUNK_ROWS):
+                data.iloc[start:start + CHUNK_ROWS].to_csv(text, index=False, header=start == 0)
+            text.flush()
+        finally:
+            text.detach()
+
+
+def _write_npy_header(file: BinaryIO, dtype: np.dtype, shape: tuple) -> None:
+    header = {'descr': np.lib.format.dtype_to_descr(dtype), 'fortran_order': False, 'shape': shape}
+    try:
+        np.lib.format.write_array_header_1_0(file, header)
+    except ValueError:
+        # header of a very wide structured array does not fit into format 1.0
+        np.lib.format.write_array_header_2_0(file, header)
+
+
+class NpyExporter(IExporter):
+    """
+    Writes a NumPy .npy file holding a structured array with one field per column,
+    so column names survive the round trip.
+    Left uncompressed, since the loader memory-maps it.
+    """
+    extension = "npy"
+    compressible = False
+    @staticmethod
+    def export(data: pd.DataFrame, file: BinaryIO) -> None:
+        names = [str(col) for col in data.columns]
+        dtype = np.dtype([(name, data[col].dtype) for name, col in zip(names, data.columns)])
+        _write_npy_header(file, dtype, (len(data),))
+        for start in range(0, len(data), CHUNK_ROWS):
+            chunk = data.iloc[start:start + CHUNK_ROWS]
+            rows = np.empty(len(chunk), dtype=dtype)
+            for name, col in zip(names, data.columns):
+                rows[name] = chunk[col].to_numpy()
+            file.write(rows.tobytes())
+
+
+class NpzExporter(IExporter):
+    """
+    Writes an uncompressed NumPy .npz archive with one array per column, named after it.
+    Uncompressed members can be memory-mapped by the loader without reading the file.
+    """
+    extension = "npz"
+    compressible = False
+    @staticmethod
+    def export(data: pd.DataFrame, file: BinaryIO) -> None:
+        with zipfile.ZipFile(file, mode="w", compression=zipfile.ZIP_STORED, allowZip64=True) as archive:
+            for col in data.columns:
+                values = data[col].to_numpy()
+                with archive.open(f"{col}.npy", mode="w", force_zip64=True) as member:
+                    _write_npy_header(member, values.dtype, values.shape)
+                    for start in range(0, len(values), CHUNK_ROWS):
+                        member.write(np.ascontiguousarray(values[start:start + CHUNK_ROWS]).tobytes())
 
 
 class DataExporter:
+    exporters: dict[str, type[IExporter]] = {
+        CSVExporter.extension: CSVExporter,
+        NpyExporter.extension: NpyExporter,
+        NpzExporter.extension: NpzExporter,
+    }
+    compressors = {
+        "gz": gzip.open,
+        "xz": lzma.open,
+        "bz2": bz2.open,
+    }
+
     @classmethod
-    def export(cls, name: str, data: np.ndarray|pd.DataFrame, exporter_cls: IExporter = CSVExporter, out_dir: str = "data/simulated_data") -> str:
+    def get_exporter(cls, extension: str) -> type[IExporter]:
+        """Return exporter class registered for the file extension (e.g. 'csv')."""
+        extension = extension.lower().lstrip('.')
+        if extension not in cls.exporters:
+            raise ValueError(f"Unsupported export format: {extension}")
+        return cls.exporters[extension]
+
+    @classmethod
+    def get_formats(cls) -> list[str]:
+        """Return all export formats as extensions, compressed variants included (e.g. 'csv.gz')."""
+        formats = []
+        for extension, exporter_cls in cls.exporters.items():
+            formats.append(extension)
+            if exporter_cls.compressible:
+                formats.extend(f"{extension}.{compression}" for compression in cls.compressors)
+        return formats
+
+    @classmethod
+    def parse_format(cls, fmt: str) -> tuple[type[IExporter], Optional[str]]:
+        """
+        Split export format like 'csv.gz' into exporter class and compression.
         """
-        Export data to file
+        extension, _, compression = fmt.lower().lstrip('.').partition('.')
+        if compression and compression not in cls.compressors:
+            raise ValueError(f"Unsupported compression: {compression}")
+        return cls.get_exporter(extension), compression or None
+
+    @classmethod
+    def export(cls, name: str, data: np.ndarray|pd.DataFrame, exporter_cls: IExporter = CSVExporter,
+               out_dir: str = "data/simulated_data", compression: Optional[str] = None) -> str:
+        """
+        Export data to file. Rows are streamed to the file in chunks.
         Args:
             name: data name
             data: ndarray (1D or 2D)
             exporter_cls: class for data exporting
             out_dir: directory to save file
+            compression: optional 'gz', 'xz' or 'bz2' to compress the file on the fly
         Returns:
             str: path to saved file
         """
+        if compression and compression not in cls.compressors:
+            raise ValueError(f"Unsupported compression: {compression}")
+        if compression and not exporter_cls.compressible:
+            raise ValueError(f"{exporter_cls.extension} files can not be compressed")
+
         if isinstance(data, pd.DataFrame):
             df = data
             n_cols = data.shape[1]
@@ -49,15 +159,21 @@ class DataExporter:
                 raise ValueError(f"Unsupported array dimensionality: {data.ndim}D. Only 1D and 2D arrays are supported.")
         else:
             raise TypeError("Data must be either a pandas DataFrame or numpy ndarray.")
-        
-        buffer = exporter_cls.export(df)
 
         filename = f"{name.lower()}_({n_cols},{len(df)}).{exporter_cls.extension}"
+        if compression:
+            filename += f".{compression}"
         out_dir = os.path.normpath(out_dir)
         filepath = os.path.join(out_dir, filename)
 
         os.makedirs(out_dir, exist_ok=True)
-        with open(filepath, "wb") as f:
-            f.write(buffer.getvalue())
+        open_file = cls.compressors[compression] if compression else open
+        try:
+            with open_file(filepath, "wb") as f:
+                exporter_cls.export(df, f)
+        except Exception:
+            if os.path.exists(filepath):
+                os.remove(filepath)
+            raise
 
         return filepath
\ No newline at end of file
@@ -1,4 +1,4 @@
-from .load_strategy import TextLoader, CSVLoader, ExcelLoader
+from .load_strategy import TextLoader, CSVLoader, ExcelLoader, NumpyLoader
 
 loaders = {
     '.txt': TextLoader(),
@@ -8,4 +8,6 @@ loaders = {
     # Можете додати інші розширення які теж мають оброблятися як текст
     '.dat': TextLoader(),
     '.data': TextLoader(),
+    '.npy': NumpyLoader(),
+    '.npz': NumpyLoader(),
 }
\ No newline at end of file
@@ -0,0 +1,194 @@
+import os
+import sys
+import json
+import time
+import shutil
+import hashlib
+from typing import Optional
+import numpy as np
+import pandas as pd
+
+APP_NAME = "MatStat-Analytics"
+
+
+def user_cache_dir() -> str:
+    """Per-user cache directory of the application, independent of the working directory."""
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.join(os.path.expanduser("~"), "AppData", "Local")
+    elif sys.platform == "darwin":
+        base = os.path.join(os.path.expanduser("~"), "Library", "Caches")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, APP_NAME)
+
+
+DEFAULT_CACHE_DIR = user_cache_dir()
+DEFAULT_MAX_BYTES = 4 * 1024 ** 3
+DEFAULT_MIN_FILE_SIZE = 1024 ** 2
+HASH_BLOCK_SIZE = 64 * 1024
+META_FILE = "meta.json"
+
+
+class DataCache:
+    """
+    On-disk cache of parsed datasets.
+    Each entry is a directory with one memory-mappable .npy file per column and a small
+    JSON header (column names, shape, size, last access time).
+    Entries are keyed by file path, size, mtime and a sampled content hash, and the
+    least recently used ones are evicted once the cache grows over max_bytes.
+    """
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES,
+                 min_file_size: int = DEFAULT_MIN_FILE_SIZE):
+        """
+        Args:
+            cache_dir: directory to keep cache entries in
+            max_bytes: size limit of the whole cache
+            min_file_size: files smaller than this are not cached (parsing them is cheaper)
+        """
+        self.cache_dir = os.path.normpath(cache_dir)
+        self.max_bytes = max_bytes
+        self.min_file_size = min_file_size
+
+    def get(self, path: str, columns: Optional[list[int]] = None) -> Optional[pd.DataFrame]:
+        """
+        Return cached parsed data for the file, or None on a cache miss.
+        Columns are memory-mapped read-only, so no parsing or copying happens here.
+        Args:
+            path: path to the file
+            columns: optional positions of columns in the file; those dropped from the cached
+                data (e.g. all-NaN columns) are left out, a miss if none of them is cached
+        """
+        try:
+            key = self._make_key(path)
+            if key is None:
+                return None
+            entry_dir = os.path.join(self.cache_dir, key)
+            meta = self._read_meta(entry_dir)
+            if meta is None:
+                return None
+
+            stored = range(len(meta['columns']))
+            if columns:
+                positions = meta.get('positions')
+                if positions is None:
+                    return None
+                stored = [positions.index(c) for c in columns if c in positions]
+                if not stored:
+                    return None
+            names = [meta['columns'][i] for i in stored]
+            data = {
+                name: np.load(os.path.join(entry_dir, f"col_{i}.npy"), mmap_mode='r')
+                for i, name in zip(stored, names)
+            }
+            meta['last_access'] = time.time()
+            self._write_meta(entry_dir, meta)
+            df = pd.DataFrame(data, columns=names, copy=False)
+            df.attrs.update(meta.get('attrs', {}))
+            return df
+        except Exception as e:
+            print(f"[DataCache] Failed to read cache for {path}: {e}")
+            return None
+
+    def put(self, path: str, df: pd.DataFrame, positions: Optional[list[int]] = None) -> None:
+        """
+        Store parsed data for the file and evict old entries if the cache is over its limit.
+        Args:
+            path: path to the file
+            df: parsed data
+            positions: positions in the file of the columns of df (if some were dropped),
+                needed to serve projections of the file from the cache
+        """
+        try:
+            key = self._make_key(path)
+            if key is None:
+                return
+            nbytes = int(sum(df[col].to_numpy().nbytes for col in df.columns))
+            if nbytes > self.max_bytes:
+                return
+
+            entry_dir = os.path.join(self.cache_dir, key)
+            tmp_dir = f"{entry_dir}.tmp{os.getpid()}"
+            os.makedirs(tmp_dir, exist_ok=True)
+            for i, col in enumerate(df.columns):
+                np.save(os.path.join(tmp_dir, f"col_{i}.npy"), df[col].to_numpy())
+            self._write_meta(tmp_dir, {
+                'source': os.path.abspath(path),
+                'columns': [str(col) for col in df.columns],
+                'positions': list(range(df.shape[1])) if positions is None else [int(i) for i in positions],
+                'shape': list(df.shape),
+                'nbytes': nbytes,
+                'attrs': df.attrs,
+                'last_access': time.time()
+            })
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            os.replace(tmp_dir, entry_dir)
+            self._evict(keep=key, source=os.path.abspath(path))
+        except Exception as e:
+            print(f"[DataCache] Failed to cache {path}: {e}")
+
+    def clear(self) -> None:
+        """Remove all cache entries."""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def total_bytes(self) -> int:
+        """Return the size of all cached data in bytes."""
+        return sum(meta['nbytes'] for _, meta in self._entries())
+
+    def _evict(self, keep: str, source: str) -> None:
+        """
+        Drop stale entries of the same source file, then remove least recently
+        used entries until the cache fits into max_bytes.
+        """
+        entries = sorted(self._entries(), key=lambda entry: entry[1]['last_access'])
+        total = sum(meta['nbytes'] for _, meta in entries)
+        for key, meta in entries:
+            if key == keep:
+                continue
+            if total <= self.max_bytes and meta.get('source') != source:
+                continue
+            shutil.rmtree(os.path.join(self.cache_dir, key), ignore_errors=True)
+            total -= meta['nbytes']
+
+    def _entries(self) -> list[tuple[str, dict]]:
+        """Return (key, meta) for every complete cache entry."""
+        if not os.path.isdir(self.cache_dir):
+            return []
+        entries = []
+        for key in os.listdir(self.cache_dir):
+            if '.tmp' in key:
+                continue
+            meta = self._read_meta(os.path.join(self.cache_dir, key))
+            if meta is not None:
+                entries.append((key, meta))
+        return entries
+
+    def _make_key(self, path: str) -> Optional[str]:
+        """
+        Build cache key from path, size, mtime and a content hash.
+        The hash covers the first, middle and last blocks of the file so that keying
+        a multi-GB file stays cheap; size and mtime catch the remaining edits.
+        """
+        stat = os.stat(path)
+        if stat.st_size < self.min_file_size:
+            return None
+
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{os.path.abspath(path)}|{stat.st_size}|{stat.st_mtime_ns}".encode())
+        with open(path, 'rb') as file:
+            for offset in (0, stat.st_size // 2, max(0, stat.st_size - HASH_BLOCK_SIZE)):
+                file.seek(offset)
+                digest.update(file.read(HASH_BLOCK_SIZE))
+        return digest.hexdigest()
+
+    @staticmethod
+    def _read_meta(entry_dir: str) -> Optional[dict]:
+        try:
+            with open(os.path.join(entry_dir, META_FILE), 'r') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _write_meta(entry_dir: str, meta: dict) -> None:
+        with open(os.path.join(entry_dir, META_FILE), 'w') as file:
+            json.dump(meta, file)
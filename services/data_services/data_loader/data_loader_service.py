@@ -1,16 +1,35 @@
 import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from services.data_services.data_loader import loaders
+from services.data_services.data_loader.data_cache import DataCache
+from services.data_services.data_loader.numeric_coercion import coerce_numeric, is_numeric_array, COERCED_ATTR
+from models.column_store import column_buffer, storage_dtype
 from utils.helpers import validate_feature_names
-from typing import Optional
+from typing import Callable, Optional
+import numpy as np
 import pandas as pd
 
+
+class LoadCancelledError(Exception):
+    """Raised from a progress callback to abort loading a file."""
+
+
+def _load_in_worker(service: "DataLoaderService", path: str) -> Optional[pd.DataFrame]:
+    """Process pool entry point: load a single file with a copy of the service."""
+    return service.load_data(path)
+
 class DataLoaderService:
     """
     Service for loading and processing data files.
     Uses strategy pattern for different file types.
     """
-    def __init__(self):
-        self._loaders = loaders 
+    def __init__(self, cache: Optional[DataCache] = None):
+        """
+        Args:
+            cache: optional on-disk cache of parsed files
+        """
+        self._loaders = loaders
+        self.cache: Optional[DataCache] = cache
 
     def register_loader(self, extension: str, loader) -> None:
         """
@@ -25,13 +44,22 @@ class DataLoaderService:
         """Get list of supported file extensions."""
         return list(self._loaders.keys())
     
-    def load_data(self, path: str) -> Optional[pd.DataFrame]:
+    def load_data(self, path: str, progress_callback: Optional[Callable[[int, int], None]] = None,
+                  dtype=None, **load_options) -> Optional[pd.DataFrame]:
         """
         Load numerical data from file.
         Args:
             path: path to the selected file
+            progress_callback: optional, called with (bytes read, file size) while reading;
+                raise LoadCancelledError from it to abort loading
+            dtype: storage dtype of the returned columns (float64 or float32), numeric columns
+                are left as parsed if None; loaders with `parses_dtype` parse straight into it
+            load_options: loader specific options (e.g. sheet, min_col, max_col for Excel);
+                `columns` (positions from get_columns) restricts parsing to those columns
         Return:
             pandas DataFrame with valid numeric data, or None on error
+        Raises:
+            LoadCancelledError: if loading was cancelled by progress_callback
         """
         try:
             file_extension = os.path.splitext(path)[1].lower()
@@ -40,11 +68,32 @@ class DataLoaderService:
                 raise ValueError(f"Unsupported file type: {file_extension}")
             
             loader = self._loaders[file_extension]
-            df = loader.load(path)
+            columns = load_options.get('columns')
+            dtype = None if dtype is None else storage_dtype(dtype)
+            # the cache holds whole files at full precision: a projection of a cached file is
+            # free, but a projected or single precision parse is not cached
+            use_cache = (self.cache is not None and getattr(loader, 'cacheable', True)
+                         and set(load_options) <= {'columns'})
+            if use_cache:
+                cached = self.cache.get(path, columns)
+                if cached is not None:
+                    return self.as_dtype(cached, dtype)
 
-            df = self.process_dataframe(df)
-            return df
+            narrow = dtype is not None and dtype != np.float64 and getattr(loader, 'parses_dtype', False)
+            if narrow:
+                df = loader.load(path, progress_callback, dtype=dtype, **load_options)
+            else:
+                df = loader.load(path, progress_callback, **load_options)
+
+            df, positions = self._process_dataframe(df)
+            if df.attrs.get(COERCED_ATTR):
+                print(f"Cells coerced to NaN in {path}: {df.attrs[COERCED_ATTR]}")
+            if use_cache and not columns and not narrow:
+                self.cache.put(path, df, positions)
+            return self.as_dtype(df, dtype)
 
+        except LoadCancelledError:
+            raise
         except FileNotFoundError:
             print(f"File not found: {path}")
             return None
@@ -58,14 +107,124 @@ class DataLoaderService:
             print(f"Unexpected error loading file: {str(e)}")
             return None
         
+    def load_directory(
+        self,
+        dir_path: str,
+        max_workers: Optional[int] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> tuple[list[tuple[str, pd.DataFrame]], list[str]]:
+        """
+        Load every supported file in a directory on a process pool.
+        Args:
+            dir_path: path to the directory
+            max_workers: number of worker processes (defaults to the number of CPUs)
+            progress_callback: called with (files done, files total) after each file;
+                raise LoadCancelledError from it to abort loading (files not started are dropped)
+        Return:
+            (loaded, failed): list of (path, DataFrame) pairs in file name order
+            and list of paths that could not be loaded
+        Raises:
+            LoadCancelledError: if loading was cancelled by progress_callback
+        """
+        paths = self.get_supported_files(dir_path)
+        if not paths:
+            return [], []
+
+        results: dict[str, Optional[pd.DataFrame]] = {}
+        workers = min(max_workers or os.cpu_count() or 1, len(paths))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(_load_in_worker, self, path): path for path in paths}
+            try:
+                for done, future in enumerate(as_completed(futures), start=1):
+                    path = futures[future]
+                    try:
+                        results[path] = future.result()
+                    except Exception as e:
+                        print(f"Unexpected error loading file: {str(e)}")
+                        results[path] = None
+                    if progress_callback:
+                        progress_callback(done, len(paths))
+            except LoadCancelledError:
+                # only the files already being parsed are waited for
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+
+        loaded = [(path, results[path]) for path in paths
+                  if results[path] is not None and not results[path].empty]
+        failed = [path for path in paths if results[path] is None or results[path].empty]
+        return loaded, failed
+
+    def get_columns(self, path: str, **load_options) -> list[str]:
+        """
+        Return column names of the file from a quick scan of its header and first rows,
+        or an empty list if the loader can not tell them without parsing the file.
+        Args:
+            path: path to the file
+            load_options: loader options affecting the layout (e.g. sheet for Excel)
+        """
+        loader = self._loaders.get(os.path.splitext(path)[1].lower())
+        try:
+            return loader.get_columns(path, **load_options)
+        except NotImplementedError:
+            return []
+        except Exception as e:
+            print(f"Failed to read columns of {path}: {str(e)}")
+            return []
+
+    def get_sheet_names(self, path: str) -> list[str]:
+        """
+        Return sheet names for workbook files, or an empty list for other file types.
+        """
+        loader = self._loaders.get(os.path.splitext(path)[1].lower())
+        if not hasattr(loader, 'get_sheet_names'):
+            return []
+        try:
+            return loader.get_sheet_names(path)
+        except Exception as e:
+            print(f"Failed to read sheet names of {path}: {str(e)}")
+            return []
+
+    def get_supported_files(self, dir_path: str) -> list[str]:
+        """
+        Return sorted paths of all files with a supported extension in the directory.
+        """
+        return sorted(
+            entry.path for entry in os.scandir(dir_path)
+            if entry.is_file() and os.path.splitext(entry.name)[1].lower() in self._loaders
+        )
+
     @staticmethod
     def process_dataframe(df: pd.DataFrame) -> pd.DataFrame:       
-        df = df.apply(pd.to_numeric, errors='coerce')
-        df = df.dropna(axis=1, how='all')
+        """
+        Coerce all columns to numbers, drop empty columns and give columns valid names.
+        Columns that are already numeric are kept as is, so memory-mapped data is not copied.
+        The result has df.attrs[COERCED_ATTR]: {column name: number of non-empty cells
+        coerced to NaN} for columns where that happened (including what the loader reported).
+        """
+        return DataLoaderService._process_dataframe(df)[0]
+
+    @staticmethod
+    def _process_dataframe(df: pd.DataFrame) -> tuple[pd.DataFrame, list[int]]:
+        """process_dataframe, also returning the positions in df of the columns that were kept."""
+        coerced = list(df.attrs.get(COERCED_ATTR, []))
+        coerced.extend([0] * (df.shape[1] - len(coerced)))
+        non_numeric = [i for i in range(df.shape[1]) if not is_numeric_array(df.iloc[:, i].to_numpy())]
+        if non_numeric:
+            df = df.copy(deep=False)
+            for i in non_numeric:
+                values, coerced_mask = coerce_numeric(df.iloc[:, i].to_numpy())
+                df.isetitem(i, values)
+                coerced[i] += int(np.count_nonzero(coerced_mask))
+
+        keep = [i for i in range(df.shape[1]) if not DataLoaderService._is_all_nan(df.iloc[:, i])]
+        if len(keep) < df.shape[1]:
+            df = df.iloc[:, keep]
+            coerced = [coerced[i] for i in keep]
         if df.empty:
             raise ValueError("No valid numerical data found")
         
-        df = df.reset_index(drop=True)
+        if not df.index.equals(pd.RangeIndex(len(df))):
+            df = df.reset_index(drop=True)
         if df.columns.isnull().any() or not validate_feature_names(list(df.columns)):
             if df.shape[1] == 1:
                 df.columns = ["x"]
@@ -75,7 +234,35 @@ class DataLoaderService:
                     new_names.append(f"x{i+1}")
                 df.columns = new_names
 
-        return df
+        df.attrs[COERCED_ATTR] = {str(col): n for col, n in zip(df.columns, coerced) if n}
+        return df, keep
+
+    @staticmethod
+    def as_dtype(df: pd.DataFrame, dtype=None) -> pd.DataFrame:
+        """
+        Return df with numeric columns stored as contiguous arrays of dtype.
+        Columns that already are such arrays are wrapped without copying; df is returned
+        as is if dtype is None.
+        """
+        if dtype is None:
+            return df
+        buffers = [column_buffer(df.iloc[:, i].to_numpy(), dtype) for i in range(df.shape[1])]
+        result = pd.DataFrame(dict(enumerate(buffers)), copy=False)
+        result.columns = df.columns
+        result.attrs.update(df.attrs)
+        return result
+
+    @staticmethod
+    def _is_all_nan(column: pd.Series) -> bool:
+        values = column.to_numpy()
+        if len(values) == 0:
+            return True
+        if values.dtype.kind in 'iub':
+            return False
+        # a valid first value settles it without scanning the whole column
+        if values.dtype.kind == 'f' and not np.isnan(values[0]):
+            return False
+        return bool(column.isna().all())
 
     @staticmethod
     def select_file(parent=None) -> Optional[str]:
@@ -92,8 +279,37 @@ class DataLoaderService:
             parent,
             'Select the File',
             '',
-            'All Supported Files (*.txt *.csv *.xlsx *.xls);;'
+            'All Supported Files (*.txt *.csv *.xlsx *.xls *.npy *.npz);;'
             'Text Files (*.txt);;CSV Files (*.csv);;'
-            'Excel Files (*.xlsx *.xls);;All Files (*)'
+            'Excel Files (*.xlsx *.xls);;NumPy Files (*.npy *.npz);;All Files (*)'
         )
+        return path if path else None
+
+    @staticmethod
+    def select_sheet(sheet_names: list[str], parent=None) -> Optional[str]:
+        """
+        Let user pick a sheet of a workbook.
+
+            sheet_names: available sheet names
+            parent: parent Qt widget (optional)
+        Return:
+            selected sheet name or None if cancelled
+        """
+        from PyQt6.QtWidgets import QInputDialog
+
+        sheet, ok = QInputDialog.getItem(parent, 'Select the Sheet', 'Sheet:', sheet_names, 0, False)
+        return sheet if ok and sheet else None
+
+    @staticmethod
+    def select_directory(parent=None) -> Optional[str]:
+        """
+        Open directory dialog and let user select a folder with data files.
+
+            parent: parent Qt widget (optional)
+        Return:
+            path to selected directory or None if cancelled
+        """
+        from PyQt6.QtWidgets import QFileDialog
+
+        path = QFileDialog.getExistingDirectory(parent, 'Select the Folder', '')
         return path if path else None
\ No newline at end of file
@@ -0,0 +1,104 @@
+import re
+from dataclasses import dataclass, field
+from typing import Optional
+
+_NUMBER = re.compile(r'^[+-]?(\d+([.,]\d*)?|[.,]\d+)([eE][+-]?\d+)?$')
+_FIELD_SEPARATORS = re.compile(r'[;\t,\s]+')
+
+
+@dataclass
+class ParseOptions:
+    """Explicit parse options for a delimited numeric text file."""
+    delimiter: Optional[str] = None     # None means any whitespace
+    decimal: str = '.'
+    header: bool = False
+    n_cols: int = 0
+    column_names: list[str] = field(default_factory=list)
+
+    def translation_table(self) -> dict:
+        """Build str.translate table that turns text into space-separated tokens."""
+        table = {ord('\r'): ' ', ord('\x1a'): ' '}
+        if self.delimiter:
+            table[ord(self.delimiter)] = ' '
+        if self.decimal != '.':
+            table[ord(self.decimal)] = '.'
+        return table
+
+
+class FormatSniffer:
+    """
+    Format detection stage shared by the text based loaders.
+    Looks only at the first SAMPLE_SIZE bytes of a file and decides delimiter,
+    decimal separator, header presence and column count, so that loaders can
+    parse the file once with explicit options instead of trying several parses.
+    """
+    SAMPLE_SIZE = 64 * 1024
+    SAMPLE_LINES = 50
+
+    @classmethod
+    def sniff(cls, path: str, prefer_delimiter: Optional[str] = None) -> ParseOptions:
+        """
+        Detect parse options of a file from its beginning.
+        Args:
+            path: path to the file
+            prefer_delimiter: ',' to read ambiguous comma separated numbers ("1,5")
+                as two columns instead of one number with a decimal comma
+        """
+        with open(path, 'r', encoding='latin-1', newline='') as file:
+            sample = file.read(cls.SAMPLE_SIZE)
+            truncated = bool(file.read(1))
+        return cls.sniff_text(sample, prefer_delimiter, truncated)
+
+    @classmethod
+    def sniff_text(cls, sample: str, prefer_delimiter: Optional[str] = None,
+                   truncated: bool = False) -> ParseOptions:
+        """
+        Detect parse options from the beginning of a file.
+        Args:
+            sample: first part of the file
+            prefer_delimiter: see sniff()
+            truncated: True if the file continues after sample (its last line may be cut)
+        """
+        lines = sample.splitlines()
+        if truncated and len(lines) > 1:
+            lines = lines[:-1]
+        lines = [line for line in lines[:cls.SAMPLE_LINES + 1] if line.strip()]
+
+        header_line = None
+        if len(lines) > 1 and not cls._is_numeric_line(lines[0]) and cls._is_numeric_line(lines[1]):
+            header_line, lines = lines[0], lines[1:]
+
+        options = ParseOptions(header=header_line is not None)
+        options.delimiter, options.decimal = cls._detect_separators(lines[:cls.SAMPLE_LINES], prefer_delimiter)
+
+        options.n_cols = max((cls._count_fields(line, options) for line in lines), default=0)
+        if header_line is not None:
+            names = header_line.split(options.delimiter) if options.delimiter else header_line.split()
+            options.column_names = [name.strip().strip('"\'') for name in names]
+        return options
+
+    @staticmethod
+    def _detect_separators(lines: list[str], prefer_delimiter: Optional[str]) -> tuple[Optional[str], str]:
+        """Return (delimiter or None for whitespace, decimal separator)."""
+        text = '\n'.join(lines)
+        for sep in (';', '\t'):
+            if sep in text:
+                return sep, ',' if ',' in text else '.'
+        if ',' in text:
+            decimal_comma = '.' not in text and all(token.count(',') <= 1 for token in text.split())
+            if decimal_comma and prefer_delimiter != ',':
+                return None, ','
+            return ',', '.'
+        return None, '.'
+
+    @staticmethod
+    def _count_fields(line: str, options: ParseOptions) -> int:
+        """Number of fields of a data line as the loaders split it: empty fields between delimiters count."""
+        if options.delimiter:
+            return len(line.strip().split(options.delimiter))
+        return len(line.translate(options.translation_table()).split())
+
+    @staticmethod
+    def _is_numeric_line(line: str) -> bool:
+        """True if the line has at least one token that looks like a number."""
+        return any(_NUMBER.match(token) for token in _FIELD_SEPARATORS.split(line.strip()))
@@ -1,71 +1,628 @@
 from abc import ABC, abstractmethod
+from typing import Callable, Optional
+import os
+import re
+import zipfile
+import numpy as np
 import pandas as pd
+from services.data_services.data_loader.format_sniffer import FormatSniffer, ParseOptions
+from services.data_services.data_loader.numeric_coercion import coerce_numeric, COERCED_ATTR
 
 
 class FileLoader(ABC):
     """Abstract base class for file loaders."""
+    # whether parsed results are worth keeping in the on-disk DataCache
+    cacheable: bool = True
+    # whether load accepts `dtype` and parses numbers straight into that storage dtype
+    parses_dtype: bool = False
+
     @abstractmethod
-    def load(self, path: str) -> pd.DataFrame:
-        """Load data from file and return DataFrame."""
+    def load(self, path: str, progress_callback: Optional[Callable[[int, int], None]] = None) -> pd.DataFrame:
+        """
+        Load data from file and return DataFrame.
+        Args:
+            path: path to the file
+            progress_callback: optional, called with (bytes read, file size) while reading;
+                it may raise to abort loading
+        Loaders that support column projection also accept `columns`: positions of the
+        columns to parse (see get_columns).
+        """
         pass
 
+    def get_columns(self, path: str) -> list[str]:
+        """
+        Return column names of the file from a quick scan of its beginning.
+        Positions in this list are what `columns` load option refers to.
+        """
+        raise NotImplementedError
+
+
+def _default_column_names(n_cols: int) -> list[str]:
+    """Names DataLoaderService.process_dataframe gives to columns without a valid header."""
+    return ["x"] if n_cols == 1 else [f"x{i+1}" for i in range(n_cols)]
+
+
+def _projected_names(names: list[str], columns: list[int]) -> list[str]:
+    """Names of projected columns: header name if any, else name of the column position in the file."""
+    return [names[c] if c < len(names) else f"x{c+1}" for c in columns]
+
 
 class ExcelLoader(FileLoader):
-    """Loader for Excel files (.xlsx, .xls)."""
-    def load(self, path: str) -> pd.DataFrame:
-        return pd.read_excel(path)
+    """
+    Loader for Excel files (.xlsx, .xls).
+    .xlsx workbooks are opened in openpyxl read-only mode and their rows are streamed
+    straight into a float64 (or `dtype`) buffer, so the workbook object model is never built in memory.
+    Raw cells are coerced block by block with the same engine as
+    DataLoaderService.process_dataframe: anything that is not a number or a numeric
+    string becomes NaN. Legacy .xls files go through pd.read_excel.
+    """
+    BLOCK_ROWS = 10_000
+    parses_dtype = True
 
+    def load(self, path: str, progress_callback: Optional[Callable[[int, int], None]] = None,
+             sheet: str | int | None = None, min_col: Optional[int] = None,
+             max_col: Optional[int] = None, columns: Optional[list[int]] = None,
+             dtype=np.float64) -> pd.DataFrame:
+        """
+        Args:
+            path: path to the workbook
+            progress_callback: optional, called with (approximate bytes read, file size)
+            sheet: sheet name or index (first sheet by default)
+            min_col, max_col: optional 1-based inclusive range of columns to read
+            columns: optional 0-based positions of columns to read, overrides min_col/max_col
+            dtype: dtype of the parsed .xlsx values (.xls files are read by pandas as float64)
+        """
+        size = os.path.getsize(path)
+        if path.lower().endswith('.xls'):
+            df = pd.read_excel(path, sheet_name=sheet or 0, usecols=columns)
+            if (min_col or max_col) and not columns:
+                df = df.iloc[:, (min_col or 1) - 1:max_col]
+        else:
+            df = self._load_xlsx(path, size, progress_callback, sheet, min_col, max_col, columns, dtype)
+        if progress_callback:
+            progress_callback(size, size)
+        return df
 
-class CSVLoader(FileLoader):
-    """Loader for CSV files."""
-    def load(self, path: str) -> pd.DataFrame:
-        for sep in [',', ';', '\t']:
+    def get_columns(self, path: str, sheet: str | int | None = None) -> list[str]:
+        if path.lower().endswith('.xls'):
+            return [str(col) for col in pd.read_excel(path, sheet_name=sheet or 0, nrows=0).columns]
+        from openpyxl import load_workbook
+        workbook = load_workbook(path, read_only=True, data_only=True)
+        try:
+            for row in self._get_worksheet(workbook, sheet).iter_rows(values_only=True):
+                if all(cell is None for cell in row):
+                    continue
+                if self._is_header(row):
+                    return ['' if cell is None else str(cell).strip() for cell in row]
+                return _default_column_names(len(row))
+            return []
+        finally:
+            workbook.close()
+
+    @staticmethod
+    def get_sheet_names(path: str) -> list[str]:
+        """Return sheet names of the workbook."""
+        if path.lower().endswith('.xls'):
+            return list(pd.ExcelFile(path).sheet_names)
+        from openpyxl import load_workbook
+        workbook = load_workbook(path, read_only=True)
+        try:
+            return list(workbook.sheetnames)
+        finally:
+            workbook.close()
+
+    @staticmethod
+    def _get_worksheet(workbook, sheet: str | int | None):
+        if sheet is None:
+            return workbook.worksheets[0]
+        if isinstance(sheet, int):
+            return workbook.worksheets[sheet]
+        return workbook[sheet]
+
+    def _load_xlsx(self, path: str, size: int, progress_callback: Optional[Callable[[int, int], None]],
+                   sheet: str | int | None, min_col: Optional[int], max_col: Optional[int],
+                   columns: Optional[list[int]], dtype=np.float64) -> pd.DataFrame:
+        from openpyxl import load_workbook
+
+        if columns:
+            min_col, max_col = min(columns) + 1, max(columns) + 1
+            offsets = [c + 1 - min_col for c in columns]
+        workbook = load_workbook(path, read_only=True, data_only=True)
+        try:
+            worksheet = self._get_worksheet(workbook, sheet)
+            total_rows = worksheet.max_row or 0
+
+            rows = worksheet.iter_rows(min_col=min_col, max_col=max_col, values_only=True)
+            names = None
+            buffer, block, coerced = None, [], []
+            for row_idx, row in enumerate(rows, start=1):
+                if columns:
+                    row = tuple(row[i] if i < len(row) else None for i in offsets)
+                if all(cell is None for cell in row):
+                    continue
+                if names is None and buffer is None and not block and self._is_header(row):
+                    names = ['' if cell is None else str(cell).strip() for cell in row]
+                    continue
+                block.append(row)
+                if len(block) == self.BLOCK_ROWS:
+                    buffer = self._append_block(buffer, block, coerced, dtype)
+                    block = []
+                    if progress_callback and total_rows:
+                        progress_callback(min(size, size * row_idx // total_rows), size)
+            if block:
+                buffer = self._append_block(buffer, block, coerced, dtype)
+        finally:
+            workbook.close()
+
+        if buffer is None or buffer.size == 0:
+            raise ValueError("No valid data found in file")
+        df = pd.DataFrame(buffer.result())
+        if names is not None and len(names) >= df.shape[1]:
+            df.columns = names[:df.shape[1]]
+        elif columns:
+            df.columns = _projected_names([], columns)[:df.shape[1]]
+        df.attrs[COERCED_ATTR] = coerced[:df.shape[1]]
+        return df
+
+    @staticmethod
+    def _append_block(buffer: Optional['_RowBuffer'], block: list[tuple], coerced: list[int],
+                      dtype=np.float64) -> '_RowBuffer':
+        """Coerce a block of raw rows column by column and append it to the buffer (a new one of dtype if None)."""
+        n_cols = max(len(row) for row in block)
+        if buffer is None:
+            buffer = _RowBuffer(n_cols, dtype)
+        elif n_cols > buffer.n_cols:
+            buffer.widen(n_cols)
+        cells = np.full((len(block), buffer.n_cols), None, dtype=object)
+        for i, row in enumerate(block):
+            cells[i, :len(row)] = row
+        values = np.empty(cells.shape, dtype=np.float64)
+        coerced.extend([0] * (buffer.n_cols - len(coerced)))
+        for j in range(buffer.n_cols):
+            values[:, j], coerced_mask = coerce_numeric(cells[:, j])
+            coerced[j] += int(np.count_nonzero(coerced_mask))
+        buffer.append(values)
+        return buffer
+
+    @staticmethod
+    def _is_header(row: tuple) -> bool:
+        """First row is a header if it has text cells and no numeric ones."""
+        cells = [cell for cell in row if cell is not None]
+        return bool(cells) and all(
+            isinstance(cell, str) and np.isnan(ExcelLoader._to_float(cell)) for cell in cells
+        )
+
+    @staticmethod
+    def _to_float(cell) -> float:
+        if isinstance(cell, (int, float)):
+            return float(cell)
+        if isinstance(cell, str):
             try:
-                return pd.read_csv(path, sep=sep)
-            except Exception:
-                continue
-        return TextLoader().load(path)
+                return float(cell)
+            except ValueError:
+                return np.nan
+        return np.nan
 
 
-class TextLoader(FileLoader):
-    """Loader for text files with custom parsing logic."""
-    def load(self, path: str) -> pd.DataFrame:
+class CSVLoader(FileLoader):
+    """
+    Loader for CSV files.
+    Format is detected once from the beginning of the file and passed to a single
+    pd.read_csv call; files pandas can not parse go to TextLoader with the same options.
+    """
+    def load(self, path: str, progress_callback: Optional[Callable[[int, int], None]] = None,
+             columns: Optional[list[int]] = None) -> pd.DataFrame:
+        options = FormatSniffer.sniff(path, prefer_delimiter=',')
         try:
-            df = pd.read_csv(path, header=None, delim_whitespace=True)
-            if df.apply(lambda x: pd.to_numeric(x, errors='coerce').notna()).all().all():
-                return df
+            df = pd.read_csv(path, usecols=columns, **self._read_csv_args(options))
         except Exception:
-            pass
-            
+            return TextLoader().load(path, progress_callback, options, columns)
+        if columns and not options.header:
+            df.columns = _projected_names([], list(df.columns))
+        if progress_callback:
+            size = os.path.getsize(path)
+            progress_callback(size, size)
+        return df
+
+    def get_columns(self, path: str) -> list[str]:
+        """Header names and width as read by the same pd.read_csv call load makes."""
+        options = FormatSniffer.sniff(path, prefer_delimiter=',')
         try:
-            df = pd.read_csv(path, header=None)
-            return df
+            header = pd.read_csv(path, nrows=0, **self._read_csv_args(options)).columns
         except Exception:
-            pass
-        
-        with open(path, 'r') as file:
-            lines = []
-            for line in file:
-                line = line.strip().replace(",", ".")
-                if line:
-                    parts = line.split()
-                    if parts:
-                        try:
-                            row_values = [float(part) for part in parts]
-                            lines.append(row_values)
-                        except ValueError:
-                            print(f"Skipping invalid line: {line}")
-            
-            if not lines:
-                raise ValueError("No valid data found in file")
-            
-            max_cols = max(len(row) for row in lines)
-            
-            if max_cols == 1:
-                return pd.DataFrame({"data": [row[0] for row in lines]})
+            return TextLoader.columns_from_options(options)
+        if options.header:
+            return [str(name) for name in header]
+        return _default_column_names(len(header))
+
+    @staticmethod
+    def _read_csv_args(options: ParseOptions) -> dict:
+        """pd.read_csv arguments for the sniffed format."""
+        return dict(
+            sep=options.delimiter or r'\s+',
+            decimal=options.decimal,
+            header=0 if options.header else None
+        )
+
+
+class TextLoader(FileLoader):
+    """
+    Streaming loader for numeric text files (.txt, .dat).
+    The file is read once in fixed-size chunks which are parsed straight into a
+    preallocated float64 (or `dtype`) buffer, so peak memory stays close to the size of the result.
+    Handles whitespace, comma, semicolon and tab separated values and decimal commas.
+    """
+    CHUNK_SIZE = 4 * 1024 * 1024
+    parses_dtype = True
+
+    def load(self, path: str, progress_callback: Optional[Callable[[int, int], None]] = None,
+             options: Optional[ParseOptions] = None, columns: Optional[list[int]] = None,
+             dtype=np.float64) -> pd.DataFrame:
+        """
+        Args:
+            path: path to the file
+            progress_callback: optional, called with (bytes read, file size) after each chunk
+            options: parse options, detected with FormatSniffer if not given
+            columns: optional positions of columns to parse; other columns are only tokenized
+            dtype: dtype of the parsed values
+        """
+        if options is None:
+            options = FormatSniffer.sniff(path)
+        delimiter = options.delimiter
+        table = options.translation_table()
+        parse = _ChunkParser(delimiter, table, columns, options.n_cols, dtype)
+
+        total_bytes = os.path.getsize(path)
+        bytes_read = 0
+        with open(path, 'r', encoding='latin-1', newline='') as file:
+            chunk = file.read(self.CHUNK_SIZE)
+            if options.header:
+                chunk, header = self._split_header(chunk)
+                bytes_read += len(header)
+
+            if columns:
+                buffer = _RowBuffer(len(columns), dtype)
+            else:
+                buffer = _RowBuffer(options.n_cols, dtype) if options.n_cols else None
+            skipped = 0
+            tail = ''
+            while chunk:
+                chunk = tail + chunk
+                next_chunk = file.read(self.CHUNK_SIZE)
+                if next_chunk:
+                    cut = chunk.rfind('\n') + 1
+                    chunk, tail = chunk[:cut], chunk[cut:]
+                else:
+                    tail = ''
+                if chunk:
+                    buffer, n_skipped = parse(chunk, buffer)
+                    skipped += n_skipped
+                # latin-1 without newline translation: one character per byte
+                bytes_read += len(chunk)
+                if progress_callback:
+                    progress_callback(min(bytes_read, total_bytes), total_bytes)
+                chunk = next_chunk
+            if tail:
+                buffer, n_skipped = parse(tail, buffer)
+                skipped += n_skipped
+
+        if buffer is None or buffer.size == 0:
+            raise ValueError("No valid data found in file")
+        if skipped:
+            print(f"Skipped {skipped} invalid lines in {path}")
+        df = pd.DataFrame(buffer.result())
+        if columns:
+            df.columns = _projected_names(options.column_names, columns)
+        elif len(options.column_names) == df.shape[1]:
+            df.columns = options.column_names
+        df.attrs[COERCED_ATTR] = parse.coerced[:df.shape[1]]
+        return df
+
+    def get_columns(self, path: str) -> list[str]:
+        return self.columns_from_options(FormatSniffer.sniff(path))
+
+    @staticmethod
+    def columns_from_options(options: ParseOptions) -> list[str]:
+        """Column names of a text file: header names if present, else default names."""
+        if options.header and len(options.column_names) == options.n_cols:
+            return options.column_names
+        return _default_column_names(options.n_cols)
+
+    @staticmethod
+    def _split_header(chunk: str) -> tuple[str, str]:
+        """Split the first non-blank line off the chunk. Return (rest, header)."""
+        start = len(chunk) - len(chunk.lstrip())
+        end = chunk.find('\n', start)
+        if end < 0:
+            return '', chunk
+        return chunk[end + 1:], chunk[:end + 1]
+
+
+class NumpyLoader(FileLoader):
+    """
+    Loader for NumPy binary files (.npy, .npz).
+    Arrays are memory-mapped read-only and wrapped into a DataFrame without copying,
+    so opening a file takes constant time regardless of its size.
+    Column names come from structured array fields (.npy) or array names (.npz).
+    """
+    cacheable = False
+
+    def load(self, path: str, progress_callback: Optional[Callable[[int, int], None]] = None,
+             columns: Optional[list[int]] = None) -> pd.DataFrame:
+        if path.lower().endswith('.npz'):
+            data = self._load_npz(path, columns)
+        else:
+            data = self._load_npy(path, columns)
+        df = pd.DataFrame(data, copy=False)
+        if progress_callback:
+            size = os.path.getsize(path)
+            progress_callback(size, size)
+        return df
+
+    def get_columns(self, path: str) -> list[str]:
+        if path.lower().endswith('.npz'):
+            with zipfile.ZipFile(path) as archive:
+                return [self._member_name(info) for info in archive.infolist()]
+        array = np.load(path, mmap_mode='r', allow_pickle=False)
+        if array.dtype.names:
+            return list(array.dtype.names)
+        return _default_column_names(1 if array.ndim == 1 else array.shape[1])
+
+    @staticmethod
+    def _member_name(info: zipfile.ZipInfo) -> str:
+        return info.filename[:-4] if info.filename.endswith('.npy') else info.filename
+
+    @staticmethod
+    def _load_npy(path: str, selected: Optional[list[int]] = None) -> dict | np.ndarray:
+        array = np.load(path, mmap_mode='r', allow_pickle=False)
+        if array.dtype.names:
+            names = array.dtype.names
+            if selected:
+                names = [names[i] for i in selected]
+            return {name: array[name] for name in names}
+        if array.ndim not in (1, 2):
+            raise ValueError(f"Unsupported array dimensionality: {array.ndim}D")
+        if selected and array.ndim == 2:
+            # strided views of the selected columns, nothing is read yet
+            return {name: array[:, i] for name, i in zip(_projected_names([], selected), selected)}
+        return array
+
+    @classmethod
+    def _load_npz(cls, path: str, selected: Optional[list[int]] = None) -> dict:
+        columns = {}
+        with zipfile.ZipFile(path) as archive:
+            members = archive.infolist()
+            if selected:
+                members = [members[i] for i in selected]
+            for info in members:
+                name = cls._member_name(info)
+                if info.compress_type == zipfile.ZIP_STORED:
+                    array = cls._mmap_zip_member(path, info)
+                else:
+                    # compressed members (np.savez_compressed) have to be decompressed into memory
+                    with archive.open(info) as member:
+                        array = np.lib.format.read_array(member, allow_pickle=False)
+                if array.ndim != 1:
+                    raise ValueError(f"Array '{name}' in {path} is not one-dimensional")
+                columns[name] = array
+        if not columns:
+            raise ValueError("No arrays found in file")
+        return columns
+
+    @staticmethod
+    def _mmap_zip_member(path: str, info: zipfile.ZipInfo) -> np.ndarray:
+        """Memory-map an uncompressed .npy member of a zip archive in place."""
+        with open(path, 'rb') as file:
+            # local file header: 30 fixed bytes, then file name and extra field
+            file.seek(info.header_offset)
+            header = file.read(30)
+            name_len, extra_len = int.from_bytes(header[26:28], 'little'), int.from_bytes(header[28:30], 'little')
+            file.seek(info.header_offset + 30 + name_len + extra_len)
+            if np.lib.format.read_magic(file) == (1, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(file)
             else:
-                padded_lines = []
-                for row in lines:
-                    padded_row = row + [None] * (max_cols - len(row))
-                    padded_lines.append(padded_row)
-                return pd.DataFrame(padded_lines)
\ No newline at end of file
+                shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(file)
+            offset = file.tell()
+        if dtype.hasobject:
+            raise ValueError("Object arrays are not supported")
+        if 0 in shape:
+            return np.empty(shape, dtype=dtype)
+        return np.memmap(path, dtype=dtype, mode='r', offset=offset, shape=shape,
+                         order='F' if fortran_order else 'C')
+
+
+class _ChunkParser:
+    """
+    Parses chunks of whole text lines into a _RowBuffer, optionally keeping only
+    some of the columns.
+    """
+    def __init__(self, delimiter: str | None, table: dict, columns: Optional[list[int]] = None, width: int = 0,
+                 dtype=np.float64):
+        """
+        Args:
+            delimiter: column delimiter, None for whitespace
+            table: str.translate table from ParseOptions.translation_table
+            columns: positions of columns to keep, all columns if None
+            width: number of columns in the file (needed for projection)
+            dtype: dtype of buffers created by the parser
+        """
+        self.delimiter = delimiter
+        self.table = table
+        self.decimal_table = {key: val for key, val in table.items() if val != ' '}
+        self.empty_field_patterns = _empty_field_patterns(delimiter) if delimiter else []
+        self.columns = columns or None
+        self.width = width
+        self.dtype = dtype
+        self.coerced: list[int] = []    # invalid tokens per column position
+
+    def __call__(self, chunk: str, buffer: '_RowBuffer') -> tuple['_RowBuffer', int]:
+        """
+        Parse a chunk of whole lines into the buffer.
+        Tries a vectorized conversion of all tokens first, then a bulk coercion of
+        the token columns for chunks with invalid tokens, and falls back to
+        line-by-line parsing for ragged chunks and chunks with empty fields
+        (which split() would drop, shifting the following values to the left).
+        Return:
+            (buffer, number of skipped lines)
+        """
+        text = chunk.translate(self.table)
+        tokens = text.split()
+        if not tokens:
+            return buffer, 0
+
+        if buffer is not None and not any(pattern.search(chunk) for pattern in self.empty_field_patterns):
+            text = text.strip()
+            n_lines = text.count('\n') + 1 - len(_BLANK_LINE.findall(text))
+            # lines narrower than the buffer (widened by an earlier ragged chunk) are padded with NaN
+            width = self.width if self.columns else min(buffer.n_cols, len(tokens) // n_lines)
+            if width and n_lines * width == len(tokens) and _has_uniform_width(text, width, len(tokens)):
+                try:
+                    if self.columns:
+                        # only the selected columns are converted to floats
+                        values = np.column_stack([
+                            np.array(tokens[c::width], dtype=np.float64) for c in self.columns
+                        ])
+                    else:
+                        values = np.array(tokens, dtype=np.float64).reshape(n_lines, width)
+                except ValueError:
+                    return self._coerce_tokens(tokens, n_lines, width, buffer)
+                buffer.append(values)
+                return buffer, 0
+
+        return self._parse_lines(chunk, buffer)
+
+    def _coerce_tokens(self, tokens: list[str], n_lines: int, width: int,
+                       buffer: '_RowBuffer') -> tuple['_RowBuffer', int]:
+        """Convert a rectangular chunk with invalid tokens column by column, skipping non-numeric lines."""
+        positions = self.columns or range(width)
+        columns, masks = zip(*(coerce_numeric(np.array(tokens[c::width], dtype=object)) for c in positions))
+        values = np.column_stack(columns)
+        keep = ~np.isnan(values).all(axis=1)
+        if not keep.all():
+            values = values[keep]
+
+        self.coerced.extend([0] * (len(masks) - len(self.coerced)))
+        for i, mask in enumerate(masks):
+            self.coerced[i] += int(np.count_nonzero(mask & keep))
+        buffer.append(values)
+        return buffer, n_lines - len(values)
+
+    def _parse_lines(self, chunk: str, buffer: '_RowBuffer') -> tuple['_RowBuffer', int]:
+        """Slow path: parse line by line, coercing invalid tokens to NaN and skipping non-numeric lines."""
+        rows, skipped = [], 0
+        for line in chunk.splitlines():
+            line = line.replace('\x1a', ' ').strip()
+            if not line:
+                continue
+            parts = line.split(self.delimiter) if self.delimiter else line.split()
+            if self.columns:
+                parts = [parts[c] if c < len(parts) else '' for c in self.columns]
+            row, invalid = [], []
+            for i, part in enumerate(parts):
+                part = part.strip()
+                try:
+                    row.append(float(part.translate(self.decimal_table)))
+                except ValueError:
+                    row.append(np.nan)
+                    if part:
+                        invalid.append(i)
+            if all(np.isnan(value) for value in row):
+                skipped += 1
+                continue
+            rows.append(row)
+            if invalid:
+                self.coerced.extend([0] * (max(invalid) + 1 - len(self.coerced)))
+                for i in invalid:
+                    self.coerced[i] += 1
+
+        if not rows:
+            return buffer, skipped
+
+        n_cols = max(len(row) for row in rows)
+        if buffer is None:
+            buffer = _RowBuffer(n_cols, self.dtype)
+        elif n_cols > buffer.n_cols:
+            buffer.widen(n_cols)
+        block = np.full((len(rows), buffer.n_cols), np.nan)
+        for i, row in enumerate(rows):
+            block[i, :len(row)] = row
+        buffer.append(block)
+        return buffer, skipped
+
+
+_BLANK_LINE = re.compile(r'\n(?= *\n)')
+
+
+def _empty_field_patterns(delimiter: str) -> list[re.Pattern]:
+    """
+    Patterns of a field the line parser reads as empty: only blanks between two delimiters,
+    or (for a delimiter that line.strip() does not remove) between a line end and a delimiter.
+    Each pattern starts with a literal, so searching a chunk for them is a fast scan.
+    """
+    d = re.escape(delimiter)
+    blanks = '[' + re.escape(''.join(c for c in ' \t\r\f\v\x1a' if c != delimiter)) + ']*'
+    if delimiter.isspace():
+        return [re.compile(f'{d}{blanks}{d}')]
+    return [re.compile(f'{d}{blanks}(?:{d}|\n|\\Z)'), re.compile(f'\n{blanks}{d}'), re.compile(f'\\A{blanks}{d}')]
+
+
+# bytes str.split() treats as whitespace (ASCII)
+_WHITESPACE_BYTES = np.zeros(256, dtype=bool)
+_WHITESPACE_BYTES[[9, 10, 11, 12, 13, 28, 29, 30, 31, 32]] = True
+
+
+def _has_uniform_width(text: str, width: int, n_tokens: int) -> bool:
+    """
+    True if every non-blank line of text holds exactly width whitespace-separated tokens.
+    Token starts are located in the bytes at once and counted per line, so ragged lines
+    whose counts happen to add up to a whole number of rows are not reshaped into wrong rows.
+    """
+    data = np.frombuffer(text.encode(), dtype=np.uint8)
+    space = _WHITESPACE_BYTES[data]
+    starts = ~space
+    starts[1:] &= space[:-1]
+    starts = np.flatnonzero(starts)
+    if len(starts) != n_tokens:
+        # other (non-ASCII) whitespace: leave the chunk to the line by line parser
+        return False
+    # tokens before each line end, the last line ending at the end of the text
+    ends = np.append(np.flatnonzero(data == 10), len(data))
+    widths = np.diff(np.searchsorted(starts, ends), prepend=0)
+    return bool(np.all((widths == 0) | (widths == width)))
+
+
+class _RowBuffer:
+    """
+    Preallocated 2D float buffer (float64 by default) that grows geometrically as rows are appended.
+    """
+    INITIAL_CAPACITY = 1024
+
+    def __init__(self, n_cols: int, dtype=np.float64):
+        self.data = np.empty((self.INITIAL_CAPACITY, n_cols), dtype=dtype)
+        self.size = 0
+
+    @property
+    def n_cols(self) -> int:
+        return self.data.shape[1]
+
+    def append(self, rows: np.ndarray) -> None:
+        """Copy rows into the buffer (missing trailing columns become NaN), doubling its capacity when needed."""
+        end = self.size + len(rows)
+        if end > len(self.data):
+            capacity = max(end, 2 * len(self.data))
+            self.data.resize((capacity, self.n_cols), refcheck=False)
+        self.data[self.size:end, :rows.shape[1]] = rows
+        if rows.shape[1] < self.n_cols:
+            self.data[self.size:end, rows.shape[1]:] = np.nan
+        self.size = end
+
+    def widen(self, n_cols: int) -> None:
+        """Add NaN-filled columns for rows that are wider than the ones seen so far."""
+        wider = np.full((len(self.data), n_cols), np.nan, dtype=self.data.dtype)
+        wider[:self.size, :self.n_cols] = self.data[:self.size]
+        self.data = wider
+
+    def result(self) -> np.ndarray:
+        """Shrink the buffer to the filled rows and return it."""
+        self.data.resize((self.size, self.n_cols), refcheck=False)
+        return self.data
@@ -0,0 +1,106 @@
+import threading
+from typing import Any, Callable, Optional
+from PyQt6.QtCore import QObject, QThread, pyqtSignal
+from services.data_services.data_loader.data_loader_service import DataLoaderService, LoadCancelledError
+
+
+class DataLoadWorker(QObject):
+    """
+    Loads a data file and builds its model off the GUI thread.
+    Move it to a QThread (see start()) and connect to its signals:
+        progress(int): percent of the file read
+        finished(object): result of build_model, or None if the file could not be loaded
+        cancelled(): loading was cancelled by the user
+    """
+    progress = pyqtSignal(int)
+    finished = pyqtSignal(object)
+    cancelled = pyqtSignal()
+
+    def __init__(self, loader_service: DataLoaderService, path: str, build_model: Callable[[Any], Any],
+                 load_options: Optional[dict] = None):
+        """
+        Args:
+            loader_service: service used to read and parse the file
+            path: path to the data file
+            build_model: called in the worker thread with the loaded DataFrame
+            load_options: loader specific options passed to DataLoaderService.load_data
+        """
+        super().__init__()
+        self.loader_service = loader_service
+        self.path = path
+        self.build_model = build_model
+        self.load_options = load_options or {}
+        self._cancel_event = threading.Event()
+        self._last_percent = -1
+
+    def start(self) -> QThread:
+        """Create a thread, move the worker to it and start loading. Returns the thread."""
+        thread = QThread()
+        self.moveToThread(thread)
+        thread.started.connect(self.run)
+        self.finished.connect(thread.quit)
+        self.cancelled.connect(thread.quit)
+        thread.start()
+        return thread
+
+    def cancel(self) -> None:
+        """Request cancellation. Safe to call from any thread."""
+        self._cancel_event.set()
+
+    def run(self) -> None:
+        try:
+            data = self.loader_service.load_data(self.path, progress_callback=self._on_progress, **self.load_options)
+            if self._cancel_event.is_set():
+                raise LoadCancelledError(self.path)
+            model = self.build_model(data) if data is not None and not data.empty else None
+            if self._cancel_event.is_set():
+                raise LoadCancelledError(self.path)
+        except LoadCancelledError:
+            self.cancelled.emit()
+            return
+        except Exception as e:
+            print(f"Unexpected error loading file: {str(e)}")
+            model = None
+        self.finished.emit(model)
+
+    def _on_progress(self, bytes_read: int, total_bytes: int) -> None:
+        if self._cancel_event.is_set():
+            raise LoadCancelledError(self.path)
+        percent = int(100 * bytes_read / total_bytes) if total_bytes else 100
+        if percent != self._last_percent:
+            self._last_percent = percent
+            self.progress.emit(percent)
+
+
+class DirectoryLoadWorker(DataLoadWorker):
+    """
+    Loads all supported files of a directory (on the service's process pool) and builds
+    their models off the GUI thread. Same signals as DataLoadWorker, except:
+        progress(int): percent of the files loaded
+        finished(object): (models, failed): list of (path, model) pairs in file name order
+            and list of paths that could not be loaded
+    """
+    def __init__(self, loader_service: DataLoaderService, dir_path: str, build_model: Callable[[Any], Any]):
+        """
+        Args:
+            loader_service: service used to read and parse the files
+            dir_path: path to the directory
+            build_model: called in the worker thread with each loaded DataFrame
+        """
+        super().__init__(loader_service, dir_path, build_model)
+
+    def run(self) -> None:
+        try:
+            loaded, failed = self.loader_service.load_directory(self.path, progress_callback=self._on_progress)
+            models = []
+            for path, data in loaded:
+                if self._cancel_event.is_set():
+                    raise LoadCancelledError(self.path)
+                models.append((path, self.build_model(data)))
+        except LoadCancelledError:
+            self.cancelled.emit()
+            return
+        except Exception as e:
+            print(f"Unexpected error loading directory: {str(e)}")
+            models, failed = [], [self.path]
+        self.finished.emit((models, failed))
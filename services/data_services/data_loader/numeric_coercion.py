@@ -0,0 +1,85 @@
+import io
+import re
+import csv
+import numpy as np
+import pandas as pd
+
+# DataFrame.attrs key under which loaders report how many non-empty cells could not be
+# parsed and became NaN (a list per column position; DataLoaderService.process_dataframe
+# turns it into a dict per column name)
+COERCED_ATTR = 'coerced_to_nan'
+
+MAX_BAD_TOKENS = 16
+_BAD_TOKEN = re.compile(r"could not convert string to float: '(.*)'$", re.DOTALL)
+_NON_NUMBER_LINE = re.compile(r'\n[ \t]*(?![+-]?\.?\d)([^\n]*)')
+
+
+def is_numeric_array(values: np.ndarray) -> bool:
+    """True if the array already has a numeric (or boolean) dtype and needs no coercion."""
+    return values.dtype.kind in 'biuf'
+
+
+def coerce_numeric(values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Convert a column of parsed values to float64 in bulk.
+    Tries a direct cast first. If some cells are not plain numbers, the column is joined
+    into one text buffer, decimal commas are replaced with points in a single pass and the
+    buffer is parsed by the C float parser. Junk tokens are found with one regex scan and
+    passed to the parser as NA values, so only the few distinct junk tokens are ever
+    handled one by one.
+    Args:
+        values: 1D array (usually object or string dtype)
+    Return:
+        (float64 array, boolean mask of non-empty cells that were coerced to NaN)
+    """
+    if is_numeric_array(values):
+        return values, np.zeros(len(values), dtype=bool)
+
+    missing = pd.isna(values)
+    try:
+        result = values.astype(np.float64)
+    except (ValueError, TypeError):
+        missing |= values == ''
+        result = _parse_text(values)
+        result[missing] = np.nan
+
+    return result, np.isnan(result) & ~missing
+
+
+def _parse_text(values: np.ndarray) -> np.ndarray:
+    try:
+        text = '\n'.join(values)
+    except TypeError:
+        text = '\n'.join(map(str, values))
+    text = text.replace(',', '.')
+    bad_tokens = [token for token in set(_NON_NUMBER_LINE.findall('\n' + text)) if not _is_float(token)]
+    while len(bad_tokens) <= MAX_BAD_TOKENS:
+        # tokens the scan missed ("1.2.3", "12abc") are picked from the parser error
+        try:
+            result = pd.read_csv(
+                io.StringIO(text), header=None, dtype=np.float64, na_values=bad_tokens,
+                skipinitialspace=True, skip_blank_lines=False, quoting=csv.QUOTE_NONE
+            ).iloc[:, 0].to_numpy()
+        except ValueError as e:
+            match = _BAD_TOKEN.search(str(e))
+            if match is None or match.group(1) in bad_tokens:
+                break
+            bad_tokens.append(match.group(1))
+            continue
+        except pd.errors.ParserError:
+            break
+        if len(result) == len(values):
+            return result
+        break
+
+    # many distinct junk tokens or cells that do not fit on one line
+    cleaned = pd.Series(values, dtype=object).astype(str).str.strip().str.replace(',', '.', regex=False)
+    return pd.to_numeric(cleaned, errors='coerce').to_numpy(dtype=np.float64)
+
+
+def _is_float(token: str) -> bool:
+    try:
+        float(token)
+        return True
+    except ValueError:
+        return False
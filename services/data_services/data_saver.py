@@ -8,13 +8,14 @@ class DataSaver:
     def __init__(self):
         self.counter = {}
         
-    def save_data(self, dist_name: str, data: np.ndarray, type_: str = "Simulation") -> DataModel:
+    def save_data(self, dist_name: str, data: np.ndarray, type_: str = "Simulation", dtype=None) -> DataModel:
         """
         Save np.ndarray data as a new dataset.
         Args:
             dist_name: name of the distribution
             data: simulated data array (1D or 2D)
             type_: type of data (e.g. "Simulation", "Exported")
+            dtype: storage dtype of the dataset, float32 for float32 data and float64 otherwise if None
         Returns:
             data saved as DataModel
         """
@@ -27,8 +28,10 @@ class DataSaver:
         else:
             raise ValueError(f"Unsupported data dimensionality: {data.ndim}D")
         
+        if dtype is None:
+            dtype = np.float32 if data.dtype == np.float32 else np.float64
         optimal_bins = get_default_bin_count(df)
-        return DataModel(df, bins=optimal_bins, label=dataset_label)
+        return DataModel(df, bins=optimal_bins, label=dataset_label, dtype=dtype)
 
     def _create_data_label(self, dist_name: str, type_: str, n_dim: str) -> str:
         """Creates a label for newly-generated data"""
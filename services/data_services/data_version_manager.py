@@ -1,16 +1,29 @@
+import time
+
+DEFAULT_RAM_BUDGET = 2 * 1024 ** 3
+
+
 class DataVersionManager:
     """
     Manager for handling multiple datasets (DataModel instances).
     Each dataset maintains its own transformation history.
+    Datasets are kept under a RAM budget: when loaded data exceeds it, the least
+    recently used inactive datasets are spilled to memory-mapped files. Spilled
+    datasets stay in `datasets` and readable, and are paged back in on switch.
     """
-    def __init__(self):
+    def __init__(self, ram_budget: int = DEFAULT_RAM_BUDGET):
         """
         Initialize an empty dataset manager.
+        Args:
+            ram_budget: bytes of dataset data allowed in RAM (the current dataset is never spilled)
         """
         self.datasets = {}                  # {dataset_name: DataModel (current version)}
         self.columns = {}                   # {dataset_name: [str]}
         self.current_dataset_name = None    # name of active dataset
         self.current_col_name = None        # name of active dataset column
+        self.ram_budget = ram_budget
+        self._spilled: set[str] = set()     # names of datasets spilled to disk
+        self._last_access: dict[str, float] = {}
 
     def add_dataset(self, dataset_name: str, model):
         """
@@ -23,6 +36,20 @@ class DataVersionManager:
         self.columns[dataset_name] = list(model.dataframe.columns)
         self.current_dataset_name = dataset_name
         self.current_col_name = model.dataframe.columns[0]
+        self._spilled.discard(dataset_name)
+        self._touch(dataset_name)
+        self.enforce_budget()
+
+    def clear(self) -> None:
+        """
+        Remove all datasets (e.g. before opening a saved workspace).
+        """
+        self.datasets.clear()
+        self.columns.clear()
+        self.current_dataset_name = None
+        self.current_col_name = None
+        self._spilled.clear()
+        self._last_access.clear()
 
     def switch_to_dataset(self, dataset_name: str):
         """
@@ -34,6 +61,11 @@ class DataVersionManager:
             self.current_dataset_name = dataset_name
             if self.columns[dataset_name]:
                 self.current_col_name = self.columns[dataset_name][0]
+            if dataset_name in self._spilled:
+                self.datasets[dataset_name].page_in()
+                self._spilled.discard(dataset_name)
+            self._touch(dataset_name)
+            self.enforce_budget()
 
     def change_column(self, col_name: str):
         """
@@ -61,6 +93,8 @@ class DataVersionManager:
         """
         if self.current_dataset_name:
             self.datasets[self.current_dataset_name] = new_model
+            self._touch(self.current_dataset_name)
+            self.enforce_budget()
 
     def sync_columns(self, model) -> None:
         """
@@ -101,4 +135,52 @@ class DataVersionManager:
         """
         Return the name of the current column.
         """
-        return self.current_col_name or "No Column"
\ No newline at end of file
+        return self.current_col_name or "No Column"
+
+
+    def resident_bytes(self) -> int:
+        """
+        Return RAM taken by data of all datasets.
+        """
+        return sum(model.resident_nbytes for model in self.datasets.values())
+
+    def is_spilled(self, dataset_name: str) -> bool:
+        """
+        Return True if the dataset is currently spilled to disk.
+        """
+        return dataset_name in self._spilled
+
+    def enforce_budget(self) -> None:
+        """
+        Spill least recently used inactive datasets until data in RAM fits into ram_budget.
+        """
+        used = self.resident_bytes()
+        if used <= self.ram_budget:
+            return
+        candidates = sorted(
+            (name for name in self.datasets if name != self.current_dataset_name and name not in self._spilled),
+            key=lambda name: self._last_access.get(name, 0.0)
+        )
+        for name in candidates:
+            if used <= self.ram_budget:
+                break
+            try:
+                used -= self.datasets[name].spill()
+                self._spilled.add(name)
+            except OSError as e:
+                print(f"[DataVersionManager] Failed to spill dataset '{name}': {e}")
+
+    def get_memory_status(self) -> dict:
+        """
+        Return memory usage summary: names of resident and spilled datasets,
+        bytes in RAM and the budget.
+        """
+        return {
+            'resident': [name for name in self.datasets if name not in self._spilled],
+            'spilled': [name for name in self.datasets if name in self._spilled],
+            'resident_bytes': self.resident_bytes(),
+            'ram_budget': self.ram_budget
+        }
+
+    def _touch(self, dataset_name: str) -> None:
+        self._last_access[dataset_name] = time.monotonic()
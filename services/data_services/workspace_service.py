@@ -0,0 +1,380 @@
+import os
+import json
+import struct
+from typing import Any, Callable, NamedTuple, Optional
+import numpy as np
+import pandas as pd
+from models.data_model import DataModel
+from models.column_store import ColumnStore, buffer_key, new_column_version, known_fingerprint, remember_fingerprint
+from models.version_history import VersionHistory, ColumnDelta, RowDropDelta
+
+WORKSPACE_EXTENSION = ".mstw"
+FORMAT_VERSION = 1
+MAGIC = b"MSTATWS1"
+TRAILER = struct.Struct("<QQ8s")     # manifest offset, manifest length, magic
+ALIGNMENT = 64
+CHUNK_BYTES = 64 * 1024 ** 2
+
+
+class Workspace(NamedTuple):
+    datasets: dict[str, DataModel]
+    current_dataset: Optional[str]
+    current_column: Optional[str]
+    state: dict[str, Any]
+
+
+class WorkspaceService:
+    """
+    Saves and restores the whole session (all datasets with their version histories,
+    labels and bins, plus fitted model state) as one binary file.
+    The file holds raw column buffers, each stored once and 64-byte aligned, followed by
+    a JSON manifest and a fixed-size trailer pointing at it. Buffers are streamed to the
+    file in chunks on save and memory-mapped on load, so opening a workspace reads only
+    the manifest and nothing is recomputed: version deltas, column versions and known
+    fingerprints are restored as they were.
+    """
+    def save(self, path: str, datasets: dict[str, DataModel], current_dataset: Optional[str] = None,
+             current_column: Optional[str] = None, state: Optional[dict[str, Any]] = None,
+             progress_callback: Optional[Callable[[int, int], None]] = None) -> bool:
+        """
+        Write a workspace file. The file is written next to path and moved over it when
+        complete, so a workspace that is currently open (memory-mapped) can be saved over.
+        Args:
+            path: path of the workspace file
+            datasets: {dataset name: DataModel}
+            current_dataset: name of the active dataset
+            current_column: name of the active column
+            state: {name: state dict} of controllers (arrays, DataFrames and plain values)
+            progress_callback: called with (bytes written, bytes total) after every chunk
+        Return:
+            True on success, False on error
+        """
+        tmp_path = f"{path}.tmp{os.getpid()}"
+        try:
+            writer = _BufferWriter()
+            manifest = {
+                'format': FORMAT_VERSION,
+                'datasets': [self._encode_model(name, model, writer) for name, model in datasets.items()],
+                'current_dataset': current_dataset,
+                'current_column': current_column,
+                'state': _encode_value(state or {}, writer),
+                'fingerprints': writer.fingerprints
+            }
+            with open(tmp_path, 'wb') as file:
+                file.write(MAGIC)
+                manifest['buffers'] = writer.write(file, progress_callback)
+                data = json.dumps(manifest).encode('utf-8')
+                offset = file.tell()
+                file.write(data)
+                file.write(TRAILER.pack(offset, len(data), MAGIC))
+            os.replace(tmp_path, path)
+            return True
+        except (OSError, TypeError, ValueError) as e:
+            print(f"[WorkspaceService] Failed to save workspace {path}: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return False
+
+    def load(self, path: str) -> Optional[Workspace]:
+        """
+        Open a workspace file. Column buffers are memory-mapped read-only, controller
+        state arrays copy-on-write, so no data is read until it is used.
+        Args:
+            path: path of the workspace file
+        Return:
+            Workspace, or None on error
+        """
+        try:
+            manifest = self._read_manifest(path)
+            reader = _BufferReader(path, manifest['buffers'])
+            versions = _VersionMap(manifest.get('fingerprints', {}))
+            datasets = {}
+            for entry in manifest['datasets']:
+                datasets[entry['name']] = self._decode_model(entry, reader, versions)
+            return Workspace(
+                datasets=datasets,
+                current_dataset=manifest.get('current_dataset'),
+                current_column=manifest.get('current_column'),
+                state=_decode_value(manifest.get('state', {}), reader.state_array)
+            )
+        except FileNotFoundError:
+            print(f"File not found: {path}")
+            return None
+        except (OSError, KeyError, TypeError, ValueError) as e:
+            print(f"[WorkspaceService] Failed to load workspace {path}: {e}")
+            return None
+
+    @staticmethod
+    def select_save_path(parent=None) -> Optional[str]:
+        """
+        Open save dialog and let user choose the workspace file.
+        Args:
+            parent: parent Qt widget (optional)
+        Return:
+            path to the file or None if cancelled
+        """
+        from PyQt6.QtWidgets import QFileDialog
+
+        path, _ = QFileDialog.getSaveFileName(
+            parent, 'Save Workspace', '', f'Workspace Files (*{WORKSPACE_EXTENSION});;All Files (*)'
+        )
+        if not path:
+            return None
+        return path if os.path.splitext(path)[1] else path + WORKSPACE_EXTENSION
+
+    @staticmethod
+    def select_open_path(parent=None) -> Optional[str]:
+        """
+        Open file dialog and let user select a workspace file.
+        Args:
+            parent: parent Qt widget (optional)
+        Return:
+            path to the file or None if cancelled
+        """
+        from PyQt6.QtWidgets import QFileDialog
+
+        path, _ = QFileDialog.getOpenFileName(
+            parent, 'Open Workspace', '', f'Workspace Files (*{WORKSPACE_EXTENSION});;All Files (*)'
+        )
+        return path if path else None
+
+    @staticmethod
+    def _read_manifest(path: str) -> dict:
+        with open(path, 'rb') as file:
+            if file.read(len(MAGIC)) != MAGIC:
+                raise ValueError("Not a workspace file")
+            file.seek(-TRAILER.size, os.SEEK_END)
+            offset, length, magic = TRAILER.unpack(file.read(TRAILER.size))
+            if magic != MAGIC:
+                raise ValueError("Workspace file is incomplete")
+            file.seek(offset)
+            manifest = json.loads(file.read(length).decode('utf-8'))
+        if manifest.get('format') != FORMAT_VERSION:
+            raise ValueError(f"Unsupported workspace format: {manifest.get('format')}")
+        return manifest
+
+    @staticmethod
+    def _encode_model(name: str, model: DataModel, writer: '_BufferWriter') -> dict:
+        """
+        Describe a dataset: its original and current data and every version as a delta.
+        Row drops keep their dropped positions, any other version is stored as the columns
+        it does not share with its parent (column transforms are saved with their result).
+        """
+        history = model.history
+        nodes = []
+        for node, parent_store, store in history.walk():
+            if node.parent is None:
+                continue
+            if isinstance(node.delta, RowDropDelta):
+                delta = {
+                    'type': 'rows',
+                    'dropped': writer.add(node.delta.dropped),
+                    'versions': [store.column_version(i) for i in range(store.n_cols)]
+                }
+            else:
+                column_delta = ColumnDelta.between(parent_store, store)
+                delta = {
+                    'type': 'columns',
+                    'names': column_delta.names,
+                    'attrs': _encode_value(column_delta.attrs, writer),
+                    'sources': [src if isinstance(src, int) else writer.add(src, version)
+                                for src, version in zip(column_delta.sources, column_delta.versions)],
+                    'versions': column_delta.versions
+                }
+            nodes.append({'id': node.id, 'parent': node.parent.id, 'label': node.label, 'delta': delta})
+        return {
+            'name': name,
+            'label': model.label,
+            'bins': model.bins,
+            'current_col_idx': model.current_col_idx,
+            'anomalies_removed': model.anomalies_removed,
+            'root_label': history.root.label,
+            'root': _encode_store(history.root_store, writer),
+            'head': history.head.id,
+            'head_store': _encode_store(history.head_store, writer),
+            'nodes': nodes
+        }
+
+    @staticmethod
+    def _decode_model(entry: dict, reader: '_BufferReader', versions: '_VersionMap') -> DataModel:
+        root = _decode_store(entry['root'], reader, versions)
+        head_store = _decode_store(entry['head_store'], reader, versions)
+        nodes = []
+        for node in entry['nodes']:
+            saved = node['delta']
+            if saved['type'] == 'rows':
+                delta = RowDropDelta(reader.column(saved['dropped']['$array']))
+                delta.versions = [versions[v] for v in saved['versions']]
+                if node['id'] == entry['head']:
+                    delta.cached = head_store
+            else:
+                delta = ColumnDelta(
+                    saved['names'],
+                    [src if isinstance(src, int) else reader.column(src['$array']) for src in saved['sources']],
+                    _decode_value(saved['attrs'], reader.state_array),
+                    [None if v is None else versions[v] for v in saved['versions']]
+                )
+            nodes.append((node['id'], node['parent'], node['label'], delta))
+
+        history = VersionHistory.restore(root, nodes, entry['head'], head_store, entry['root_label'])
+        model = DataModel.from_history(history, entry['bins'], entry['current_col_idx'], entry['anomalies_removed'])
+        model.label = entry['label']
+        return model
+
+
+class _BufferWriter:
+    """Collects arrays to write (each distinct buffer once) and streams them to the file."""
+    def __init__(self):
+        self._arrays: list[np.ndarray] = []
+        self._index: dict[tuple, int] = {}
+        self.fingerprints: dict[str, str] = {}
+
+    def add(self, array: np.ndarray, version: Optional[int] = None) -> dict:
+        """Register an array and return its reference for the manifest."""
+        array = np.asarray(array)
+        if array.dtype.hasobject:
+            raise TypeError("Columns with non-numeric values can not be saved to a workspace")
+        if version is not None:
+            fingerprint = known_fingerprint(version)
+            if fingerprint is not None:
+                self.fingerprints[str(version)] = fingerprint
+        key = buffer_key(array) + (array.dtype.str, array.shape)
+        if key not in self._index:
+            self._index[key] = len(self._arrays)
+            self._arrays.append(array)
+        return {'$array': self._index[key]}
+
+    def write(self, file, progress_callback: Optional[Callable[[int, int], None]] = None) -> list[dict]:
+        """Write all arrays, aligned, in chunks of CHUNK_BYTES. Return their descriptions."""
+        total = sum(array.nbytes for array in self._arrays)
+        done = 0
+        buffers = []
+        for array in self._arrays:
+            file.write(b"\0" * (-file.tell() % ALIGNMENT))
+            buffers.append({'offset': file.tell(), 'dtype': array.dtype.str, 'shape': list(array.shape)})
+            flat = array.reshape(-1) if array.ndim == 1 or array.flags.c_contiguous else np.ascontiguousarray(array).reshape(-1)
+            step = max(1, CHUNK_BYTES // max(1, array.itemsize))
+            for start in range(0, len(flat), step):
+                chunk = np.ascontiguousarray(flat[start:start + step])
+                file.write(memoryview(chunk).cast('B'))
+                done += chunk.nbytes
+                if progress_callback:
+                    progress_callback(done, total)
+        return buffers
+
+
+class _BufferReader:
+    """Memory-maps arrays of a workspace file, every buffer once."""
+    def __init__(self, path: str, buffers: list[dict]):
+        self.path = path
+        self.buffers = buffers
+        self._columns: dict[int, np.ndarray] = {}
+
+    def column(self, idx: int) -> np.ndarray:
+        """Read-only mapping of a column buffer; the same object for every reference, so sharing is kept."""
+        if idx not in self._columns:
+            self._columns[idx] = self._map(idx, 'r')
+        return self._columns[idx]
+
+    def state_array(self, idx: int) -> np.ndarray:
+        """Copy-on-write mapping of an array of controller state (writable, the file is never changed)."""
+        return self._map(idx, 'c')
+
+    def _map(self, idx: int, mode: str) -> np.ndarray:
+        info = self.buffers[idx]
+        dtype, shape = np.dtype(info['dtype']), tuple(info['shape'])
+        if int(np.prod(shape)) == 0:
+            return np.empty(shape, dtype=dtype)
+        return np.memmap(self.path, dtype=dtype, mode=mode, offset=info['offset'], shape=shape)
+
+
+class _VersionMap(dict):
+    """
+    Maps column version numbers saved in a workspace to new process-wide ones, so columns
+    equal in the file stay equal (and keep their fingerprints) after loading.
+    """
+    def __init__(self, fingerprints: dict[str, str]):
+        super().__init__()
+        self.fingerprints = fingerprints
+
+    def __missing__(self, saved: int) -> int:
+        version = new_column_version()
+        fingerprint = self.fingerprints.get(str(saved))
+        if fingerprint is not None:
+            remember_fingerprint(version, fingerprint)
+        self[saved] = version
+        return version
+
+
+def _encode_store(store: ColumnStore, writer: _BufferWriter) -> dict:
+    return {
+        'names': store.names,
+        'attrs': _encode_value(store.attrs, writer),
+        'columns': [writer.add(store.column(i), store.column_version(i))['$array'] for i in range(store.n_cols)],
+        'versions': [store.column_version(i) for i in range(store.n_cols)],
+        'dtype': store.dtype.str
+    }
+
+
+def _decode_store(entry: dict, reader: _BufferReader, versions: _VersionMap) -> ColumnStore:
+    return ColumnStore(
+        entry['names'],
+        [reader.column(idx) for idx in entry['columns']],
+        _decode_value(entry['attrs'], reader.state_array),
+        [versions[v] for v in entry['versions']],
+        entry.get('dtype', np.dtype(np.float64).str)
+    )
+
+
+def _encode_value(value: Any, writer: _BufferWriter) -> Any:
+    """
+    Convert state to JSON: arrays become buffer references, DataFrames and Series are
+    stored column by column, numpy scalars become Python numbers.
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return writer.add(value)
+    if isinstance(value, pd.DataFrame):
+        return {'$frame': {
+            'columns': [_encode_value(col, writer) for col in value.columns],
+            'data': [writer.add(value.iloc[:, i].to_numpy()) for i in range(value.shape[1])],
+            'index': None if value.index.equals(pd.RangeIndex(len(value))) else writer.add(value.index.to_numpy()),
+            'length': len(value)
+        }}
+    if isinstance(value, pd.Series):
+        return {'$series': {'name': _encode_value(value.name, writer), 'values': writer.add(value.to_numpy()),
+                            'index': None if value.index.equals(pd.RangeIndex(len(value))) else writer.add(value.index.to_numpy())}}
+    if isinstance(value, (list, tuple)):
+        return [_encode_value(item, writer) for item in value]
+    if isinstance(value, dict):
+        if not all(isinstance(key, str) for key in value):
+            raise TypeError("Only string keys can be saved to a workspace")
+        return {key: _encode_value(item, writer) for key, item in value.items()}
+    raise TypeError(f"Values of type {type(value).__name__} can not be saved to a workspace")
+
+
+def _decode_value(value: Any, read_array: Callable[[int], np.ndarray]) -> Any:
+    """Inverse of _encode_value."""
+    if isinstance(value, list):
+        return [_decode_value(item, read_array) for item in value]
+    if not isinstance(value, dict):
+        return value
+    if '$array' in value:
+        return read_array(value['$array'])
+    if '$frame' in value:
+        frame = value['$frame']
+        index = pd.RangeIndex(frame['length']) if frame['index'] is None else read_array(frame['index']['$array'])
+        df = pd.DataFrame({i: read_array(ref['$array']) for i, ref in enumerate(frame['data'])}, index=index, copy=False)
+        df.columns = pd.Index([_decode_value(col, read_array) for col in frame['columns']])
+        return df
+    if '$series' in value:
+        series = value['$series']
+        values = read_array(series['values']['$array'])
+        index = None if series['index'] is None else read_array(series['index']['$array'])
+        return pd.Series(values, index=index, name=_decode_value(series['name'], read_array), copy=False)
+    return {key: _decode_value(item, read_array) for key, item in value.items()}
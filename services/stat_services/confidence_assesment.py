@@ -1,7 +1,7 @@
 import pandas as pd
 from models.stat_distributions import StatisticalDistribution
 import numpy as np
-from scipy.stats import norm
+from models import critical_values
 
 class ConfidenceAssesment:
     """
@@ -28,7 +28,7 @@ class ConfidenceAssesment:
         x_vals = np.linspace(data.min(), data.max(), 300)
         cdf_vals = dist_obj.cdf(x_vals)
 
-        z = norm.ppf((1 + confidence_level) / 2)
+        z = critical_values.ppf('norm', (1 + confidence_level) / 2)
         variance = dist.get_cdf_variance(x_vals, params, n)
         epsilon = z * np.sqrt(variance)
 
@@ -1,4 +1,5 @@
-from PyQt6.QtWidgets import QMessageBox, QWidget
+from PyQt6.QtWidgets import QMessageBox, QWidget, QProgressDialog
+from PyQt6.QtCore import Qt
 
 class UIMessager:
     def __init__(self, parent: QWidget = None):
@@ -11,4 +12,18 @@ class UIMessager:
         QMessageBox.critical(self.parent, title, message)
 
     def show_warning(self, title: str, message: str):
-        QMessageBox.warning(self.parent, title, message)
\ No newline at end of file
+        QMessageBox.warning(self.parent, title, message)
+
+    def show_progress(self, title: str, message: str, maximum: int, cancellable: bool = False) -> QProgressDialog:
+        """
+        Show a modal progress dialog. Caller updates it with setValue() and closes it when done.
+        If cancellable, the dialog has a Cancel button that emits its canceled signal.
+        """
+        dialog = QProgressDialog(message, "Cancel" if cancellable else None, 0, maximum, self.parent)
+        dialog.setAutoClose(False)
+        dialog.setAutoReset(False)
+        dialog.setWindowTitle(title)
+        dialog.setWindowModality(Qt.WindowModality.WindowModal)
+        dialog.setMinimumDuration(0)
+        dialog.setValue(0)
+        return dialog
@@ -10,7 +10,8 @@ class EDFRenderer(Renderer):
     as a step function and optional interpolated curve.
     """
     @staticmethod
-    def render(ax: plt.Axes, data: pd.Series, bin_edges: list[float] = None, show_edf_curve: bool = False, show_ogiva: bool = False):
+    def render(ax: plt.Axes, data: pd.Series, bin_edges: list[float] = None, show_edf_curve: bool = False, show_ogiva: bool = False,
+               sorted_data: np.ndarray = None):
         """
         Render the EDF on a given Matplotlib axis.
         Args:
@@ -18,8 +19,9 @@ class EDFRenderer(Renderer):
             data: pandas Series or NumPy array of values
             bin_edges: optional array of bin edges for step approximation
             show_edf_curve: whether to show a smoothed EDF curve
+            sorted_data: non-NaN values of data in ascending order, if already available
         """
-        data = np.sort(data.dropna().values)
+        data = np.sort(data.dropna().values) if sorted_data is None else sorted_data
         n = len(data)
 
         if bin_edges is not None:
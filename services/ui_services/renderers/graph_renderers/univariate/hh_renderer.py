@@ -11,7 +11,7 @@ class HHRenderer(Renderer):
     """
     @staticmethod
     def render(ax: plt.Axes, data: pd.Series, dist: StatisticalDistribution, 
-               color: str = None, label: str = None) -> bool:
+               color: str = None, label: str = None, sorted_data: np.ndarray = None) -> bool:
         """
         Plot H-H plot for the given distribution.
         Args:
@@ -20,6 +20,7 @@ class HHRenderer(Renderer):
             dist: StatisticalDistribution instance to fit and render
             color: optional color override
             label: optional label for legend
+            sorted_data: non-NaN values of data in ascending order, if already available
         Return:
             True if rendering was successful, False otherwise
         """
@@ -28,7 +29,8 @@ class HHRenderer(Renderer):
             return False
         try:
             params = dist.fit(data_clean)
-            sorted_data = np.sort(data_clean)
+            if sorted_data is None:
+                sorted_data = np.sort(data_clean)
             n = len(sorted_data)
             
             empirical_probs = (np.arange(1, n + 1) - 0.5) / n
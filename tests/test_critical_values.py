@@ -0,0 +1,18 @@
+import utils  # noqa: F401  (initializes services before models)
+import numpy as np
+from scipy import stats
+from models import critical_values
+
+
+def test_tail_probabilities_match_scipy():
+    assert critical_values.sf('t', 2.1, 30) == stats.t.sf(2.1, 30)
+    assert critical_values.cdf('f', 0.4, 3, 12) == stats.f.cdf(0.4, 3, 12)
+    assert critical_values.sf('chi2', 7.5, 10.0) == critical_values.sf('chi2', 7.5, 10)
+
+
+def test_far_tail_p_value_does_not_round_to_zero():
+    p_value = 2 * critical_values.sf('t', 15.4, 298)
+
+    assert 0 < p_value < 1e-30
+    assert 1 - stats.t.cdf(15.4, 298) == 0
+    np.testing.assert_allclose(p_value, 2 * stats.t.sf(15.4, 298))
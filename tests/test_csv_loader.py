@@ -0,0 +1,28 @@
+import utils  # noqa: F401  (initializes services before models)
+from services.data_services.data_loader.load_strategy import CSVLoader
+
+
+def _write_csv(path, n_cols=12, empty=3):
+    rows = [','.join(f"c{j}" for j in range(n_cols))]
+    rows += [','.join('' if j == empty else str(i * n_cols + j) for j in range(n_cols)) for i in range(20)]
+    path.write_text('\n'.join(rows) + '\n')
+    return str(path)
+
+
+def test_get_columns_matches_loaded_columns(tmp_path):
+    path = _write_csv(tmp_path / 'data.csv')
+
+    names = CSVLoader().get_columns(path)
+
+    assert names == [f"c{j}" for j in range(12)]
+    assert names == [str(name) for name in CSVLoader().load(path).columns]
+
+
+def test_selected_column_is_the_listed_one(tmp_path):
+    path = _write_csv(tmp_path / 'data.csv')
+    position = CSVLoader().get_columns(path).index('c11')
+
+    df = CSVLoader().load(path, columns=[position])
+
+    assert list(df.columns) == ['c11']
+    assert df['c11'].tolist() == [i * 12 + 11 for i in range(20)]
@@ -0,0 +1,79 @@
+import utils  # noqa: F401  (initializes services before models)
+import numpy as np
+import pandas as pd
+from services import DataLoaderService
+from services.data_services.data_loader import data_cache
+from services.data_services.data_loader.numeric_coercion import COERCED_ATTR
+
+
+def test_default_cache_dir_does_not_depend_on_working_directory(tmp_path, monkeypatch):
+    monkeypatch.setattr(data_cache.sys, 'platform', 'linux')
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'xdg'))
+    monkeypatch.chdir(tmp_path)
+    assert data_cache.user_cache_dir() == str(tmp_path / 'xdg' / data_cache.APP_NAME)
+    monkeypatch.delenv('XDG_CACHE_HOME')
+    monkeypatch.setenv('HOME', str(tmp_path / 'home'))
+    assert data_cache.user_cache_dir() == str(tmp_path / 'home' / '.cache' / data_cache.APP_NAME)
+
+
+def _write_dat(path, n_rows=200):
+    path.write_text(''.join(f"{i} nan {i + 0.5} {-i}\n" for i in range(n_rows)))
+    return str(path)
+
+
+def test_put_get_round_trip(tmp_path):
+    cache = data_cache.DataCache(str(tmp_path / 'cache'), min_file_size=0)
+    path = _write_dat(tmp_path / 'data.dat')
+    df = pd.DataFrame({'a': np.arange(5.0), 'b': np.arange(5.0) * 2})
+    df.attrs[COERCED_ATTR] = {'b': 1}
+
+    assert cache.get(path) is None
+    cache.put(path, df)
+    cached = cache.get(path)
+
+    pd.testing.assert_frame_equal(cached, df)
+    assert cached.attrs[COERCED_ATTR] == {'b': 1}
+    assert cache.total_bytes() == 80
+
+
+def test_changed_file_is_a_miss(tmp_path):
+    cache = data_cache.DataCache(str(tmp_path / 'cache'), min_file_size=0)
+    path = _write_dat(tmp_path / 'data.dat')
+    cache.put(path, pd.DataFrame({'a': np.arange(5.0)}))
+
+    _write_dat(tmp_path / 'data.dat', n_rows=201)
+
+    assert cache.get(path) is None
+
+
+def test_least_recently_used_entry_is_evicted(tmp_path):
+    cache = data_cache.DataCache(str(tmp_path / 'cache'), max_bytes=2 * 800, min_file_size=0)
+    paths = [_write_dat(tmp_path / f"data{i}.dat", n_rows=10 + i) for i in range(3)]
+    df = pd.DataFrame({'a': np.arange(100.0)})
+    cache.put(paths[0], df)
+    cache.put(paths[1], df)
+    cache.get(paths[0])
+
+    cache.put(paths[2], df)
+
+    assert cache.get(paths[0]) is not None
+    assert cache.get(paths[1]) is None
+    assert cache.get(paths[2]) is not None
+
+
+def test_projection_of_cached_file_uses_file_positions(tmp_path):
+    service = DataLoaderService(cache=data_cache.DataCache(str(tmp_path / 'cache'), min_file_size=0))
+    path = _write_dat(tmp_path / 'data.dat')
+    full = service.load_data(path)
+    assert full.shape == (200, 3)
+    assert service.cache.get(path) is not None
+
+    projected = service.load_data(path, columns=[2, 3])
+    assert projected.shape == (200, 2)
+    np.testing.assert_array_equal(projected.iloc[:, 0], np.arange(200) + 0.5)
+    np.testing.assert_array_equal(projected.iloc[:, 1], -np.arange(200.0))
+
+    # the all-NaN column 1 is left out, as a projected parse drops it
+    projected = service.load_data(path, columns=[1, 2])
+    assert projected.shape == (200, 1)
+    np.testing.assert_array_equal(projected.iloc[:, 0], np.arange(200) + 0.5)
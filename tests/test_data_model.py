@@ -0,0 +1,56 @@
+import utils  # noqa: F401  (initializes services before models)
+import numpy as np
+import pandas as pd
+import pytest
+from models import DataModel
+
+
+def _model_with_dropped_rows() -> DataModel:
+    df = pd.DataFrame({'a': np.arange(10.0), 'b': np.arange(10.0) * 10})
+    model = DataModel(df)
+    model.apply_transformation(lambda s: s + 100, "Shifted")
+    model.add_version(model.dataframe.drop([0, 3, 5, 9]), "Anomalies removed")
+    return model
+
+
+def test_revert_column_after_row_drop_keeps_remaining_rows():
+    model = _model_with_dropped_rows()
+    assert model.is_current_column_modified()
+
+    model.revert_to_original(whole_dataset=False)
+
+    np.testing.assert_array_equal(model.dataframe['a'].to_numpy(), [1.0, 2.0, 4.0, 6.0, 7.0, 8.0])
+    np.testing.assert_array_equal(model.dataframe['b'].to_numpy(), [10.0, 20.0, 40.0, 60.0, 70.0, 80.0])
+    assert model.label == "Original"
+
+
+def test_revert_whole_dataset_after_row_drop_restores_all_rows():
+    model = _model_with_dropped_rows()
+
+    model.revert_to_original(whole_dataset=True)
+
+    assert len(model.dataframe) == 10
+    assert not model.is_dataset_modified()
+
+
+def test_column_transform_is_recomputed_from_its_parameters_after_eviction():
+    model = DataModel(pd.DataFrame({'a': np.arange(5.0), 'b': np.arange(5.0)}))
+    model.apply_column_transform('shift', {'shift_value': 2.5}, "Shifted")
+    shifted = model.version_id
+    delta = model.history.head.delta
+    assert (delta.transform, delta.params) == ('shift', {'shift_value': 2.5})
+
+    model.checkout(model.history.root.id)
+    delta.evict()
+    model.checkout(shifted)
+
+    np.testing.assert_array_equal(model.dataframe['a'].to_numpy(), np.arange(5.0) + 2.5)
+    np.testing.assert_array_equal(model.dataframe['b'].to_numpy(), np.arange(5.0))
+
+
+def test_unknown_column_transform_is_rejected():
+    model = DataModel(pd.DataFrame({'a': np.arange(5.0)}))
+
+    with pytest.raises(ValueError):
+        model.apply_column_transform('square')
+    assert not model.is_dataset_modified()
@@ -0,0 +1,17 @@
+import utils  # noqa: F401  (initializes services before models)
+from services.data_services.data_loader.format_sniffer import FormatSniffer
+
+
+def test_empty_fields_count_as_columns():
+    options = FormatSniffer.sniff_text("a,b,c,d\n1,,3,4\n5,,7,8\n")
+
+    assert options.delimiter == ','
+    assert options.n_cols == 4
+    assert options.column_names == ['a', 'b', 'c', 'd']
+
+
+def test_whitespace_delimited_columns():
+    options = FormatSniffer.sniff_text("1  2 3\n4 5   6\n")
+
+    assert options.delimiter is None
+    assert options.n_cols == 3
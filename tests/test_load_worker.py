@@ -0,0 +1,39 @@
+import utils  # noqa: F401  (initializes services before models)
+from services import DataLoaderService, DirectoryLoadWorker
+
+
+def _write_files(tmp_path, n_files=3):
+    for i in range(n_files):
+        (tmp_path / f"data{i}.txt").write_text(''.join(f"{j} {j * i}\n" for j in range(10)))
+    (tmp_path / 'empty.txt').write_text('')
+
+
+def test_directory_worker_builds_models_of_all_files(tmp_path):
+    _write_files(tmp_path)
+    worker = DirectoryLoadWorker(DataLoaderService(), str(tmp_path), lambda data: data.shape)
+    results, progress = [], []
+    worker.finished.connect(results.append)
+    worker.progress.connect(progress.append)
+
+    worker.run()
+
+    models, failed = results[0]
+    assert [(path.rsplit('/', 1)[-1], shape) for path, shape in models] == [
+        ('data0.txt', (10, 2)), ('data1.txt', (10, 2)), ('data2.txt', (10, 2))
+    ]
+    assert [path.rsplit('/', 1)[-1] for path in failed] == ['empty.txt']
+    assert progress[-1] == 100
+
+
+def test_cancelled_directory_worker_builds_nothing(tmp_path):
+    _write_files(tmp_path)
+    built, results, cancelled = [], [], []
+    worker = DirectoryLoadWorker(DataLoaderService(), str(tmp_path), built.append)
+    worker.finished.connect(results.append)
+    worker.cancelled.connect(lambda: cancelled.append(True))
+
+    worker.cancel()
+    worker.run()
+
+    assert cancelled == [True]
+    assert not built and not results
@@ -0,0 +1,51 @@
+import utils  # noqa: F401  (initializes services before models)
+import numpy as np
+from services.data_services.data_loader.format_sniffer import FormatSniffer
+from services.data_services.data_loader.load_strategy import TextLoader
+
+
+def test_ragged_lines_in_a_later_chunk_are_not_reshaped_into_wrong_rows(tmp_path, monkeypatch):
+    monkeypatch.setattr(TextLoader, 'CHUNK_SIZE', 64)
+    lines = [f"{i} {i + 0.5}" for i in range(40)]
+    clean = tmp_path / 'clean.txt'
+    clean.write_text('\n'.join(lines) + '\n')
+    # options as sniffed from the head of a large file, which does not reach the ragged lines
+    options = FormatSniffer.sniff(str(clean))
+    lines[30:30] = ['1 2 3', '4']
+    path = tmp_path / 'ragged.txt'
+    path.write_text('\n'.join(lines) + '\n')
+
+    values = TextLoader().load(str(path), options=options).to_numpy()
+
+    assert values.shape == (42, 3)
+    np.testing.assert_array_equal(values[29], [29.0, 29.5, np.nan])
+    np.testing.assert_array_equal(values[30], [1.0, 2.0, 3.0])
+    np.testing.assert_array_equal(values[31], [4.0, np.nan, np.nan])
+    np.testing.assert_array_equal(values[32], [30.0, 30.5, np.nan])
+
+
+def test_empty_delimited_fields_keep_their_column(tmp_path, monkeypatch):
+    monkeypatch.setattr(TextLoader, 'CHUNK_SIZE', 64)
+    lines = [f"{i},{i + 0.5},{-i}" for i in range(20)] + [f"{i},,{-i}" for i in range(20, 40)]
+    path = tmp_path / 'missing.txt'
+    path.write_text('\n'.join(lines) + '\n')
+
+    values = TextLoader().load(str(path)).to_numpy()
+
+    assert values.shape == (40, 3)
+    np.testing.assert_array_equal(values[19], [19.0, 19.5, -19.0])
+    np.testing.assert_array_equal(values[20:, 0], np.arange(20, 40))
+    assert np.isnan(values[20:, 1]).all()
+    np.testing.assert_array_equal(values[20:, 2], -np.arange(20, 40))
+
+
+def test_header_is_kept_when_every_line_misses_a_field(tmp_path):
+    path = tmp_path / 'missing.txt'
+    path.write_text('a,b,c,d\n' + ''.join(f"{i},,{i + 2},{i + 3}\n" for i in range(10)))
+
+    df = TextLoader().load(str(path))
+
+    assert list(df.columns) == ['a', 'b', 'c', 'd']
+    assert TextLoader().get_columns(str(path)) == ['a', 'b', 'c', 'd']
+    assert df['b'].isna().all()
+    assert df['d'].tolist() == [i + 3.0 for i in range(10)]
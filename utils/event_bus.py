@@ -17,6 +17,7 @@ class EventType(Enum):
     BINS_CHANGED = auto()
     CONFIDENCE_CHANGED = auto()
     PRECISION_CHANGED = auto()
+    QUANTILE_ERROR_CHANGED = auto()
     DISTRIBUTION_CHANGED = auto()
     ADDITIONAL_GRAPH_TOGGLED = auto()
     MISSING_VALUES_INFO = auto()
@@ -5,6 +5,7 @@ from controllers import DatasetController
 from services import DataExporter, UIMessager, DataVersionManager
 
 BUTTON_WIDTH, BUTTON_HEIGHT = 111, 30
+MB = 1024 ** 2
 
 
 class DataProcessingTab(QWidget):
@@ -50,6 +51,7 @@ class DataProcessingTab(QWidget):
         """Enable combo boxes when data is loaded"""
         dataset_count = len(self.context.version_manager.get_all_dataset_names())
         self.data_version_combo.setEnabled(dataset_count > 0)
+        self.history_combo.setEnabled(dataset_count > 0)
         
         if self.context.data_model:
             col_count = self.context.data_model.dataframe.shape[1]
@@ -58,11 +60,13 @@ class DataProcessingTab(QWidget):
         self._update_button_state_on_data(self.original_button)
         self._update_button_state_on_data(self.export_button)
         self._update_transformation_label()
+        self._update_memory_label()
 
     def _on_data_changed(self, event: Event) -> None:
         self._update_button_state_on_data(self.original_button)
         self._update_button_state_on_data(self.export_button)
         self._update_transformation_label()
+        self._update_memory_label()
 
     def _init_ui(self) -> None:
         """Initialize UI components."""
@@ -70,7 +74,12 @@ class DataProcessingTab(QWidget):
         self.data_version_combo = self._make_combo(
             on_change=self.dataset_controller.on_dataset_selection_changed
         )
+        self.history_label = self._make_label("Select data version:")
+        self.history_combo = self._make_combo(
+            on_change=self.dataset_controller.on_version_selection_changed
+        )
         self.transformation_label = self._make_label("Current state: Original")
+        self.memory_label = self._make_label("In memory: 0 datasets")
 
         self.current_col_label = self._make_label("Select column to apply operation to:")
         self.dataframe_cols_combo = self._make_combo(
@@ -85,6 +94,8 @@ class DataProcessingTab(QWidget):
         self.export_button = self._make_button(
             "Export Data", callback=self._on_export_data_clicked
         )
+        self.export_format_combo = self._make_combo(enabled=True)
+        self.export_format_combo.addItems(self.exporter.get_formats())
 
     def _on_checkbox_toggled(self) -> None:
         """Update button state when checkbox is toggled"""
@@ -97,6 +108,7 @@ class DataProcessingTab(QWidget):
         nav_layout = QHBoxLayout()
         nav_layout.addWidget(self.original_button)
         nav_layout.addWidget(self.export_button)
+        nav_layout.addWidget(self.export_format_combo)
         nav_layout.addWidget(self.whole_dataset_checkbox)
         nav_layout.addStretch()
 
@@ -104,7 +116,10 @@ class DataProcessingTab(QWidget):
         layout = QVBoxLayout()
         layout.addWidget(self.data_version_label)
         layout.addWidget(self.data_version_combo)
+        layout.addWidget(self.history_label)
+        layout.addWidget(self.history_combo)
         layout.addWidget(self.transformation_label)
+        layout.addWidget(self.memory_label)
         layout.addWidget(self.current_col_label)
         layout.addWidget(self.dataframe_cols_combo)
 
@@ -158,6 +173,18 @@ class DataProcessingTab(QWidget):
         text = self.context.data_model.current_transformation or "Original"
         self.transformation_label.setText(f"Current state: {text}")
 
+    def _update_memory_label(self) -> None:
+        """Updates memory_label with datasets held in RAM and spilled to disk"""
+        status = self.version_manager.get_memory_status()
+        text = (f"In memory: {len(status['resident'])} datasets "
+                f"({status['resident_bytes'] / MB:.1f} of {status['ram_budget'] / MB:.0f} MB)")
+        if status['spilled']:
+            text += f", on disk: {len(status['spilled'])}"
+        self.memory_label.setText(text)
+        self.memory_label.setToolTip(
+            f"In memory: {', '.join(status['resident']) or '-'}\nOn disk: {', '.join(status['spilled']) or '-'}"
+        )
+
     def _on_export_data_clicked(self) -> None:
         """Callback for export button"""
         curr_data = self.context.data_model
@@ -181,7 +208,9 @@ class DataProcessingTab(QWidget):
                 self.messanger.show_error("Export error", "No data to export.")
                 return
 
-            filepath = self.exporter.export(name, export_data, out_dir="data/exported_data")
+            exporter_cls, compression = self.exporter.parse_format(self.export_format_combo.currentText())
+            filepath = self.exporter.export(name, export_data, exporter_cls=exporter_cls,
+                                            out_dir="data/exported_data", compression=compression)
             self.messanger.show_info("Data Export", f"Data exported successfully to:\n{filepath}")
 
         except Exception as e:
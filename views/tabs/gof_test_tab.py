@@ -3,6 +3,7 @@ from models.stat_distributions import StatisticalDistribution
 from models import DataModel
 from views.widgets.gofwidgets.gof_test_panel import BaseTestPanel
 from typing import Callable
+import pandas as pd
 from controllers import GOFController
 from utils import EventBus, EventType, Event, AppContext
 from utils.helpers import create_section_header
@@ -110,14 +111,17 @@ class GOFTestTab(QWidget):
             self._evaluate_multi_tests(model, dist, alpha)
 
     def _evaluate_simple_tests(self, model: DataModel, dist: StatisticalDistribution, alpha: float) -> None:
-        series = model.series.dropna()
+        # one-dimensional tests do not depend on the order of values, so they get the
+        # cached sorted view of the column and do not sort it again
+        series = pd.Series(model.sorted_values, name=model.series.name)
         if series.empty:
             return
         for test in self.test_panels:
             test.evaluate(series, dist, alpha)
 
     def _evaluate_multi_tests(self, model: DataModel, dist: StatisticalDistribution, alpha: float) -> None:
-        df = model.dataframe.dropna()
+        # rows with NaN are dropped by the controller, only if there are any
+        df = model.dataframe
         if df.empty or df.shape[1] < 2:
             return
         for test in self.multi_test_panels:
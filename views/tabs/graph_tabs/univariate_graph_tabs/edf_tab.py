@@ -36,7 +36,8 @@ class EDFTab(BaseGraphTab):
             data_model.series,
             bin_edges=bin_edges,
             show_edf_curve=params["kde"],
-            show_ogiva=params["line"]
+            show_ogiva=params["line"],
+            sorted_data=data_model.sorted_values
         )
 
         # draw theoretical CDF if distribution selected
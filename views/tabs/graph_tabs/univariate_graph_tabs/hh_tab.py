@@ -17,7 +17,8 @@ class HHTab(BaseGraphTab):
         if self.panel is None: return
 
         params = self.panel.get_render_params()
-        series = self.context.data_model.series
+        model = self.context.data_model
+        series = model.series
         dist = params.get("distribution")
 
         if (dist is None) or (series is None) or (series.dropna().empty):
@@ -27,7 +28,8 @@ class HHTab(BaseGraphTab):
             success = renderer.render(
                 self.ax,
                 data=series,
-                dist=dist
+                dist=dist,
+                sorted_data=model.sorted_values
             )
             if success:
                 self.apply_default_style(self.ax, "Theoretical Quantiles", "Empirical Quantiles")
@@ -3,6 +3,7 @@ from PyQt6.QtWidgets import (
     QPushButton, QAbstractItemView, QLabel, QDoubleSpinBox, 
     QGroupBox, QComboBox, QScrollArea, QCheckBox
 )
+import pandas as pd
 from services import UIMessager, DataVersionManager
 from utils import AppContext, EventBus, EventType, Event
 from controllers import HomogenController
@@ -184,15 +185,19 @@ class HomogenTab(QWidget):
             panel = group.panels[idx]
             try:
                 support_multivariate = getattr(panel, "support_multivariate", False)
+                sorted_samples = None
                 if support_multivariate:
                     samples = [datasets[name].dataframe for name in self.selected_models]
                 else:
-                    samples = [datasets[name].series for name in self.selected_models]
+                    samples = [pd.Series(datasets[name].valid_values, name=datasets[name].series.name)
+                               for name in self.selected_models]
+                    sorted_samples = [datasets[name].sorted_values for name in self.selected_models]
                     
                 panel.evaluate(
                     samples=samples,
                     alpha=self.alpha_spinbox.value(),
-                    is_independent=self.independence_checkbox.isChecked()
+                    is_independent=self.independence_checkbox.isChecked(),
+                    sorted_samples=sorted_samples
                 )
                 panel.show()
             except Exception as e:
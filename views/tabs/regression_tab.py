@@ -52,11 +52,19 @@ class RegressionTab(QWidget):
         """Subscribe to event bus events."""
         self.event_bus.subscribe(EventType.MISSING_VALUES_HANDLED, self._on_data_changed)
         self.event_bus.subscribe(EventType.DATASET_CHANGED, self._on_data_changed)
+        self.event_bus.subscribe(EventType.DATA_LOADED, self._on_data_loaded)
 
     def _on_data_changed(self, event: Event) -> None:
         """Handle data changed event."""
         self._refresh_data()
 
+    def _on_data_loaded(self, event: Event) -> None:
+        """Handle data loaded event: show the summary of a model restored with a workspace."""
+        self._refresh_data()
+        if self.controller.current_target is not None:
+            self.prediction_widget.clear()
+            self.summary_widget.create_summary(self.alpha_spinbox.value())
+
     def _init_ui(self) -> None:
         """Initialize and layout all UI components."""
         container = QWidget()
@@ -233,9 +241,9 @@ class RegressionTab(QWidget):
                     f"Missing columns: {', '.join(missing_cols)}")
                 return
             
-            # data preperation
-            X_df = df[x_vars]
-            y_series = df[y_var]
+            # data preperation: frames over the stored column buffers, not copies
+            X_df = data_model.column_frame(x_vars)
+            y_series = data_model.column_frame([y_var]).iloc[:, 0]
             
             # fit model
             self.controller.fit(model_name, X_df, y_series)
@@ -1,4 +1,5 @@
 from .window_widget import WindowWidgets
+from .column_select_dialog import ColumnSelectDialog
 from .dpwidgets import *
 from .gofwidgets import *
 from .statwidgets import *
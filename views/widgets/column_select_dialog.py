@@ -0,0 +1,69 @@
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel,
+    QPushButton, QListWidget, QListWidgetItem, QAbstractItemView
+)
+
+
+class ColumnSelectDialog(QDialog):
+    """
+    Dialog for choosing which columns of a wide file should be loaded.
+    """
+    def __init__(self, columns: list[str], parent=None):
+        """
+        Args:
+            columns: column names found in the file header
+            parent: parent widget
+        """
+        super().__init__(parent)
+        self.setWindowTitle("Select Columns to Load")
+        self.setMinimumWidth(320)
+
+        self._columns = columns
+        self._result: list[int] | None = None
+
+        self._init_ui()
+
+    @property
+    def selected_indices(self) -> list[int] | None:
+        """Positions of the chosen columns, or None if the dialog was cancelled."""
+        return self._result
+
+    @staticmethod
+    def select(columns: list[str], parent=None) -> list[int] | None:
+        """Show the dialog and return positions of the chosen columns or None if cancelled."""
+        dialog = ColumnSelectDialog(columns, parent)
+        dialog.exec()
+        return dialog.selected_indices
+
+    def _init_ui(self) -> None:
+        layout = QVBoxLayout(self)
+        layout.addWidget(QLabel(f"File has {len(self._columns)} columns. Select columns to load:"))
+
+        self._list = QListWidget()
+        self._list.setSelectionMode(QAbstractItemView.SelectionMode.MultiSelection)
+        for col in self._columns:
+            self._list.addItem(QListWidgetItem(col))
+        layout.addWidget(self._list)
+
+        btn_layout = QHBoxLayout()
+
+        select_all_btn = QPushButton("Select All")
+        select_all_btn.clicked.connect(self._list.selectAll)
+        btn_layout.addWidget(select_all_btn)
+
+        load_btn = QPushButton("Load")
+        load_btn.clicked.connect(self._on_load)
+        btn_layout.addWidget(load_btn)
+
+        cancel_btn = QPushButton("Cancel")
+        cancel_btn.clicked.connect(self.reject)
+        btn_layout.addWidget(cancel_btn)
+
+        layout.addLayout(btn_layout)
+
+    def _on_load(self) -> None:
+        indices = sorted(self._list.row(item) for item in self._list.selectedItems())
+        if not indices:
+            return
+        self._result = indices
+        self.accept()
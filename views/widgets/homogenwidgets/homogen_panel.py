@@ -2,6 +2,7 @@ from PyQt6.QtWidgets import QGroupBox, QLabel, QVBoxLayout
 from abc import ABC, abstractmethod
 from utils.decorators import check_samples, check_independent, support_multivariate
 import pandas as pd
+import numpy as np
 from utils.ui_styles import groupStyle, groupMargin
 from PyQt6.QtWidgets import QMessageBox
 
@@ -95,19 +96,22 @@ class BaseHomoTestPanel(QGroupBox, ABC, metaclass=Meta):
     @check_samples
     @check_independent
     @support_multivariate
-    def evaluate(self, samples: list[pd.Series|pd.DataFrame], alpha: float, is_independent: bool) -> None:
+    def evaluate(self, samples: list[pd.Series|pd.DataFrame], alpha: float, is_independent: bool,
+                 sorted_samples: list[np.ndarray] | None = None) -> None:
         """
         Evaluate the test.
         Args:
             samples (list[pd.Series|pd.DataFrame]): List of samples to test.
             alpha (float): Significance level.
             is_independent (bool): True if samples are independent, False if paired.
+            sorted_samples (list[np.ndarray] | None): Cached sorted values of univariate samples.
         """
         result = self.homogen_controller.run_test(
             test_name=self.get_test_name(),
             samples=samples,
             alpha=alpha,
-            is_independent=is_independent
+            is_independent=is_independent,
+            sorted_samples=sorted_samples
         )
         if not result:
             self.clear()
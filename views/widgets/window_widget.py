@@ -1,13 +1,22 @@
-from PyQt6.QtWidgets import QHBoxLayout, QPushButton, QLabel, QSpinBox, QWidget
+from PyQt6.QtWidgets import QHBoxLayout, QPushButton, QLabel, QSpinBox, QComboBox, QWidget
 from typing import NamedTuple
 
 DEFAULT_PRECISION_VAL = 2
 MIN_PRECISION, MAX_PRECISION = 1, 6
 LOAD_BUTTON_WIDTH, LOAD_BUTTON_HEIGHT = 80, 25
+WORKSPACE_BUTTON_WIDTH = 110
+STORAGE_DTYPES = ['float64', 'float32']
+# rank errors allowed for sketched quantiles of large columns, None keeps them exact
+QUANTILE_ERRORS = {'±0.1%': 0.001, '±0.5%': 0.005, '±1%': 0.01, 'exact': None}
 
 class ControlsBar(NamedTuple):
     layout: QHBoxLayout
     load_button: QPushButton
+    load_dir_button: QPushButton
+    save_workspace_button: QPushButton
+    open_workspace_button: QPushButton
+    storage_combo: QComboBox
+    quantile_combo: QComboBox
     precision_spinbox: QSpinBox
 
 
@@ -19,13 +28,34 @@ class WindowWidgets:
     def create_controls_bar() -> ControlsBar:
         """
         Creates the top control bar with:
-        - Load Data button
+        - Load Data and Load Folder buttons
+        - Save Workspace and Open Workspace buttons
+        - Storage dtype of new datasets (loaded or generated)
+        - Quantile accuracy of large columns (rank error as item data)
         - Precision label and spinbox
         Returns:
             ControlsBar: named tuple containing layout and individual widgets
         """
         load_data_button = QPushButton('Load Data')
         load_data_button.setFixedSize(LOAD_BUTTON_WIDTH, LOAD_BUTTON_HEIGHT)
+        load_dir_button = QPushButton('Load Folder')
+        load_dir_button.setFixedSize(LOAD_BUTTON_WIDTH, LOAD_BUTTON_HEIGHT)
+        save_workspace_button = QPushButton('Save Workspace')
+        save_workspace_button.setFixedSize(WORKSPACE_BUTTON_WIDTH, LOAD_BUTTON_HEIGHT)
+        open_workspace_button = QPushButton('Open Workspace')
+        open_workspace_button.setFixedSize(WORKSPACE_BUTTON_WIDTH, LOAD_BUTTON_HEIGHT)
+
+        storage_label = QLabel('Storage:')
+        storage_combo = QComboBox()
+        storage_combo.addItems(STORAGE_DTYPES)
+        storage_combo.setToolTip('Storage type of new datasets: float32 halves memory at single precision')
+
+        quantile_label = QLabel('Quantiles:')
+        quantile_combo = QComboBox()
+        for text, error in QUANTILE_ERRORS.items():
+            quantile_combo.addItem(text, error)
+        quantile_combo.setToolTip('Rank error of median, MAD and anomaly bounds of large or streamed columns, '
+                                  'which come from a quantile sketch instead of sorting')
 
         precision_label = QLabel('Precision:')
         precision_spinbox = QSpinBox()
@@ -34,8 +64,17 @@ class WindowWidgets:
 
         layout = QHBoxLayout()
         layout.addWidget(load_data_button)
+        layout.addWidget(load_dir_button)
+        layout.addWidget(save_workspace_button)
+        layout.addWidget(open_workspace_button)
         layout.addStretch()
+        layout.addWidget(storage_label)
+        layout.addWidget(storage_combo)
+        layout.addWidget(quantile_label)
+        layout.addWidget(quantile_combo)
         layout.addWidget(precision_label)
         layout.addWidget(precision_spinbox)
 
-        return ControlsBar(layout, load_data_button, precision_spinbox)
\ No newline at end of file
+        return ControlsBar(layout, load_data_button, load_dir_button,
+                           save_workspace_button, open_workspace_button, storage_combo, quantile_combo,
+                           precision_spinbox)
\ No newline at end of file